@@ -0,0 +1,7 @@
+# Configuration gunicorn (voir compose/production/django/start)
+from prometheus_client import multiprocess
+
+
+def child_exit(server, worker):
+    # Jauges « livesum » (requêtes en cours) : un worker arrêté ne compte plus
+    multiprocess.mark_process_dead(worker.pid)
@@ -69,6 +69,7 @@ DJANGO_APPS = [
     "django.contrib.staticfiles",
     # "django.contrib.humanize", # Handy template tags
     "django.contrib.admin",
+    "django.contrib.postgres",
     "django.forms",
     
 ]
@@ -137,6 +138,8 @@ AUTH_PASSWORD_VALIDATORS = [
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#middleware
 MIDDLEWARE = [
+    "gestion_taches.tasks.middleware.PrometheusMiddleware",
+    "gestion_taches.tasks.middleware.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
@@ -246,6 +249,14 @@ EMAIL_USE_SSL = env.bool("EMAIL_USE_SSL", default=False)
 EMAIL_HOST_USER = env("EMAIL_HOST_USER", default="")
 EMAIL_HOST_PASSWORD = env("EMAIL_HOST_PASSWORD", default="")
 
+# Outbox des notifications (gestion_taches.tasks.tasks.drain_email_outbox)
+# Nombre d'emails envoyés par connexion SMTP
+EMAIL_OUTBOX_BATCH_SIZE = env.int("EMAIL_OUTBOX_BATCH_SIZE", default=100)
+# Nombre de tentatives avant de marquer un email en échec définitif
+EMAIL_OUTBOX_MAX_ATTEMPTS = env.int("EMAIL_OUTBOX_MAX_ATTEMPTS", default=5)
+# Délai (secondes) avant la première nouvelle tentative, doublé à chaque échec
+EMAIL_OUTBOX_RETRY_DELAY = env.int("EMAIL_OUTBOX_RETRY_DELAY", default=60)
+
 
 # ADMIN
 # ------------------------------------------------------------------------------
@@ -325,6 +336,39 @@ CELERY_WORKER_SEND_TASK_EVENTS = True
 CELERY_TASK_SEND_SENT_EVENT = True
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#worker-hijack-root-logger
 CELERY_WORKER_HIJACK_ROOT_LOGGER = False
+# Nombre de tâches traitées par lot (et par connexion SMTP) lors du balayage des rappels
+REMINDER_BATCH_SIZE = env.int("REMINDER_BATCH_SIZE", default=500)
+# Sorted set Redis des échéances de rappel (vide : index en mémoire du processus)
+REMINDER_INDEX_URL = env("REMINDER_INDEX_URL", default=REDIS_URL)
+# Délai (secondes) avant de retenter un rappel dont l'envoi a échoué
+REMINDER_RETRY_DELAY = env.int("REMINDER_RETRY_DELAY", default=300)
+# Nombre maximal de tâches par requête des opérations groupées (/api/tasks/bulk/)
+TASK_BULK_MAX_ITEMS = env.int("TASK_BULK_MAX_ITEMS", default=1000)
+# Durée (secondes) du cache des réponses de lecture de l'API ; 0 le désactive
+TASK_RESPONSE_CACHE_TIMEOUT = env.int("TASK_RESPONSE_CACHE_TIMEOUT", default=300)
+# Recouvrement (secondes) des jetons de synchronisation, pour les transactions en cours
+TASK_SYNC_OVERLAP_SECONDS = env.int("TASK_SYNC_OVERLAP_SECONDS", default=5)
+# Durée de conservation (jours) des traces de suppression ; au-delà, resynchronisation complète
+TASK_SYNC_TOMBSTONE_RETENTION_DAYS = env.int("TASK_SYNC_TOMBSTONE_RETENTION_DAYS", default=30)
+# Nombre de lignes lues par paquet du curseur serveur lors de l'export (/api/tasks/export/)
+TASK_EXPORT_CHUNK_SIZE = env.int("TASK_EXPORT_CHUNK_SIZE", default=2000)
+# Lignes validées et insérées par lot lors d'un import de fichier (/api/task-imports/)
+TASK_IMPORT_BATCH_SIZE = env.int("TASK_IMPORT_BATCH_SIZE", default=1000)
+# Nombre maximal d'erreurs conservées sur un import
+TASK_IMPORT_MAX_ERRORS = env.int("TASK_IMPORT_MAX_ERRORS", default=100)
+# Répertoire privé des fichiers en cours d'import : hors de MEDIA_ROOT, servi publiquement
+TASK_IMPORT_ROOT = env("TASK_IMPORT_ROOT", default=str(APPS_DIR / "private" / "task_imports"))
+# En-tête Server-Timing (durées SQL, sérialisation, email) ajouté à chaque réponse ;
+# désactivé par défaut en production, où il serait lisible par tous les clients
+SERVER_TIMING_HEADER = env.bool("SERVER_TIMING_HEADER", default=DEBUG)
+# Durée (ms) au-delà de laquelle une requête HTTP est journalisée comme lente ; 0 le désactive
+SLOW_REQUEST_THRESHOLD_MS = env.int("SLOW_REQUEST_THRESHOLD_MS", default=1000)
+# Nombre de requêtes SQL normalisées, les plus fréquentes, citées pour une requête lente
+SLOW_REQUEST_TOP_QUERIES = env.int("SLOW_REQUEST_TOP_QUERIES", default=5)
+# Jeton attendu dans l'en-tête « Authorization: Bearer » de /metrics/ ; vide : /metrics/ n'existe qu'en DEBUG
+METRICS_TOKEN = env("METRICS_TOKEN", default="")
+# Port HTTP des métriques Prometheus de chaque worker Celery ; 0 le désactive
+WORKER_METRICS_PORT = env.int("WORKER_METRICS_PORT", default=9808)
 # django-allauth
 # ------------------------------------------------------------------------------
 ACCOUNT_ALLOW_REGISTRATION = env.bool("DJANGO_ACCOUNT_ALLOW_REGISTRATION", True)
@@ -352,6 +396,16 @@ REST_FRAMEWORK = {
         "rest_framework.authentication.TokenAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
+    # JSON encodé et décodé par orjson (voir gestion_taches/tasks/renderers.py)
+    "DEFAULT_RENDERER_CLASSES": (
+        "gestion_taches.tasks.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "gestion_taches.tasks.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
@@ -7,6 +7,8 @@ from .base import env
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#debug
 DEBUG = True
+# En-tête Server-Timing : base.py l'active selon DJANGO_DEBUG, lu avant ce module
+SERVER_TIMING_HEADER = env.bool("SERVER_TIMING_HEADER", default=True)
 # https://docs.djangoproject.com/en/dev/ref/settings/#secret-key
 SECRET_KEY = env(
     "DJANGO_SECRET_KEY",
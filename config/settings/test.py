@@ -36,3 +36,9 @@ TEMPLATES[0]["OPTIONS"]["debug"] = True  # type: ignore[index]
 MEDIA_URL = "http://media.testserver/"
 # Your stuff...
 # ------------------------------------------------------------------------------
+# Index des rappels en mémoire : pas de Redis pendant les tests
+REMINDER_INDEX_URL = ""
+# Tâches Celery déclenchées après commit exécutées sur place, sans broker
+CELERY_TASK_ALWAYS_EAGER = True
+# Cache des réponses de l'API désactivé, sauf dans ses propres tests
+TASK_RESPONSE_CACHE_TIMEOUT = 0
@@ -2,6 +2,7 @@ from django.urls import path, include
 from django.contrib import admin  # Ajouté pour l'interface admin
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
 from rest_framework.authtoken import views as authtoken_views  # Pour token
+from gestion_taches.tasks.views.metrics_views import metrics_view
 
 # Configuration des URLs principales du projet
 urlpatterns = [
@@ -14,4 +15,5 @@ urlpatterns = [
     
     path('api-auth/', include('rest_framework.urls')),  # Pour session DRF
     path('api-token-auth/', authtoken_views.obtain_auth_token, name='api_token_auth'),
+    path('metrics/', metrics_view, name='metrics'),  # Métriques Prometheus
 ]
\ No newline at end of file
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from gestion_taches.tasks.models import Task, Category
+from gestion_taches.tasks.models import Task, Category, OutboxEmail, TaskImport
 
 # Configuration de l'interface admin pour le modèle Task
 @admin.register(Task)
@@ -14,4 +14,22 @@ class TaskAdmin(admin.ModelAdmin):
 class CategoryAdmin(admin.ModelAdmin):
     list_display = ('name', 'user')
     list_filter = ('user',)
-    search_fields = ('name',)
\ No newline at end of file
+    search_fields = ('name',)
+
+# Configuration de l'interface admin pour l'outbox des emails
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    list_display = ('subject', 'to', 'status', 'attempts', 'next_attempt_at', 'sent_at')
+    list_filter = ('status',)
+    search_fields = ('to', 'subject')
+    ordering = ('-created_at',)
+
+# Configuration de l'interface admin pour le suivi des imports de fichiers
+@admin.register(TaskImport)
+class TaskImportAdmin(admin.ModelAdmin):
+    list_display = ('id', 'user', 'file_format', 'status', 'rows_processed', 'created_count', 'error_count', 'created_at')
+    list_filter = ('status', 'file_format')
+    readonly_fields = ('errors',)
+    # Fichier privé, sans URL : ni affiché ni modifiable
+    exclude = ('file',)
+    ordering = ('-created_at',)
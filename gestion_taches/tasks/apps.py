@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class TasksConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'gestion_taches.tasks'
+
+    def ready(self):
+        import gestion_taches.tasks.metrics  # noqa: F401, PLC0415
+        import gestion_taches.tasks.signals  # noqa: F401, PLC0415
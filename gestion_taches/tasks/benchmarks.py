@@ -0,0 +1,79 @@
+# benchmarks.py - Données et mesures communes aux commandes benchmark_*
+# `sample_rows` génère des lignes en mémoire, sans base de données, pour que les
+# mesures ne portent que sur le code comparé. benchmark_api mesure sur un jeu de
+# données inséré par seeding.py ; `summarize` et `compare` produisent et comparent
+# ses résultats JSON.
+
+import statistics
+import time
+from datetime import timedelta
+
+from django.utils import timezone
+
+from gestion_taches.tasks.models import Task
+
+PRIORITIES = tuple(Task.Priority)
+
+
+def sample_rows(count):
+    """
+    Tuples tels que renvoyés par le curseur, dans l'ordre de `task_rows.sources`
+    (id, user, title, description, due_date, is_completed, priority, category,
+    created_at, updated_at, is_reminded).
+    """
+    now = timezone.now()
+    return [
+        (
+            pk, 1, f"Tâche {pk}", "Description de la tâche " * 4,
+            None if pk % 3 == 0 else now + timedelta(hours=pk),
+            pk % 2 == 0, PRIORITIES[pk % 3], None if pk % 4 == 0 else pk % 50,
+            now - timedelta(minutes=pk), now, pk % 5 == 0,
+        )
+        for pk in range(1, count + 1)
+    ]
+
+
+def summarize(timings, queries):
+    """Résumé JSON d'une série de durées (secondes) : millisecondes et requêtes SQL."""
+    return {
+        "min_ms": round(min(timings) * 1000, 3),
+        "median_ms": round(statistics.median(timings) * 1000, 3),
+        "max_ms": round(max(timings) * 1000, 3),
+        "runs": len(timings),
+        "queries": queries,
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Régressions de `results` par rapport à `baseline` (mêmes tailles et scénarios) :
+    médiane plus lente de plus de `threshold` (0.2 = 20 %) ou requêtes SQL en plus.
+    """
+    regressions = []
+    for size, scenarios in results.items():
+        for name, current in scenarios.items():
+            previous = baseline.get(size, {}).get(name)
+            if previous is None:
+                continue
+            ratio = current["median_ms"] / previous["median_ms"] if previous["median_ms"] else 1.0
+            if ratio > 1 + threshold or current["queries"] > previous["queries"]:
+                regressions.append({
+                    "size": size,
+                    "scenario": name,
+                    "baseline_ms": previous["median_ms"],
+                    "current_ms": current["median_ms"],
+                    "ratio": round(ratio, 2),
+                    "baseline_queries": previous["queries"],
+                    "current_queries": current["queries"],
+                })
+    return regressions
+
+
+def best_time(function, argument, repeat):
+    """Meilleure durée (en secondes) de `function(argument)` sur `repeat` essais."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(argument)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
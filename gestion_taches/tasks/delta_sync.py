@@ -0,0 +1,92 @@
+# delta_sync.py - Synchronisation incrémentale des tâches et catégories
+# Un client envoie le jeton reçu lors de sa dernière synchronisation et ne reçoit
+# que les tâches et catégories créées ou modifiées depuis (index (user, updated_at)),
+# ainsi que les identifiants supprimés, lus dans la table Tombstone. Le volume
+# échangé dépend de ce qui a changé, et non de la taille des données.
+# Le jeton est l'instant de la synchronisation, signé, reculé de
+# TASK_SYNC_OVERLAP_SECONDS : une écriture horodatée avant cet instant mais validée
+# juste après n'est pas perdue, elle est simplement renvoyée une seconde fois.
+
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timedelta
+
+from django.conf import settings
+from django.core import signing
+from django.utils import timezone
+
+from gestion_taches.tasks.models import Category
+from gestion_taches.tasks.models import Task
+from gestion_taches.tasks.models import Tombstone
+
+TOKEN_SALT = 'gestion_taches.tasks.delta_sync'
+
+
+class InvalidToken(Exception):
+    """Jeton de synchronisation illisible ou falsifié."""
+
+
+@dataclass
+class Changes:
+    tasks: object
+    categories: object
+    deleted: dict
+    token: str
+
+
+def make_token(moment):
+    return signing.dumps(moment.isoformat(), salt=TOKEN_SALT, compress=True)
+
+
+def read_token(token):
+    try:
+        return datetime.fromisoformat(signing.loads(token, salt=TOKEN_SALT))
+    except (signing.BadSignature, TypeError, ValueError):
+        raise InvalidToken(token) from None
+
+
+def is_expired(since):
+    """Les suppressions antérieures à la rétention ont pu être purgées."""
+    return since < timezone.now() - timedelta(days=settings.TASK_SYNC_TOMBSTONE_RETENTION_DAYS)
+
+
+def record_deletions(user_id, kind, object_ids):
+    Tombstone.objects.bulk_create(
+        [Tombstone(user_id=user_id, kind=kind, object_id=object_id) for object_id in object_ids]
+    )
+
+
+def changes_since(user, since=None):
+    """
+    Tâches et catégories modifiées depuis `since` (toutes si None), identifiants
+    supprimés depuis `since` et nouveau jeton.
+    """
+    token = make_token(timezone.now() - timedelta(seconds=settings.TASK_SYNC_OVERLAP_SECONDS))
+    categories = Category.objects.filter(user=user).order_by('updated_at', 'id')
+    deleted = {'tasks': [], 'categories': []}
+    if since is not None:
+        categories = categories.filter(updated_at__gte=since)
+        tombstones = (
+            Tombstone.objects.filter(user=user, deleted_at__gte=since)
+            .order_by('deleted_at', 'id')
+            .values_list('kind', 'object_id')
+        )
+        keys = {Tombstone.KIND_TASK: 'tasks', Tombstone.KIND_CATEGORY: 'categories'}
+        for kind, object_id in tombstones:
+            deleted[keys[kind]].append(object_id)
+    return Changes(tasks=changed_tasks(user, since), categories=categories, deleted=deleted, token=token)
+
+
+def changed_tasks(user, since=None):
+    """Tâches modifiées depuis `since` (toutes si None), dans l'ordre de pagination de la synchronisation."""
+    tasks = Task.objects.filter(user=user).order_by('updated_at', 'id')
+    if since is not None:
+        tasks = tasks.filter(updated_at__gte=since)
+    return tasks
+
+
+def purge_tombstones():
+    """Supprime les traces plus anciennes que la durée de rétention."""
+    limit = timezone.now() - timedelta(days=settings.TASK_SYNC_TOMBSTONE_RETENTION_DAYS)
+    deleted, _ = Tombstone.objects.filter(deleted_at__lt=limit).delete()
+    return deleted
@@ -0,0 +1,54 @@
+# export.py - Export des tâches en flux (NDJSON ou CSV)
+# Les tâches sont lues par un curseur serveur PostgreSQL (`QuerySet.iterator`) par
+# paquets de TASK_EXPORT_CHUNK_SIZE lignes `values()`, mises en forme paquet par
+# paquet comme TaskSerializer (voir ValuesRowSerializer), encodées par orjson et
+# envoyées au fil de l'eau par une StreamingHttpResponse : la mémoire du worker ne
+# dépend pas du nombre de tâches et les premiers octets partent avant la fin de la
+# lecture.
+
+import csv
+from itertools import batched
+
+from django.conf import settings
+
+from gestion_taches.tasks.renderers import dumps
+from gestion_taches.tasks.serializers import TaskSerializer
+from gestion_taches.tasks.serializers import task_rows
+
+FORMATS = {
+    'ndjson': ('application/x-ndjson', 'tasks.ndjson'),
+    'csv': ('text/csv; charset=utf-8', 'tasks.csv'),
+}
+
+
+class _LineBuffer:
+    """Pseudo-fichier pour csv.writer : `write` retourne la ligne au lieu de la stocker."""
+
+    def write(self, value):
+        return value
+
+
+def _serialized_rows(queryset):
+    chunk_size = settings.TASK_EXPORT_CHUNK_SIZE
+    rows = queryset.values(*task_rows.sources).iterator(chunk_size=chunk_size)
+    for chunk in batched(rows, chunk_size):
+        yield from task_rows.to_representation(chunk)
+
+
+def stream_ndjson(queryset):
+    for row in _serialized_rows(queryset):
+        yield dumps(row) + b'\n'
+
+
+def stream_csv(queryset):
+    fields = TaskSerializer.Meta.fields
+    writer = csv.writer(_LineBuffer())
+    # L'en-tête part avant la première lecture en base
+    yield writer.writerow(fields)
+    for row in _serialized_rows(queryset):
+        yield writer.writerow(['' if row[field] is None else row[field] for field in fields])
+
+
+def stream(export_format, queryset):
+    generator = stream_csv if export_format == 'csv' else stream_ndjson
+    return generator(queryset)
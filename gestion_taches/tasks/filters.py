@@ -0,0 +1,126 @@
+# filters.py - Backends de filtrage pour l'API des tâches
+
+import re
+
+from django.contrib.postgres.search import SearchQuery
+from django.contrib.postgres.search import SearchRank
+from django.db.models import F
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework import filters
+from rest_framework import serializers
+
+from gestion_taches.tasks.models import Task
+
+SEARCH_CONFIGS = ('french', 'english')
+
+
+class FullTextSearchFilter(filters.SearchFilter):
+    """
+    Recherche plein texte PostgreSQL sur `Task.search_vector` (index GIN).
+    Chaque mot saisi est cherché comme préfixe racinisé (`mot:*`) en français et en
+    anglais ; tous les mots doivent correspondre. Les résultats sont annotés avec
+    `search_rank`, utilisé par la pagination comme tri par défaut.
+    Remplace le `ILIKE '%terme%'` de SearchFilter, qui parcourt toutes les tâches.
+    """
+    vector_field = 'search_vector'
+    rank_annotation = 'search_rank'
+
+    def filter_queryset(self, request, queryset, view):
+        words = [word for term in self.get_search_terms(request) for word in re.findall(r'\w+', term)]
+        if not words:
+            return queryset
+        raw_query = ' & '.join(f'{word}:*' for word in words)
+        query = SearchQuery(raw_query, search_type='raw', config=SEARCH_CONFIGS[0])
+        for config in SEARCH_CONFIGS[1:]:
+            query |= SearchQuery(raw_query, search_type='raw', config=config)
+        return queryset.filter(**{self.vector_field: query}).annotate(
+            **{self.rank_annotation: SearchRank(F(self.vector_field), query)}
+        )
+
+
+class TaskFilterSerializer(serializers.Serializer):
+    """Paramètres de filtrage de la liste des tâches (chaîne de requête)."""
+    is_completed = serializers.BooleanField(required=False, help_text="Tâches terminées (true) ou en attente (false)")
+    is_reminded = serializers.BooleanField(required=False, help_text="Rappel envoyé (true) ou non (false)")
+    overdue = serializers.BooleanField(
+        required=False, help_text="Tâches en attente dont l'échéance est dépassée (true) ou les autres (false)"
+    )
+    priority = serializers.CharField(required=False, help_text="Priorités séparées par des virgules (ex. high,medium)")
+    category = serializers.CharField(
+        required=False, help_text="Identifiants de catégorie séparés par des virgules, `none` pour les tâches sans catégorie"
+    )
+    due_date_after = serializers.DateTimeField(required=False, help_text="Échéance au plus tôt (incluse, ISO 8601)")
+    due_date_before = serializers.DateTimeField(required=False, help_text="Échéance au plus tard (incluse, ISO 8601)")
+    created_at_after = serializers.DateTimeField(required=False, help_text="Créée au plus tôt (incluse, ISO 8601)")
+    created_at_before = serializers.DateTimeField(required=False, help_text="Créée au plus tard (incluse, ISO 8601)")
+
+    def validate_priority(self, value):
+        codes = {code.strip() for code in value.split(',') if code.strip()}
+        unknown = sorted(codes - {priority.code for priority in Task.Priority})
+        if unknown:
+            raise serializers.ValidationError(f"Priorité(s) inconnue(s) : {', '.join(unknown)}.")
+        return sorted(Task.Priority[code.upper()] for code in codes)
+
+    def validate_category(self, value):
+        names = {name.strip() for name in value.split(',') if name.strip()}
+        if not all(name == 'none' or name.isdigit() for name in names):
+            raise serializers.ValidationError("Identifiants de catégorie entiers ou `none` attendus.")
+        return names
+
+
+class TaskFilter(filters.BaseFilterBackend):
+    """
+    Filtres structurés de la liste des tâches : état, rappel, priorités, catégories,
+    intervalles d'échéance et de création, tâches en retard. Les conditions portent
+    sur les colonnes des index composites de Task (user, is_completed, due_date),
+    (user, is_completed, priority, due_date) et (user, created_at, id), et sur l'index de la
+    clé étrangère category. Un paramètre vide est ignoré, une valeur invalide
+    renvoie 400.
+    """
+    serializer_class = TaskFilterSerializer
+    lookups = {
+        'is_completed': 'is_completed',
+        'is_reminded': 'is_reminded',
+        'priority': 'priority__in',
+        'due_date_after': 'due_date__gte',
+        'due_date_before': 'due_date__lte',
+        'created_at_after': 'created_at__gte',
+        'created_at_before': 'created_at__lte',
+    }
+
+    def filter_queryset(self, request, queryset, view):
+        params = self.serializer_class(data={
+            name: value for name, value in request.query_params.items()
+            if name in self.serializer_class._declared_fields and value != ''
+        })
+        params.is_valid(raise_exception=True)
+        data = params.validated_data
+        if not data:
+            return queryset
+        conditions = Q(**{self.lookups[name]: value for name, value in data.items() if name in self.lookups})
+        if 'category' in data:
+            ids = [int(name) for name in data['category'] if name != 'none']
+            categories = Q(category__in=ids) if ids else Q(pk__in=[])
+            if 'none' in data['category']:
+                categories |= Q(category__isnull=True)
+            conditions &= categories
+        queryset = queryset.filter(conditions)
+        if 'overdue' in data:
+            overdue = Q(is_completed=False, due_date__lt=timezone.now())
+            queryset = queryset.filter(overdue) if data['overdue'] else queryset.exclude(overdue)
+        return queryset
+
+    def get_schema_operation_parameters(self, view):
+        types = {serializers.BooleanField: 'boolean', serializers.DateTimeField: 'string'}
+        return [
+            {
+                'name': name,
+                'required': False,
+                'in': 'query',
+                'description': str(field.help_text),
+                'schema': {'type': types.get(type(field), 'string')},
+            }
+            for name, field in self.serializer_class().fields.items()
+        ]
+
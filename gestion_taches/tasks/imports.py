@@ -0,0 +1,161 @@
+# imports.py - Import en arrière-plan de fichiers de tâches (CSV ou NDJSON)
+# Le fichier déposé via /api/task-imports/ est lu en flux par la tâche Celery
+# `import_tasks` : chaque lot de TASK_IMPORT_BATCH_SIZE lignes est validé, ses
+# catégories (désignées par leur nom) sont résolues en une requête et les catégories
+# manquantes créées une seule fois, puis les tâches sont insérées par un bulk_create.
+# La progression et les premières erreurs sont enregistrées sur TaskImport après
+# chaque lot ; un lot validé reste acquis même si un lot suivant échoue.
+
+import csv
+import io
+import json
+import logging
+from itertools import batched
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from gestion_taches.tasks import response_cache
+from gestion_taches.tasks import stats
+from gestion_taches.tasks.models import Category
+from gestion_taches.tasks.models import Task
+from gestion_taches.tasks.models import TaskImport
+from gestion_taches.tasks.serializers import PriorityField
+from gestion_taches.tasks.serializers import TaskSerializer
+from gestion_taches.tasks.signals import after_bulk_write
+
+logger = logging.getLogger(__name__)
+
+EXTENSIONS = {
+    '.csv': TaskImport.FORMAT_CSV,
+    '.ndjson': TaskImport.FORMAT_NDJSON,
+    '.jsonl': TaskImport.FORMAT_NDJSON,
+}
+
+
+class ImportRowSerializer(TaskSerializer):
+    """
+    Ligne d'un fichier d'import : mêmes règles que l'API, mais la catégorie est
+    désignée par son nom et l'état et la priorité ont une valeur par défaut.
+    """
+    title = serializers.CharField(max_length=Task._meta.get_field('title').max_length)
+    description = serializers.CharField(required=False, allow_blank=True)
+    due_date = serializers.DateTimeField(required=False, allow_null=True)
+    is_completed = serializers.BooleanField(default=False)
+    priority = PriorityField(default=Task.Priority.MEDIUM)
+    category = serializers.CharField(max_length=100, required=False, allow_null=True)
+
+    class Meta(TaskSerializer.Meta):
+        fields = ['title', 'description', 'due_date', 'is_completed', 'priority', 'category']
+        read_only_fields = []
+
+
+def detect_format(filename):
+    for extension, file_format in EXTENSIONS.items():
+        if filename.lower().endswith(extension):
+            return file_format
+    return None
+
+
+def _rows(raw, file_format):
+    """Produit (numéro de ligne, dictionnaire ou message d'erreur) en lisant le fichier en flux."""
+    text = io.TextIOWrapper(raw, encoding='utf-8-sig', newline='')
+    try:
+        yield from _csv_rows(text) if file_format == TaskImport.FORMAT_CSV else _ndjson_rows(text)
+    finally:
+        # Ne pas fermer `raw` avec le wrapper : sa position sert à la progression
+        text.detach()
+
+
+def _csv_rows(text):
+    reader = csv.DictReader(text)
+    for row in reader:
+        # Cellule vide = valeur absente (valeur par défaut de la colonne)
+        yield reader.line_num, {key: value for key, value in row.items() if key and value not in ('', None)}
+
+
+def _ndjson_rows(text):
+    for line_number, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield line_number, f'JSON invalide : {e}'
+            continue
+        yield line_number, row if isinstance(row, dict) else 'Un objet JSON est attendu.'
+
+
+def _resolve_categories(user, names, known):
+    """Complète `known` (nom -> id) en créant une seule fois les catégories manquantes."""
+    missing = names - known.keys()
+    if not missing:
+        return
+    existing = Category.objects.filter(user=user, name__in=missing).order_by('id').values_list('name', 'id')
+    for name, category_id in existing:
+        known.setdefault(name, category_id)
+    created = Category.objects.bulk_create(
+        [Category(user=user, name=name) for name in sorted(missing - known.keys())]
+    )
+    known.update({category.name: category.pk for category in created})
+
+
+def _import_batch(task_import, batch, categories):
+    valid, errors = [], []
+    for line_number, row in batch:
+        serializer = ImportRowSerializer(data=row) if isinstance(row, dict) else None
+        if serializer is None or not serializer.is_valid():
+            errors.append({'line': line_number, 'errors': row if serializer is None else serializer.errors})
+            continue
+        data = dict(serializer.validated_data)
+        name = (data.pop('category', None) or '').strip()
+        valid.append((name, data))
+
+    with transaction.atomic():
+        _resolve_categories(task_import.user, {name for name, _data in valid if name}, categories)
+        tasks = Task.objects.bulk_create(
+            [Task(user=task_import.user, category_id=categories.get(name), **data) for name, data in valid]
+        )
+        after_bulk_write(task_import.user_id, saved=tasks, created=True, update_stats=False)
+    return len(tasks), errors
+
+
+def run_import(import_id):
+    task_import = TaskImport.objects.select_related('user').get(pk=import_id)
+    if task_import.status != TaskImport.STATUS_PENDING:
+        # Message Celery livré deux fois : l'import est déjà traité ou en cours
+        return task_import.created_count
+    task_import.status = TaskImport.STATUS_RUNNING
+    task_import.started_at = timezone.now()
+    task_import.save(update_fields=['status', 'started_at'])
+
+    progress_fields = ['bytes_processed', 'rows_processed', 'created_count', 'error_count', 'errors']
+    categories = {}
+    try:
+        with task_import.file.open('rb') as raw:
+            for batch in batched(_rows(raw, task_import.file_format), settings.TASK_IMPORT_BATCH_SIZE):
+                created, errors = _import_batch(task_import, batch, categories)
+                task_import.rows_processed += len(batch)
+                task_import.created_count += created
+                task_import.error_count += len(errors)
+                task_import.errors += errors[:max(0, settings.TASK_IMPORT_MAX_ERRORS - len(task_import.errors))]
+                task_import.bytes_processed = raw.tell()
+                task_import.save(update_fields=progress_fields)
+    except Exception as e:
+        logger.exception("Échec de l'import de tâches %s", import_id)
+        task_import.status = TaskImport.STATUS_FAILED
+        task_import.errors = [*task_import.errors, {'line': None, 'errors': str(e)}]
+    else:
+        task_import.status = TaskImport.STATUS_COMPLETED
+        task_import.bytes_processed = task_import.file_size
+    finally:
+        # Compteurs et catégories créées sans signal : une reconstruction unique
+        stats.rebuild(task_import.user_id)
+        response_cache.invalidate(task_import.user_id)
+        # Le fichier client ne doit pas survivre à son import, réussi ou non
+        task_import.file.storage.delete(task_import.file.name)
+    task_import.finished_at = timezone.now()
+    task_import.save(update_fields=[*progress_fields, 'status', 'finished_at'])
+    return task_import.created_count
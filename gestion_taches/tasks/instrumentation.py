@@ -0,0 +1,102 @@
+# instrumentation.py - Mesures par requête HTTP (SQL, sérialisation, email)
+# RequestMetricsMiddleware ouvre un RequestMetrics pour chaque requête : toutes les
+# requêtes SQL y sont comptées et chronométrées via execute_wrapper, et le code
+# applicatif y ajoute ses propres étapes avec `measure("serialize")`. En dehors d'une
+# requête HTTP (Celery, commandes de gestion), `measure` ne fait rien.
+
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_current = ContextVar('request_metrics', default=None)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'(?<![\w"])-?\d+(?:\.\d+)?\b')
+_PLACEHOLDER = re.compile(r'%s|%\(\w+\)s')
+_VALUE_LIST = re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)')
+_ROW_LIST = re.compile(r'\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+')
+_SPACES = re.compile(r'\s+')
+
+
+def normalize_sql(sql):
+    """
+    Forme canonique d'une requête SQL : littéraux et paramètres remplacés par « ? »,
+    listes IN et lignes VALUES réduites à « (...) », blancs compactés. Deux requêtes
+    qui ne diffèrent que par leurs valeurs (typiquement un N+1) ont la même forme.
+    """
+    sql = _STRING.sub('?', sql)
+    sql = _PLACEHOLDER.sub('?', sql)
+    sql = _NUMBER.sub('?', sql)
+    sql = _VALUE_LIST.sub('(...)', sql)
+    sql = _ROW_LIST.sub('(...)', sql)
+    return _SPACES.sub(' ', sql).strip()
+
+
+class RequestMetrics:
+    """Durées (secondes) et requêtes SQL accumulées pendant une requête HTTP."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.timings = Counter()
+        self.queries = 0
+        # SQL brut -> [nombre d'exécutions, durée cumulée]. La normalisation, coûteuse,
+        # n'a lieu que dans top_statements, c'est-à-dire pour une requête lente.
+        self.statements = {}
+
+    def add(self, name, duration):
+        self.timings[name] += duration
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            self.queries += 1
+            self.timings['db'] += duration
+            stats = self.statements.setdefault(sql, [0, 0.0])
+            stats[0] += 1
+            stats[1] += duration
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def top_statements(self, limit):
+        """Les `limit` formes SQL les plus exécutées, puis les plus coûteuses."""
+        forms = {}
+        for sql, (count, duration) in self.statements.items():
+            stats = forms.setdefault(normalize_sql(sql), [0, 0.0])
+            stats[0] += count
+            stats[1] += duration
+        ranked = sorted(forms.items(), key=lambda item: (-item[1][0], -item[1][1]))
+        return [(sql, count, duration) for sql, (count, duration) in ranked[:limit]]
+
+
+def current():
+    """RequestMetrics de la requête HTTP en cours, ou None."""
+    return _current.get()
+
+
+@contextmanager
+def activate(metrics):
+    token = _current.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def measure(name):
+    """Ajoute la durée du bloc à l'étape `name` de la requête HTTP en cours."""
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.add(name, time.perf_counter() - start)
@@ -0,0 +1,160 @@
+import json
+import platform
+import time
+from datetime import UTC
+from datetime import datetime
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import connection
+from django.db import transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from gestion_taches.tasks import seeding
+from gestion_taches.tasks import tasks
+from gestion_taches.tasks.benchmarks import compare
+from gestion_taches.tasks.benchmarks import summarize
+from gestion_taches.users.models import User
+
+# Scénarios HTTP : nom -> (nom d'URL, paramètres de requête)
+SCENARIOS = {
+    "api.list": ("tasks:task-list", {}),
+    "api.list.ordering": ("tasks:task-list", {"ordering": "-priority"}),
+    "api.list.filter": ("tasks:task-list", {"is_completed": "false", "ordering": "due_date"}),
+    "api.search": ("tasks:task-list", {"search": seeding.WORDS[0]}),
+    "api.search.rare": ("tasks:task-list", {"search": seeding.WORDS[-1]}),
+    "dashboard_home": ("tasks:dashboard", {}),
+    "task_dashboard": ("tasks:task", {}),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Mesure les principaux points d'entrée (API des tâches, tableaux de bord, balayage "
+        "des rappels) sur des jeux de données synthétiques de plusieurs tailles. Les données "
+        "sont insérées dans une transaction annulée à la fin de chaque taille. Les résultats "
+        "sont écrits en JSON et peuvent être comparés à une référence enregistrée."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[1_000, 100_000, 1_000_000],
+            help="Nombres de tâches des jeux de données (défaut : 1000 100000 1000000)",
+        )
+        parser.add_argument("--repeat", type=int, default=5, help="Mesures par scénario, après un essai à vide (défaut : 5)")
+        parser.add_argument("--seed", type=int, default=0, help="Graine du générateur de données (défaut : 0)")
+        parser.add_argument("--output", type=Path, help="Fichier JSON où écrire les résultats")
+        parser.add_argument("--compare", type=Path, dest="baseline", help="Résultats JSON de référence à comparer")
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.2,
+            help="Ralentissement toléré de la médiane avant de signaler une régression (défaut : 0.2, soit 20 %%)",
+        )
+
+    def handle(self, *args, **options):
+        baseline = None
+        if options["baseline"]:
+            baseline = json.loads(options["baseline"].read_text())["results"]
+
+        results = {}
+        # Pas de cache de réponses (chaque mesure refait le travail), pas de journal SQL
+        # de DEBUG, pas de vrai envoi d'email pendant le balayage des rappels
+        with override_settings(
+            ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"],
+            DEBUG=False,
+            EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+            TASK_RESPONSE_CACHE_TIMEOUT=0,
+            SERVER_TIMING_HEADER=False,
+            SLOW_REQUEST_THRESHOLD_MS=0,
+        ):
+            for size in options["sizes"]:
+                results[str(size)] = self.run_size(size, options)
+
+        report = {
+            "meta": {
+                "created_at": datetime.now(UTC).isoformat(),
+                "database": connection.vendor,
+                "python": platform.python_version(),
+                "repeat": options["repeat"],
+                "seed": options["seed"],
+            },
+            "results": results,
+        }
+        if options["output"]:
+            options["output"].write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n")
+            self.stdout.write(f"Résultats écrits dans {options['output']}")
+
+        if baseline is not None:
+            self.report_regressions(compare(results, baseline, options["threshold"]))
+
+    def run_size(self, size, options):
+        with transaction.atomic():
+            self.stdout.write(f"Insertion de {size} tâches...")
+            start = time.perf_counter()
+            owners = seeding.seed(size, seed=options["seed"], prefix=f"bench-{size}")
+            if connection.vendor == "postgresql":
+                with connection.cursor() as cursor:
+                    cursor.execute("ANALYZE tasks_task")
+            self.stdout.write(f"  {time.perf_counter() - start:.1f} s")
+
+            # L'utilisateur le plus actif : le cas le plus coûteux des vues par utilisateur
+            client = Client()
+            client.force_login(User.objects.get(pk=next(iter(owners))))
+            scenarios = {}
+            for name, (url_name, params) in SCENARIOS.items():
+                url = reverse(url_name)
+                scenarios[name] = self.measure(lambda url=url, params=params: self.get(client, url, params), options)
+            scenarios["send_reminder"] = self.measure(self.sweep, options)
+
+            self.stdout.write(f"{'scénario':>20} {'médiane (ms)':>13} {'min (ms)':>10} {'requêtes':>9}")
+            for name, result in scenarios.items():
+                self.stdout.write(
+                    f"{name:>20} {result['median_ms']:>13.1f} {result['min_ms']:>10.1f} {result['queries']:>9}",
+                )
+            transaction.set_rollback(True)
+        return scenarios
+
+    @staticmethod
+    def measure(function, options):
+        function()  # essai à vide : caches, plans de requêtes
+        timings = []
+        for _ in range(options["repeat"]):
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                function()
+                timings.append(time.perf_counter() - start)
+        return summarize(timings, len(queries))
+
+    @staticmethod
+    def get(client, url, params):
+        response = client.get(url, params)
+        if response.status_code != 200:
+            raise CommandError(f"{url} a répondu {response.status_code}")
+        return response
+
+    @staticmethod
+    def sweep():
+        # Chaque balayage repart des mêmes rappels en attente
+        with transaction.atomic():
+            tasks.send_reminder()
+            transaction.set_rollback(True)
+
+    def report_regressions(self, regressions):
+        if not regressions:
+            self.stdout.write(self.style.SUCCESS("Aucune régression par rapport à la référence."))
+            return
+        for regression in regressions:
+            self.stderr.write(self.style.ERROR(
+                "{size} tâches, {scenario} : {baseline_ms:.1f} ms -> {current_ms:.1f} ms (x{ratio}), "
+                "requêtes {baseline_queries} -> {current_queries}".format(**regression),
+            ))
+        raise CommandError(f"{len(regressions)} régression(s) par rapport à la référence.")
@@ -0,0 +1,51 @@
+import io
+
+from django.core.management.base import BaseCommand
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from gestion_taches.tasks.benchmarks import best_time
+from gestion_taches.tasks.benchmarks import sample_rows
+from gestion_taches.tasks.parsers import ORJSONParser
+from gestion_taches.tasks.renderers import ORJSONRenderer
+from gestion_taches.tasks.serializers import task_rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare JSONRenderer / JSONParser de DRF et leurs équivalents orjson sur une "
+        "page de liste de tâches générée en mémoire."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            nargs="+",
+            default=[1_000, 10_000, 100_000],
+            help="Nombres de tâches par page (défaut : 1000 10000 100000)",
+        )
+        parser.add_argument("--repeat", type=int, default=3, help="Meilleur temps sur N essais (défaut : 3)")
+
+    def handle(self, *args, **options):
+        sources = list(task_rows.sources)
+        renderers = (JSONRenderer(), ORJSONRenderer())
+        parsers = (JSONParser(), ORJSONParser())
+
+        self.stdout.write(f"{'lignes':>10} {'étape':>8} {'DRF (ms)':>10} {'orjson (ms)':>12} {'gain':>7}")
+        for count in options["rows"]:
+            results = task_rows.to_representation(dict(zip(sources, values, strict=True)) for values in sample_rows(count))
+            page = {"next": "https://example.com/api/tasks/?cursor=abc", "previous": None, "results": results}
+            body = renderers[0].render(page)
+            if renderers[1].render(page) != body:
+                self.stderr.write(self.style.ERROR("Les deux rendus ne produisent pas les mêmes octets."))
+                return
+            timings = {
+                "rendu": [best_time(renderer.render, page, options["repeat"]) for renderer in renderers],
+                "lecture": [
+                    best_time(lambda data, parser=parser: parser.parse(io.BytesIO(data)), body, options["repeat"])
+                    for parser in parsers
+                ],
+            }
+            for step, (slow, fast) in timings.items():
+                self.stdout.write(f"{count:>10} {step:>8} {slow * 1000:>10.1f} {fast * 1000:>12.1f} {slow / fast:>6.1f}x")
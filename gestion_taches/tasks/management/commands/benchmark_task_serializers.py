@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+
+from gestion_taches.tasks.benchmarks import best_time
+from gestion_taches.tasks.benchmarks import sample_rows
+from gestion_taches.tasks.models import Task
+from gestion_taches.tasks.serializers import TaskSerializer
+from gestion_taches.tasks.serializers import task_rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare le débit de TaskSerializer (instances de modèle) et du chemin de lecture "
+        "à partir de lignes values() sur des listes de tâches générées en mémoire."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            nargs="+",
+            default=[1_000, 10_000, 100_000],
+            help="Nombres de lignes à mesurer (défaut : 1000 10000 100000)",
+        )
+        parser.add_argument("--repeat", type=int, default=3, help="Meilleur temps sur N essais (défaut : 3)")
+
+    def handle(self, *args, **options):
+        sources = list(task_rows.sources)
+        # Model.from_db attend les valeurs dans l'ordre des champs du modèle
+        positions = {Task._meta.get_field(source).attname: index for index, source in enumerate(sources)}
+        attnames = [field.attname for field in Task._meta.concrete_fields if field.attname in positions]
+        order = [positions[attname] for attname in attnames]
+
+        def serializer_path(raw):
+            # Même hydratation que l'ORM : une instance par ligne, puis le serializer
+            tasks = [Task.from_db(DEFAULT_DB_ALIAS, attnames, [values[i] for i in order]) for values in raw]
+            return TaskSerializer(tasks, many=True).data
+
+        def rows_path(raw):
+            # Même forme que QuerySet.values() : un dictionnaire par ligne
+            return task_rows.to_representation([dict(zip(sources, values, strict=True)) for values in raw])
+
+        self.stdout.write(f"{'lignes':>10} {'serializer (l/s)':>18} {'values() (l/s)':>16} {'gain':>7}")
+        for count in options["rows"]:
+            raw = sample_rows(count)
+            if serializer_path(raw[:100]) != rows_path(raw[:100]):
+                self.stderr.write(self.style.ERROR("Les deux chemins ne produisent pas la même représentation."))
+                return
+            slow = best_time(serializer_path, raw, options["repeat"])
+            fast = best_time(rows_path, raw, options["repeat"])
+            self.stdout.write(f"{count:>10} {count / slow:>18,.0f} {count / fast:>16,.0f} {slow / fast:>6.1f}x")
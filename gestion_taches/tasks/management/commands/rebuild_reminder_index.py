@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from gestion_taches.tasks import reminder_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Reconstruit l'index Redis des échéances de rappel depuis la table des tâches. "
+        "À lancer après un déploiement, un vidage de Redis ou un chargement en masse."
+    )
+
+    def handle(self, *args, **options):
+        count = reminder_index.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Index des rappels reconstruit : {count} tâche(s) planifiée(s)."))
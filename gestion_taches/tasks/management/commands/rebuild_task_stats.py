@@ -0,0 +1,28 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from gestion_taches.tasks import stats
+
+
+class Command(BaseCommand):
+    help = "Recalcule entièrement les statistiques des tâches (TaskStats) pour réparer une dérive."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            action="append",
+            dest="usernames",
+            help="Limiter le recalcul à cet utilisateur (option répétable)",
+        )
+
+    def handle(self, *args, **options):
+        users = get_user_model().objects.order_by("pk")
+        if options["usernames"]:
+            users = users.filter(username__in=options["usernames"])
+        count = 0
+        for user_id in users.values_list("pk", flat=True).iterator():
+            with transaction.atomic():
+                stats.rebuild(user_id)
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f"Statistiques recalculées pour {count} utilisateur(s)."))
@@ -0,0 +1,144 @@
+# metrics.py - Métriques Prometheus du web et des workers Celery
+# Web : histogramme de latence par nom d'URL et requêtes en cours, alimentés par
+# PrometheusMiddleware (quelques microsecondes par requête : un observe() et deux
+# opérations sur une jauge, sans accès réseau ni base). Celery : durée et échecs de
+# chaque tâche (dont send_reminder) via les signaux de Celery. Les jauges du retard
+# des rappels sont calculées à la lecture, par une seule requête sur l'index partiel
+# task_pending_reminder_idx.
+#
+# Gunicorn et Celery (prefork) font tourner plusieurs processus : avec la variable
+# d'environnement PROMETHEUS_MULTIPROC_DIR (répertoire partagé et vidé au démarrage),
+# chaque processus écrit ses valeurs dans ce répertoire et l'exposition les agrège.
+# Le web expose /metrics/ ; chaque worker Celery sert les siennes sur
+# WORKER_METRICS_PORT.
+
+import os
+import time
+
+from celery import signals as celery_signals
+from django.conf import settings
+from django.db.models import Count, Min
+from django.utils import timezone
+from prometheus_client import CollectorRegistry
+from prometheus_client import Counter
+from prometheus_client import Gauge
+from prometheus_client import Histogram
+from prometheus_client import REGISTRY
+from prometheus_client import generate_latest
+from prometheus_client import multiprocess
+from prometheus_client import start_http_server
+from prometheus_client.core import GaugeMetricFamily
+
+from gestion_taches.tasks.models import Task
+
+http_request_duration = Histogram(
+    'http_request_duration_seconds',
+    "Durée des requêtes HTTP par nom d'URL",
+    ['view', 'method'],
+)
+http_requests_in_progress = Gauge(
+    'http_requests_in_progress',
+    'Requêtes HTTP en cours de traitement',
+    multiprocess_mode='livesum',
+)
+celery_task_duration = Histogram(
+    'celery_task_duration_seconds',
+    "Durée d'exécution des tâches Celery",
+    ['task', 'state'],
+    buckets=(0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 120, 300, 600, float('inf')),
+)
+celery_task_failures = Counter(
+    'celery_task_failures',
+    'Tâches Celery terminées en erreur',
+    ['task'],
+)
+
+# Vue non résolue (404 avant routage) : une seule série au lieu d'une par chemin
+UNRESOLVED = '<unresolved>'
+
+
+# Séries de l'histogramme HTTP par (vue, méthode) : évite labels() à chaque requête
+_request_series = {}
+
+
+def observe_request(request, duration):
+    match = getattr(request, 'resolver_match', None)
+    key = (match.view_name if match is not None else UNRESOLVED, request.method)
+    series = _request_series.get(key)
+    if series is None:
+        series = _request_series[key] = http_request_duration.labels(*key)
+    series.observe(duration)
+
+
+class ReminderBacklogCollector:
+    """Rappels échus pas encore envoyés, lus en base à chaque collecte."""
+
+    def collect(self):
+        now = timezone.now()
+        backlog = Task.objects.filter(is_completed=False, is_reminded=False, due_date__lte=now).aggregate(
+            count=Count('id'), oldest=Min('due_date'),
+        )
+        yield GaugeMetricFamily(
+            'reminder_backlog_tasks',
+            'Tâches échues, non terminées et pas encore rappelées',
+            value=backlog['count'],
+        )
+        yield GaugeMetricFamily(
+            'reminder_oldest_overdue_seconds',
+            'Retard (secondes) de la plus ancienne tâche échue non rappelée, 0 sans retard',
+            value=(now - backlog['oldest']).total_seconds() if backlog['oldest'] else 0,
+        )
+
+
+# Registre à part : ces jauges viennent de la base, pas des processus, et ne doivent
+# être ni dupliquées par processus ni exposées par les workers
+backlog_registry = CollectorRegistry(auto_describe=False)
+backlog_registry.register(ReminderBacklogCollector())
+
+
+def process_registry():
+    """Registre des métriques de processus, agrégé sur tous les processus en multiprocessus."""
+    if 'PROMETHEUS_MULTIPROC_DIR' not in os.environ:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def export():
+    """Texte au format d'exposition Prometheus des métriques web et du retard des rappels."""
+    return generate_latest(process_registry()) + generate_latest(backlog_registry)
+
+
+# Celery ------------------------------------------------------------------------
+
+_task_started = {}
+
+
+@celery_signals.task_prerun.connect
+def _task_prerun(task_id=None, **kwargs):
+    _task_started[task_id] = time.perf_counter()
+
+
+@celery_signals.task_postrun.connect
+def _task_postrun(task_id=None, task=None, state=None, **kwargs):
+    started = _task_started.pop(task_id, None)
+    if started is not None:
+        celery_task_duration.labels(task.name, state or 'UNKNOWN').observe(time.perf_counter() - started)
+
+
+@celery_signals.task_failure.connect
+def _task_failure(sender=None, **kwargs):
+    celery_task_failures.labels(sender.name).inc()
+
+
+@celery_signals.worker_ready.connect
+def _start_worker_server(**kwargs):
+    if settings.WORKER_METRICS_PORT:
+        start_http_server(settings.WORKER_METRICS_PORT, registry=process_registry())
+
+
+@celery_signals.worker_process_shutdown.connect
+def _mark_process_dead(pid=None, **kwargs):
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        multiprocess.mark_process_dead(pid or os.getpid())
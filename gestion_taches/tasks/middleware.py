@@ -0,0 +1,96 @@
+# middleware.py - Instrumentation des requêtes HTTP
+# Si SERVER_TIMING_HEADER est actif (en DEBUG par défaut), chaque réponse porte un
+# en-tête Server-Timing (durée totale, SQL, sérialisation, envoi d'email) lisible
+# dans l'onglet réseau du navigateur. Les requêtes plus
+# lentes que SLOW_REQUEST_THRESHOLD_MS sont journalisées avec leurs requêtes SQL
+# normalisées les plus fréquentes, ce qui fait ressortir les N+1 en production.
+# PrometheusMiddleware alimente les métriques HTTP exposées sur /metrics/.
+
+import logging
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from gestion_taches.tasks import instrumentation
+from gestion_taches.tasks.metrics import http_requests_in_progress
+from gestion_taches.tasks.metrics import observe_request
+
+logger = logging.getLogger(__name__)
+
+# Étapes mesurées par `instrumentation.measure`, dans l'ordre de l'en-tête
+STEPS = ('serialize', 'email')
+
+
+class RequestMetricsMiddleware:
+    """
+    Mesure chaque requête HTTP. Pour une réponse en flux (export), seule la
+    préparation de la réponse est mesurée, pas l'envoi du corps.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics = instrumentation.RequestMetrics()
+        with instrumentation.activate(metrics), ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(metrics.execute_wrapper))
+            response = self.get_response(request)
+        total = metrics.elapsed()
+
+        if settings.SERVER_TIMING_HEADER:
+            header = self.server_timing(metrics, total)
+            if response.has_header('Server-Timing'):
+                header = f"{response['Server-Timing']}, {header}"
+            response['Server-Timing'] = header
+
+        threshold = settings.SLOW_REQUEST_THRESHOLD_MS
+        if threshold and total * 1000 >= threshold:
+            self.log_slow_request(request, response, metrics, total)
+        return response
+
+    @staticmethod
+    def server_timing(metrics, total):
+        entries = [
+            f'total;dur={total * 1000:.1f}',
+            f'db;dur={metrics.timings["db"] * 1000:.1f};desc="{metrics.queries} SQL"',
+        ]
+        entries += [f'{step};dur={metrics.timings[step] * 1000:.1f}' for step in STEPS if step in metrics.timings]
+        return ', '.join(entries)
+
+    @staticmethod
+    def log_slow_request(request, response, metrics, total):
+        lines = [
+            f'{count:>5} x {duration * 1000:>8.1f} ms  {sql}'
+            for sql, count, duration in metrics.top_statements(settings.SLOW_REQUEST_TOP_QUERIES)
+        ]
+        logger.warning(
+            "Requête lente %s %s (%s) : %.1f ms dont SQL %.1f ms (%d requêtes), sérialisation %.1f ms, email %.1f ms\n%s",
+            request.method,
+            request.get_full_path(),
+            response.status_code,
+            total * 1000,
+            metrics.timings['db'] * 1000,
+            metrics.queries,
+            metrics.timings['serialize'] * 1000,
+            metrics.timings['email'] * 1000,
+            '\n'.join(lines),
+        )
+
+
+class PrometheusMiddleware:
+    """Latence par nom d'URL et nombre de requêtes en cours (voir metrics.py)."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        http_requests_in_progress.inc()
+        start = time.perf_counter()
+        try:
+            return self.get_response(request)
+        finally:
+            observe_request(request, time.perf_counter() - start)
+            http_requests_in_progress.dec()
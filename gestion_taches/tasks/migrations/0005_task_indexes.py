@@ -0,0 +1,39 @@
+# Generated by Django 5.2.6 on 2026-10-17 07:27
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Index des tables existantes construits avec CONCURRENTLY, sans bloquer les
+    # écritures, ce qui exclut une transaction
+    atomic = False
+
+    dependencies = [
+        ('tasks', '0004_task_is_reminded'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='category',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='category_user_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='task_user_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['user', 'is_completed', 'due_date'], name='task_user_status_due_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['user', 'is_completed', 'priority'], name='task_user_status_prio_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(condition=models.Q(('is_completed', False), ('is_reminded', False)), fields=['due_date'], name='task_pending_reminder_idx'),
+        ),
+    ]
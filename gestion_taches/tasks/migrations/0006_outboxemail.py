@@ -0,0 +1,34 @@
+# Generated by Django 5.2.6 on 2026-10-17 07:35
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0005_task_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxEmail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subject', models.CharField(help_text="Sujet de l'email", max_length=255)),
+                ('body', models.TextField(help_text="Contenu de l'email")),
+                ('to', models.EmailField(help_text='Adresse du destinataire', max_length=254)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('sent', 'Sent'), ('failed', 'Failed')], default='pending', help_text="État de l'envoi", max_length=10)),
+                ('attempts', models.PositiveSmallIntegerField(default=0, help_text="Nombre de tentatives d'envoi échouées")),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, help_text="Date à partir de laquelle l'email peut être (re)tenté")),
+                ('last_error', models.TextField(blank=True, help_text="Dernière erreur rencontrée lors de l'envoi")),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Date de mise en file')),
+                ('sent_at', models.DateTimeField(blank=True, help_text="Date d'envoi effectif", null=True)),
+            ],
+            options={
+                'verbose_name': 'Email en attente',
+                'verbose_name_plural': 'Emails en attente',
+                'indexes': [models.Index(condition=models.Q(('status', 'pending')), fields=['next_attempt_at'], name='outbox_pending_idx')],
+            },
+        ),
+    ]
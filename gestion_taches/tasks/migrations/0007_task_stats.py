@@ -0,0 +1,66 @@
+# Generated by Django 5.2.6 on 2026-10-17 07:40
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def populate_open_task_count(apps, schema_editor):
+    """Initialise le compteur des tâches en attente des catégories existantes"""
+    Category = apps.get_model('tasks', 'Category')
+    Task = apps.get_model('tasks', 'Task')
+    open_tasks = (
+        Task.objects.filter(category=models.OuterRef('pk'), is_completed=False)
+        .order_by()
+        .values('category')
+        .annotate(count=models.Count('id'))
+        .values('count')
+    )
+    Category.objects.update(open_task_count=Coalesce(models.Subquery(open_tasks), 0))
+
+
+class Migration(migrations.Migration):
+    # Index des tables existantes construits avec CONCURRENTLY, sans bloquer les
+    # écritures, ce qui exclut une transaction ; la reprise de données garde la sienne
+    atomic = False
+
+    dependencies = [
+        ('tasks', '0006_outboxemail'),
+        ('users', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskStats',
+            fields=[
+                ('user', models.OneToOneField(help_text='Utilisateur concerné', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='task_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('total_tasks', models.IntegerField(default=0, help_text='Nombre total de tâches')),
+                ('completed_tasks', models.IntegerField(default=0, help_text='Nombre de tâches terminées')),
+                ('overdue_tasks', models.IntegerField(default=0, help_text="Tâches en attente dont l'échéance est dépassée")),
+                ('upcoming_tasks', models.IntegerField(default=0, help_text='Tâches en attente à échéance dans les 7 jours')),
+                ('high_priority_tasks', models.IntegerField(default=0, help_text='Tâches en attente de priorité haute')),
+                ('medium_priority_tasks', models.IntegerField(default=0, help_text='Tâches en attente de priorité moyenne')),
+                ('low_priority_tasks', models.IntegerField(default=0, help_text='Tâches en attente de priorité basse')),
+                ('total_categories', models.IntegerField(default=0, help_text='Nombre de catégories')),
+                ('refreshed_at', models.DateTimeField(default=django.utils.timezone.now, help_text='Dernier recalcul complet des compteurs temporels')),
+            ],
+            options={
+                'verbose_name': 'Statistiques des tâches',
+                'verbose_name_plural': 'Statistiques des tâches',
+            },
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='open_task_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Nombre de tâches en attente (maintenu par gestion_taches.tasks.stats)'),
+        ),
+        AddIndexConcurrently(
+            model_name='category',
+            index=models.Index(fields=['user', '-open_task_count'], name='category_user_open_idx'),
+        ),
+        migrations.RunPython(populate_open_task_count, migrations.RunPython.noop, atomic=True),
+    ]
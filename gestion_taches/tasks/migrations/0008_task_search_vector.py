@@ -0,0 +1,33 @@
+# Generated by Django 5.2.6 on 2026-10-17 07:41
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Index des tables existantes construits avec CONCURRENTLY, sans bloquer les
+    # écritures, ce qui exclut une transaction
+    atomic = False
+
+    dependencies = [
+        ('tasks', '0007_task_stats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # Une colonne générée stockée réécrit toute la table sous verrou ACCESS EXCLUSIVE
+        # (lectures et écritures bloquées), durée proportionnelle au nombre de tâches :
+        # à appliquer dans une fenêtre de maintenance sur une grosse base
+        migrations.AddField(
+            model_name='task',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('title', config='french', weight='A'), '||', django.contrib.postgres.search.SearchVector('description', config='french', weight='B'), django.contrib.postgres.search.SearchConfig('french')), '||', django.contrib.postgres.search.SearchVector('title', config='english', weight='A'), django.contrib.postgres.search.SearchConfig('french')), '||', django.contrib.postgres.search.SearchVector('description', config='english', weight='B'), django.contrib.postgres.search.SearchConfig('french')), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        AddIndexConcurrently(
+            model_name='task',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='task_search_vector_idx'),
+        ),
+    ]
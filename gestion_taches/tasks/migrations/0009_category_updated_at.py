@@ -0,0 +1,38 @@
+# Generated by Django 5.2.6 on 2026-10-17 08:55
+
+import django.utils.timezone
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+from django.db.models import F
+
+
+def copy_created_at(apps, schema_editor):
+    # Les catégories existantes n'ont jamais été modifiées depuis leur création connue
+    Category = apps.get_model('tasks', 'Category')
+    Category.objects.update(updated_at=F('created_at'))
+
+
+class Migration(migrations.Migration):
+    # Index des tables existantes construits avec CONCURRENTLY, sans bloquer les
+    # écritures, ce qui exclut une transaction ; la reprise de données garde la sienne
+    atomic = False
+
+    dependencies = [
+        ('tasks', '0008_task_search_vector'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, help_text='Date de dernière mise à jour de la catégorie'),
+            preserve_default=False,
+        ),
+        migrations.RunPython(copy_created_at, migrations.RunPython.noop, atomic=True),
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['user', 'updated_at'], name='task_user_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.6 on 2026-10-17 07:50
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Index des tables existantes construits avec CONCURRENTLY, sans bloquer les
+    # écritures, ce qui exclut une transaction
+    atomic = False
+
+    dependencies = [
+        ('tasks', '0009_category_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('task', 'Task'), ('category', 'Category')], help_text="Type de l'objet supprimé", max_length=10)),
+                ('object_id', models.BigIntegerField(help_text="Identifiant de l'objet supprimé")),
+                ('deleted_at', models.DateTimeField(default=django.utils.timezone.now, help_text='Date de suppression')),
+            ],
+            options={
+                'verbose_name': 'Suppression',
+                'verbose_name_plural': 'Suppressions',
+            },
+        ),
+        AddIndexConcurrently(
+            model_name='category',
+            index=models.Index(fields=['user', 'updated_at'], name='category_user_updated_idx'),
+        ),
+        migrations.AddField(
+            model_name='tombstone',
+            name='user',
+            field=models.ForeignKey(help_text="Propriétaire de l'objet supprimé", on_delete=django.db.models.deletion.CASCADE, related_name='tombstones', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='tombstone',
+            index=models.Index(fields=['user', 'deleted_at'], name='tombstone_user_deleted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tombstone',
+            index=models.Index(fields=['deleted_at'], name='tombstone_deleted_idx'),
+        ),
+    ]
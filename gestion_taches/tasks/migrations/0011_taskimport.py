@@ -0,0 +1,40 @@
+# Generated by Django 5.2.6 on 2026-10-17 07:54
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0010_tombstone'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskImport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('file', models.FileField(help_text='Fichier importé', upload_to='task_imports/%Y/%m/')),
+                ('file_format', models.CharField(choices=[('csv', 'CSV'), ('ndjson', 'NDJSON')], help_text='Format du fichier', max_length=10)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', help_text="État de l'import", max_length=10)),
+                ('file_size', models.PositiveBigIntegerField(default=0, help_text='Taille du fichier en octets')),
+                ('bytes_processed', models.PositiveBigIntegerField(default=0, help_text='Octets du fichier déjà traités')),
+                ('rows_processed', models.PositiveIntegerField(default=0, help_text='Nombre de lignes lues')),
+                ('created_count', models.PositiveIntegerField(default=0, help_text='Nombre de tâches créées')),
+                ('error_count', models.PositiveIntegerField(default=0, help_text='Nombre de lignes rejetées')),
+                ('errors', models.JSONField(blank=True, default=list, help_text='Premières erreurs : [{"line": n, "errors": {...}}]')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Date de dépôt du fichier')),
+                ('started_at', models.DateTimeField(blank=True, help_text='Début du traitement', null=True)),
+                ('finished_at', models.DateTimeField(blank=True, help_text='Fin du traitement', null=True)),
+                ('user', models.ForeignKey(help_text='Utilisateur à qui les tâches importées sont attribuées', on_delete=django.db.models.deletion.CASCADE, related_name='task_imports', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Import de tâches',
+                'verbose_name_plural': 'Imports de tâches',
+                'indexes': [models.Index(fields=['user', '-created_at', '-id'], name='taskimport_user_created_idx')],
+            },
+        ),
+    ]
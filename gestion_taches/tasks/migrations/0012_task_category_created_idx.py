@@ -0,0 +1,30 @@
+# Generated by Django 5.2.6 on 2026-10-17 08:10
+
+import django.db.models.deletion
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Index des tables existantes construits avec CONCURRENTLY, sans bloquer les
+    # écritures, ce qui exclut une transaction
+    atomic = False
+
+    dependencies = [
+        ('tasks', '0011_taskimport'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # Le nouvel index est créé avant la suppression de l'index de la clé étrangère
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['category', '-created_at', '-id'], name='task_category_created_idx'),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='category',
+            field=models.ForeignKey(blank=True, db_index=False, help_text='Catégorie de la tâche (optionnel)', null=True, on_delete=django.db.models.deletion.SET_NULL, to='tasks.category'),
+        ),
+    ]
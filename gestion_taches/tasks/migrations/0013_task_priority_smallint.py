@@ -0,0 +1,62 @@
+# Generated by Django 5.2.6 on 2026-10-17 08:12
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+from django.db.models import Case, Value, When
+
+LEVELS = {'low': 1, 'medium': 2, 'high': 3}
+
+
+def labels_to_levels(apps, schema_editor):
+    # Une seule requête UPDATE ; une valeur inattendue devient la priorité par défaut
+    Task = apps.get_model('tasks', 'Task')
+    Task.objects.update(priority=Case(
+        *[When(priority_label=label, then=Value(level)) for label, level in LEVELS.items()],
+        default=Value(LEVELS['medium']),
+    ))
+
+
+def levels_to_labels(apps, schema_editor):
+    Task = apps.get_model('tasks', 'Task')
+    Task.objects.update(priority_label=Case(
+        *[When(priority=level, then=Value(label)) for label, level in LEVELS.items()],
+        default=Value('medium'),
+    ))
+
+
+class Migration(migrations.Migration):
+    # Index des tables existantes construits avec CONCURRENTLY, sans bloquer les
+    # écritures, ce qui exclut une transaction ; la reprise de données garde la sienne
+    atomic = False
+
+    dependencies = [
+        ('tasks', '0012_task_category_created_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name='task',
+            name='task_user_status_prio_idx',
+        ),
+        migrations.RenameField(
+            model_name='task',
+            old_name='priority',
+            new_name='priority_label',
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='priority',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'Low'), (2, 'Medium'), (3, 'High')], default=2, help_text='Priorité de la tâche (1 faible, 2 moyenne, 3 haute)'),
+        ),
+        migrations.RunPython(labels_to_levels, levels_to_labels, atomic=True),
+        migrations.RemoveField(
+            model_name='task',
+            name='priority_label',
+        ),
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['user', 'is_completed', '-priority', 'due_date'], name='task_user_status_prio_due_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.6 on 2026-10-17 09:16
+
+import gestion_taches.tasks.models
+from django.core.files.storage import default_storage
+from django.db import migrations, models
+
+
+def move_out_of_media(apps, schema_editor):
+    # Les fichiers déjà déposés sont sous MEDIA_ROOT, publics et sous leur nom
+    # d'origine : ceux des imports terminés sont supprimés, les autres déplacés
+    # dans le stockage privé sous un nom aléatoire.
+    TaskImport = apps.get_model('tasks', 'TaskImport')
+    private = gestion_taches.tasks.models.TaskImportStorage()
+    finished = ['completed', 'failed']
+    for task_import in TaskImport.objects.exclude(file='').iterator():
+        old_name = task_import.file.name
+        if not default_storage.exists(old_name):
+            continue
+        if task_import.status not in finished:
+            with default_storage.open(old_name, 'rb') as content:
+                task_import.file.name = private.save(
+                    gestion_taches.tasks.models.task_import_path(task_import, old_name), content,
+                )
+            task_import.save(update_fields=['file'])
+        default_storage.delete(old_name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0013_task_priority_smallint'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='taskimport',
+            name='file',
+            field=models.FileField(help_text='Fichier importé, supprimé à la fin du traitement', storage=gestion_taches.tasks.models.TaskImportStorage, upload_to=gestion_taches.tasks.models.task_import_path),
+        ),
+        migrations.RunPython(move_out_of_media, migrations.RunPython.noop),
+    ]
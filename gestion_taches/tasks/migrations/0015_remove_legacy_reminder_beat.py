@@ -0,0 +1,30 @@
+# Generated by Django 5.2.6 on 2026-10-17 09:40
+
+from django.db import migrations
+from django.utils import timezone
+
+# Ancien balayage des rappels toutes les 5 minutes, remplacé par le répartiteur
+# `dispatch-due-reminders` et le balayage de secours `check-reminders-hourly`.
+LEGACY_NAME = 'check-reminders-every-5-minutes'
+
+
+def delete_legacy_beat(apps, schema_editor):
+    # DatabaseScheduler crée les tâches de CELERY_BEAT_SCHEDULE mais ne supprime jamais
+    # celles qui en ont disparu : sans cela, l'ancien balayage continuerait de tourner.
+    PeriodicTask = apps.get_model('django_celery_beat', 'PeriodicTask')
+    PeriodicTasks = apps.get_model('django_celery_beat', 'PeriodicTasks')
+    if PeriodicTask.objects.filter(name=LEGACY_NAME).delete()[0]:
+        # Signale la modification aux beat en cours d'exécution
+        PeriodicTasks.objects.update_or_create(ident=1, defaults={'last_update': timezone.now()})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0014_taskimport_private_file'),
+        ('django_celery_beat', '0019_alter_periodictasks_options'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_legacy_beat, migrations.RunPython.noop),
+    ]
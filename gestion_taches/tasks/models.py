@@ -1,7 +1,14 @@
 
 
+import os
+import uuid
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.utils import timezone
 
 class Category(models.Model):
     """
@@ -26,6 +33,15 @@ class Category(models.Model):
         auto_now_add=True,
         help_text="Date de création de la catégorie"
     )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="Date de dernière mise à jour de la catégorie"
+    )
+    open_task_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Nombre de tâches en attente (maintenu par gestion_taches.tasks.stats)"
+    )
 
     def __str__(self):
         return self.name
@@ -33,6 +49,20 @@ class Category(models.Model):
     class Meta:
         verbose_name = "Catégorie"
         verbose_name_plural = "Catégories"
+        indexes = [
+            # Liste paginée des catégories d'un utilisateur
+            models.Index(fields=['user', '-created_at', '-id'], name='category_user_created_idx'),
+            # Top des catégories du tableau de bord
+            models.Index(fields=['user', '-open_task_count'], name='category_user_open_idx'),
+            # Synchronisation incrémentale (catégories modifiées depuis un jeton)
+            models.Index(fields=['user', 'updated_at'], name='category_user_updated_idx'),
+        ]
+
+class TaskManager(models.Manager):
+    def get_queryset(self):
+        # Le vecteur de recherche ne sert qu'au filtrage : inutile de le charger
+        return super().get_queryset().defer('search_vector')
+
 
 class Task(models.Model):
     """
@@ -41,6 +71,20 @@ class Task(models.Model):
     Elle inclut des attributs comme le titre, la description, la date d'échéance,
     la priorité et l'état (terminée ou non).
     """
+
+    class Priority(models.IntegerChoices):
+        """
+        Priorité stockée en entier, pour trier de la plus urgente à la moins urgente
+        et l'indexer ; l'API et les tableaux de bord l'exposent par son `code`.
+        """
+        LOW = 1, 'Low'
+        MEDIUM = 2, 'Medium'
+        HIGH = 3, 'High'
+
+        @property
+        def code(self):
+            return self.name.lower()
+
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -68,17 +112,18 @@ class Task(models.Model):
         default=False,
         help_text="Indique si un rappel email a été envoyé"
     )
-    priority = models.CharField(
-        max_length=20,
-        choices=[('low', 'Low'), ('medium', 'Medium'), ('high', 'High')],
-        default='medium',
-        help_text="Priorité de la tâche (faible, moyenne, haute)"
+    priority = models.PositiveSmallIntegerField(
+        choices=Priority.choices,
+        default=Priority.MEDIUM,
+        help_text="Priorité de la tâche (1 faible, 2 moyenne, 3 haute)"
     )
     category = models.ForeignKey(
         'Category',
         on_delete=models.SET_NULL,
         null=True,
         blank=True,
+        # Remplacé par task_category_created_idx, qui commence par category
+        db_index=False,
         help_text="Catégorie de la tâche (optionnel)"
     )
     created_at = models.DateTimeField(
@@ -89,17 +134,344 @@ class Task(models.Model):
         auto_now=True,
         help_text="Date de dernière mise à jour"
     )
+    # Vecteur de recherche plein texte, calculé par PostgreSQL (colonne générée).
+    # Titre (poids A) et description (poids B) sont racinisés en français et en
+    # anglais ; voir FullTextSearchFilter dans filters.py.
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('title', weight='A', config='french')
+            + SearchVector('description', weight='B', config='french')
+            + SearchVector('title', weight='A', config='english')
+            + SearchVector('description', weight='B', config='english')
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = TaskManager()
 
     def __str__(self):
         return self.title
 
+    @property
+    def priority_code(self):
+        """Code de la priorité ('low', 'medium', 'high') utilisé par l'API et les templates."""
+        return self.Priority(self.priority).code
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Instantané de l'état chargé, utilisé pour calculer les deltas de TaskStats
+        instance._stats_state = instance.stats_state()
+        return instance
+
+    def stats_state(self):
+        """
+        Champs de la tâche qui contribuent aux statistiques (voir stats.py).
+        Retourne None si l'un d'eux n'a pas été chargé (queryset avec .only()).
+        """
+        loaded = self.__dict__
+        if not all(name in loaded for name in ('user_id', 'is_completed', 'priority', 'category_id', 'due_date')):
+            return None
+        return {
+            'user_id': self.user_id,
+            'is_completed': self.is_completed,
+            'priority': self.priority,
+            'category_id': self.category_id,
+            'due_date': self.due_date,
+        }
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = "Tâche"
         verbose_name_plural = "Tâches"
-        
+        indexes = [
+            # Liste paginée par défaut (curseur sur created_at, id)
+            models.Index(fields=['user', '-created_at', '-id'], name='task_user_created_idx'),
+            # Tâches en retard / à venir du tableau de bord
+            models.Index(fields=['user', 'is_completed', 'due_date'], name='task_user_status_due_idx'),
+            # Tâches en attente de la plus urgente à la moins urgente, puis par échéance ;
+            # sert aussi les compteurs par priorité
+            models.Index(fields=['user', 'is_completed', '-priority', 'due_date'], name='task_user_status_prio_due_idx'),
+            # Validateur ETag des listes et synchronisation incrémentale
+            models.Index(fields=['user', 'updated_at'], name='task_user_updated_idx'),
+            # Filtre ?category= paginé, et SET NULL à la suppression d'une catégorie
+            models.Index(fields=['category', '-created_at', '-id'], name='task_category_created_idx'),
+            # Balayage des rappels : ne contient que les tâches encore à rappeler
+            models.Index(
+                fields=['due_date'],
+                condition=models.Q(is_completed=False, is_reminded=False),
+                name='task_pending_reminder_idx',
+            ),
+            # Recherche plein texte
+            GinIndex(fields=['search_vector'], name='task_search_vector_idx'),
+        ]
+
+class TaskStats(models.Model):
+    """
+    Statistiques des tâches d'un utilisateur, affichées par le tableau de bord.
+    Mises à jour par deltas atomiques (F()) à chaque écriture sur une tâche ; les
+    compteurs temporels (retard, 7 prochains jours) sont recalculés périodiquement
+    par la tâche Celery `refresh_task_stats`. Voir gestion_taches/tasks/stats.py.
+    """
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='task_stats',
+        help_text="Utilisateur concerné"
+    )
+    total_tasks = models.IntegerField(default=0, help_text="Nombre total de tâches")
+    completed_tasks = models.IntegerField(default=0, help_text="Nombre de tâches terminées")
+    overdue_tasks = models.IntegerField(default=0, help_text="Tâches en attente dont l'échéance est dépassée")
+    upcoming_tasks = models.IntegerField(default=0, help_text="Tâches en attente à échéance dans les 7 jours")
+    high_priority_tasks = models.IntegerField(default=0, help_text="Tâches en attente de priorité haute")
+    medium_priority_tasks = models.IntegerField(default=0, help_text="Tâches en attente de priorité moyenne")
+    low_priority_tasks = models.IntegerField(default=0, help_text="Tâches en attente de priorité basse")
+    total_categories = models.IntegerField(default=0, help_text="Nombre de catégories")
+    refreshed_at = models.DateTimeField(
+        default=timezone.now,
+        help_text="Dernier recalcul complet des compteurs temporels"
+    )
+
+    def __str__(self):
+        return f"Statistiques de {self.user}"
+
+    class Meta:
+        verbose_name = "Statistiques des tâches"
+        verbose_name_plural = "Statistiques des tâches"
+
+class OutboxEmail(models.Model):
+    """
+    Email en attente d'envoi (pattern "transactional outbox").
+    Les vues écrivent une ligne dans la même transaction que la modification de la
+    tâche ; la tâche Celery `drain_email_outbox` les envoie ensuite par lots sur
+    une seule connexion SMTP, avec nouvelles tentatives espacées en cas d'échec.
+    """
+    STATUS_PENDING = 'pending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+
+    subject = models.CharField(
+        max_length=255,
+        help_text="Sujet de l'email"
+    )
+    body = models.TextField(
+        help_text="Contenu de l'email"
+    )
+    to = models.EmailField(
+        help_text="Adresse du destinataire"
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=[(STATUS_PENDING, 'Pending'), (STATUS_SENT, 'Sent'), (STATUS_FAILED, 'Failed')],
+        default=STATUS_PENDING,
+        help_text="État de l'envoi"
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        help_text="Nombre de tentatives d'envoi échouées"
+    )
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now,
+        help_text="Date à partir de laquelle l'email peut être (re)tenté"
+    )
+    last_error = models.TextField(
+        blank=True,
+        help_text="Dernière erreur rencontrée lors de l'envoi"
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        help_text="Date de mise en file"
+    )
+    sent_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Date d'envoi effectif"
+    )
+
+    def __str__(self):
+        return f"{self.subject} -> {self.to}"
+
+    class Meta:
+        verbose_name = "Email en attente"
+        verbose_name_plural = "Emails en attente"
+        indexes = [
+            models.Index(
+                fields=['next_attempt_at'],
+                condition=models.Q(status='pending'),
+                name='outbox_pending_idx',
+            ),
+        ]
+
+class Tombstone(models.Model):
+    """
+    Trace de la suppression d'une tâche ou d'une catégorie, pour que la
+    synchronisation incrémentale (/api/tasks/sync/) puisse signaler les objets
+    supprimés depuis le dernier jeton d'un client. Purgée après
+    TASK_SYNC_TOMBSTONE_RETENTION_DAYS jours.
+    """
+    KIND_TASK = 'task'
+    KIND_CATEGORY = 'category'
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='tombstones',
+        help_text="Propriétaire de l'objet supprimé"
+    )
+    kind = models.CharField(
+        max_length=10,
+        choices=[(KIND_TASK, 'Task'), (KIND_CATEGORY, 'Category')],
+        help_text="Type de l'objet supprimé"
+    )
+    object_id = models.BigIntegerField(
+        help_text="Identifiant de l'objet supprimé"
+    )
+    deleted_at = models.DateTimeField(
+        default=timezone.now,
+        help_text="Date de suppression"
+    )
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id} supprimé le {self.deleted_at}"
+
+    class Meta:
+        verbose_name = "Suppression"
+        verbose_name_plural = "Suppressions"
+        indexes = [
+            models.Index(fields=['user', 'deleted_at'], name='tombstone_user_deleted_idx'),
+            # Purge des suppressions anciennes
+            models.Index(fields=['deleted_at'], name='tombstone_deleted_idx'),
+        ]
+
+class TaskImportStorage(FileSystemStorage):
+    """
+    Stockage privé des fichiers importés, sous TASK_IMPORT_ROOT : hors de
+    MEDIA_ROOT, que nginx sert publiquement, et sans URL.
+    """
+
+    @property
+    def base_location(self):
+        return settings.TASK_IMPORT_ROOT
+
+    @property
+    def location(self):
+        return os.path.abspath(self.base_location)
+
+    @property
+    def base_url(self):
+        return None
+
+
+def task_import_path(instance, filename):
+    """Nom aléatoire : le nom d'origine du fichier client n'est pas repris sur le disque."""
+    return f"{timezone.now():%Y/%m}/{uuid.uuid4().hex}{os.path.splitext(filename)[1].lower()}"
+
+
+class TaskImport(models.Model):
+    """
+    Import en arrière-plan d'un fichier de tâches (CSV ou NDJSON).
+    Le fichier est traité par la tâche Celery `import_tasks` puis supprimé ; la ligne
+    sert de suivi de progression et conserve les premières erreurs rencontrées.
+    """
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_COMPLETED = 'completed'
+    STATUS_FAILED = 'failed'
+    FORMAT_CSV = 'csv'
+    FORMAT_NDJSON = 'ndjson'
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='task_imports',
+        help_text="Utilisateur à qui les tâches importées sont attribuées"
+    )
+    file = models.FileField(
+        upload_to=task_import_path,
+        storage=TaskImportStorage,
+        help_text="Fichier importé, supprimé à la fin du traitement"
+    )
+    file_format = models.CharField(
+        max_length=10,
+        choices=[(FORMAT_CSV, 'CSV'), (FORMAT_NDJSON, 'NDJSON')],
+        help_text="Format du fichier"
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=[
+            (STATUS_PENDING, 'Pending'),
+            (STATUS_RUNNING, 'Running'),
+            (STATUS_COMPLETED, 'Completed'),
+            (STATUS_FAILED, 'Failed'),
+        ],
+        default=STATUS_PENDING,
+        help_text="État de l'import"
+    )
+    file_size = models.PositiveBigIntegerField(
+        default=0,
+        help_text="Taille du fichier en octets"
+    )
+    bytes_processed = models.PositiveBigIntegerField(
+        default=0,
+        help_text="Octets du fichier déjà traités"
+    )
+    rows_processed = models.PositiveIntegerField(
+        default=0,
+        help_text="Nombre de lignes lues"
+    )
+    created_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Nombre de tâches créées"
+    )
+    error_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Nombre de lignes rejetées"
+    )
+    errors = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="Premières erreurs : [{\"line\": n, \"errors\": {...}}]"
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        help_text="Date de dépôt du fichier"
+    )
+    started_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Début du traitement"
+    )
+    finished_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Fin du traitement"
+    )
+
+    @property
+    def progress(self):
+        """Avancement en pourcentage, d'après la position de lecture dans le fichier."""
+        if self.status == self.STATUS_COMPLETED:
+            return 100
+        if not self.file_size:
+            return 0
+        return min(99, int(100 * self.bytes_processed / self.file_size))
+
+    def __str__(self):
+        return f"Import {self.pk} ({self.get_status_display()})"
+
+    class Meta:
+        verbose_name = "Import de tâches"
+        verbose_name_plural = "Imports de tâches"
+        indexes = [
+            models.Index(fields=['user', '-created_at', '-id'], name='taskimport_user_created_idx'),
+        ]
+
 
 # models.py - Définition des modèles pour l'application tasks
 # Ce fichier regroupe tous les modèles de l'application de gestion des tâches.
-# Il contient actuellement les modèles Task (tâche) et Category (catégorie pour organiser les tâches).
+# Il contient actuellement les modèles Task (tâche), Category (catégorie pour organiser les tâches),
+# TaskStats (statistiques par utilisateur), OutboxEmail (file d'attente des notifications email)
+# Tombstone (suppressions, pour la synchronisation incrémentale) et TaskImport (imports de fichiers).
 # Les modèles sont utilisés pour le CRUD via l'API, l'interface admin et les rappels automatiques via Celery.
\ No newline at end of file
@@ -0,0 +1,62 @@
+# notifications.py - Notifications email liées aux tâches
+# Les vues n'envoient plus d'email directement : elles écrivent dans la table
+# OutboxEmail, dans la même transaction que la modification. L'envoi réel est fait
+# par la tâche Celery `drain_email_outbox`, déclenchée après le commit, ce qui rend
+# la latence de l'API indépendante du serveur SMTP.
+
+from django.db import transaction
+
+from gestion_taches.tasks.models import OutboxEmail
+
+
+def queue_email(subject, body, to):
+    """
+    Met un email en file d'attente et planifie la vidange de l'outbox une fois la
+    transaction validée. Si la transaction est annulée, l'email l'est aussi.
+    """
+    email = OutboxEmail.objects.create(subject=subject, body=body, to=to)
+    transaction.on_commit(_schedule_drain, robust=True)
+    return email
+
+
+def _schedule_drain():
+    from gestion_taches.tasks.tasks import drain_email_outbox  # noqa: PLC0415
+
+    drain_email_outbox.delay()
+
+
+def _due_date_label(task):
+    return task.due_date if task.due_date else "Aucune"
+
+
+def notify_task_created(task, to):
+    return queue_email(
+        'Tâche créée avec succès',
+        f'Votre tâche "{task.title}" a été créée. Description : {task.description[:50]}... Date d\'échéance : {_due_date_label(task)}.',
+        to,
+    )
+
+
+def notify_task_updated(task, to):
+    return queue_email(
+        'Tâche modifiée avec succès',
+        f'Votre tâche "{task.title}" a été modifiée. Description : {task.description[:50]}... Date d\'échéance : {_due_date_label(task)}.',
+        to,
+    )
+
+
+def notify_task_deleted(title, to):
+    return queue_email(
+        'Tâche supprimée',
+        f'Votre tâche "{title}" a été supprimée.',
+        to,
+    )
+
+
+def notify_tasks_bulk_changed(verb, count, to):
+    """Notification unique pour une opération groupée (`verb` : créées, modifiées, supprimées)."""
+    return queue_email(
+        f'{count} tâche(s) {verb}',
+        f'{count} de vos tâches ont été {verb} en une seule opération.',
+        to,
+    )
@@ -0,0 +1,211 @@
+# pagination.py - Pagination par curseur (keyset) pour l'API des tâches
+# DRF's CursorPagination ne garde que le premier champ de tri dans le curseur et
+# départage les ex aequo avec un offset, ce qui devient coûteux sur des champs peu
+# sélectifs comme `priority` ou `due_date` (nullable). Ici le curseur contient la
+# valeur de chaque champ de tri, complétée par `created_at` et `id`, et la page
+# suivante est obtenue par une comparaison lexicographique : le coût d'une page ne
+# dépend plus de sa position dans la liste.
+
+import json
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import F
+from django.db.models import Q
+from django.db.models.fields.tuple_lookups import Tuple
+from django.db.models.fields.tuple_lookups import TupleGreaterThan
+from django.db.models.fields.tuple_lookups import TupleLessThan
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor
+from rest_framework.pagination import CursorPagination
+from rest_framework.settings import api_settings
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Pagination par curseur sur un tuple de champs de tri.
+    L'ordre demandé via `OrderingFilter` est conservé et complété par les champs
+    de `tiebreakers` pour garantir un ordre total ; les valeurs NULL des champs
+    nullables sont toujours placées en fin de liste dans le sens de lecture. Sans
+    tri explicite, une recherche plein texte est paginée par pertinence (`search_rank`).
+    Quand tous les champs sont NOT NULL et triés dans le même sens, la page suivante
+    est une comparaison de lignes (created_at, id) < (%s, %s) que PostgreSQL résout
+    par un parcours d'index composite.
+    """
+    ordering = ('-created_at', '-id')
+    rank_annotation = 'search_rank'
+    tiebreakers = ('-created_at', '-id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor is not None and self.cursor.reverse
+        queryset = self.order_queryset(queryset, request, view, reverse=reverse)
+        position = None if self.cursor is None else self._decode_position(self.cursor.position)
+        if position is not None:
+            try:
+                queryset = queryset.filter(self._keyset_filter(position, reverse))
+            except (DjangoValidationError, TypeError, ValueError):
+                # Valeur de curseur du mauvais type (ex. curseur émis avant un changement de colonne)
+                raise NotFound(self.invalid_cursor_message) from None
+
+        # Une ligne de plus pour savoir s'il existe une page suivante
+        results = list(queryset[:self.page_size + 1])
+        self.page = results[:self.page_size]
+        has_following = len(results) > self.page_size
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_following
+        else:
+            self.has_next = has_following
+            self.has_previous = position is not None
+
+        return self.page
+
+    def order_queryset(self, queryset, request, view=None, *, reverse=False):
+        """
+        Trie `queryset` dans l'ordre total de la pagination : tri demandé (ou
+        pertinence de la recherche), complété par les champs de départage.
+        """
+        self.ordering = self._complete_ordering(self.get_ordering(request, queryset, view))
+        self.fields = {field.lstrip('-'): self._model_field(queryset.model, field.lstrip('-')) for field in self.ordering}
+        return queryset.order_by(*self._order_by(reverse))
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        if self.page:
+            position = self._get_position_from_instance(self.page[-1], self.ordering)
+        else:
+            # Page vide en arrière : la page suivante repart du curseur courant
+            position = self.cursor.position
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=position))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if self.page:
+            position = self._get_position_from_instance(self.page[0], self.ordering)
+        else:
+            position = self.cursor.position
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=position))
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        # Sans tri explicite, une recherche plein texte est triée par pertinence
+        ordering_param = getattr(view, 'ordering_param', api_settings.ORDERING_PARAM)
+        if self.rank_annotation in queryset.query.annotations and not request.query_params.get(ordering_param):
+            return (f'-{self.rank_annotation}',)
+        return ordering
+
+    def _complete_ordering(self, ordering):
+        fields = [field.lstrip('-') for field in ordering]
+        completed = list(ordering)
+        for tiebreaker in self.tiebreakers:
+            if tiebreaker.lstrip('-') not in fields:
+                completed.append(tiebreaker)
+        return tuple(completed)
+
+    @staticmethod
+    def _model_field(model, name):
+        try:
+            return model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None  # annotation (ex. search_rank)
+
+    def _nullable(self, name):
+        # Une annotation peut valoir NULL : on la traite comme un champ nullable
+        field = self.fields[name]
+        return field is None or field.null
+
+    def _order_by(self, reverse):
+        # NULLS FIRST / LAST seulement sur les champs nullables : sur une colonne NOT
+        # NULL la clause empêcherait l'index (created_at DESC, id DESC) de servir le tri
+        expressions = []
+        for field in self.ordering:
+            name = field.lstrip('-')
+            nulls = {}
+            if self._nullable(name):
+                nulls = {'nulls_first': True} if reverse else {'nulls_last': True}
+            expression = F(name)
+            if field.startswith('-') != reverse:
+                expressions.append(expression.desc(**nulls))
+            else:
+                expressions.append(expression.asc(**nulls))
+        return expressions
+
+    def _keyset_filter(self, position, reverse):
+        """
+        Construit (f1 > v1) OR (f1 = v1 AND f2 > v2) OR ... en tenant compte du
+        sens de chaque champ et de la place des NULL, ou la comparaison de lignes
+        équivalente (f1, f2) > (v1, v2) quand elle est possible.
+        """
+        names = [field.lstrip('-') for field in self.ordering]
+        directions = {field.startswith('-') for field in self.ordering}
+        if len(directions) == 1 and not any(self._nullable(name) for name in names):
+            values = [self.fields[name].to_python(value) for name, value in zip(names, position, strict=True)]
+            lookup = TupleLessThan if directions.pop() != reverse else TupleGreaterThan
+            return lookup(Tuple(*(F(name) for name in names)), values)
+        keyset = Q(pk__in=[])
+        equal = Q()
+        for field, value in zip(self.ordering, position, strict=True):
+            name = field.lstrip('-')
+            keyset |= equal & self._after(name, value, descending=field.startswith('-'), reverse=reverse)
+            equal &= Q(**{f'{name}__isnull': True}) if value is None else Q(**{name: value})
+        return keyset
+
+    def _after(self, name, value, *, descending, reverse):
+        if value is None:
+            # Les NULL sont en fin de liste : rien ne les suit, tout le reste les précède
+            return Q(**{f'{name}__isnull': False}) if reverse else Q(pk__in=[])
+        lookup = 'lt' if descending != reverse else 'gt'
+        condition = Q(**{f'{name}__{lookup}': value})
+        if not reverse and self._nullable(name):
+            condition |= Q(**{f'{name}__isnull': True})
+        return condition
+
+    def _get_position_from_instance(self, instance, ordering):
+        values = []
+        for field in ordering:
+            name = field.lstrip('-')
+            value = instance[name] if isinstance(instance, dict) else getattr(instance, name)
+            values.append(value.isoformat() if hasattr(value, 'isoformat') else value)
+        return json.dumps(values)
+
+    def _decode_position(self, position):
+        if position is None:
+            return None
+        try:
+            values = json.loads(position)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message) from None
+        if (
+            not isinstance(values, list)
+            or len(values) != len(self.ordering)
+            or any(isinstance(value, (list, dict)) for value in values)
+        ):
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+
+class SyncPagination(KeysetCursorPagination):
+    """
+    Pages de la synchronisation incrémentale : ordre fixe (updated_at, id), sans
+    tri ni recherche demandés par le client, et pages plus grandes que la liste.
+    """
+    ordering = ('updated_at', 'id')
+    tiebreakers = ('id',)
+    page_size = 500
+
+    def get_ordering(self, request, queryset, view):
+        return self.ordering
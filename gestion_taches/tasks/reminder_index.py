@@ -0,0 +1,163 @@
+# reminder_index.py - Index des échéances de rappel dans un sorted set Redis
+# Chaque tâche à rappeler (non terminée, non rappelée, avec échéance) est un membre
+# du sorted set REMINDER_INDEX_KEY, avec pour score le timestamp de son échéance.
+# Les créations, modifications et suppressions mettent l'index à jour (voir
+# signals.py) et le répartiteur `dispatch_due_reminders` ne retire que les entrées
+# réellement échues : le coût est proportionnel au nombre de rappels dus, et non à
+# la taille de la table Task.
+# Sans REMINDER_INDEX_URL (tests), un équivalent en mémoire du processus est utilisé.
+# Après un déploiement, un FLUSH Redis ou un chargement en masse (COPY), la commande
+# `rebuild_reminder_index` reconstruit l'index depuis la table des tâches.
+
+import logging
+import threading
+
+import redis
+from django.conf import settings
+
+from .models import Task
+
+logger = logging.getLogger(__name__)
+
+REMINDER_INDEX_KEY = 'tasks:reminders:due'
+# Entrées envoyées à Redis par ZADD lors d'une reconstruction
+REBUILD_CHUNK_SIZE = 5_000
+
+# Lit et retire en une seule opération atomique au plus ARGV[2] entrées échues à
+# ARGV[1] : une entrée déplacée par `schedule` ou retirée par `unschedule` entre la
+# lecture et le retrait ne peut pas être écrasée, et les entrées futures ne sont
+# jamais touchées.
+POP_DUE_SCRIPT = """
+local members = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+if #members > 0 then
+    redis.call('ZREM', KEYS[1], unpack(members))
+end
+return members
+"""
+
+_client = None
+
+
+class LocalReminderIndex:
+    """
+    Remplaçant en mémoire du sous-ensemble de commandes Redis utilisé ici.
+    Non partagé entre processus : réservé aux tests et au développement.
+    """
+
+    def __init__(self):
+        self._sets = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _member(member):
+        return member.decode() if isinstance(member, bytes) else str(member)
+
+    def zadd(self, key, mapping):
+        with self._lock:
+            self._sets.setdefault(key, {}).update({self._member(m): score for m, score in mapping.items()})
+
+    def zrem(self, key, *members):
+        with self._lock:
+            entries = self._sets.get(key, {})
+            return sum(entries.pop(self._member(member), None) is not None for member in members)
+
+    def pop_due(self, key, deadline, limit):
+        """Équivalent de POP_DUE_SCRIPT."""
+        with self._lock:
+            entries = self._sets.get(key, {})
+            due = sorted((score, member) for member, score in entries.items() if score <= deadline)[:limit]
+            for _score, member in due:
+                del entries[member]
+            return [member.encode() for _score, member in due]
+
+    def zcard(self, key):
+        return len(self._sets.get(key, {}))
+
+    def delete(self, key):
+        self._sets.pop(key, None)
+
+    def rename(self, source, destination):
+        with self._lock:
+            self._sets[destination] = self._sets.pop(source)
+
+
+def get_client():
+    global _client  # noqa: PLW0603
+    if _client is None:
+        url = settings.REMINDER_INDEX_URL
+        _client = redis.Redis.from_url(url) if url else LocalReminderIndex()
+    return _client
+
+
+def schedule(task_id, due_date, *, active=True):
+    """
+    Ajoute (ou déplace) la tâche dans l'index si elle doit être rappelée,
+    sinon l'en retire. Une erreur Redis n'interrompt pas la requête : le
+    balayage de secours `send_reminder` rattrape les rappels manqués.
+    """
+    try:
+        if active and due_date is not None:
+            get_client().zadd(REMINDER_INDEX_KEY, {task_id: due_date.timestamp()})
+        else:
+            get_client().zrem(REMINDER_INDEX_KEY, task_id)
+    except redis.RedisError as e:
+        logger.warning("Index des rappels indisponible (tâche %s) : %s", task_id, e)
+
+
+def unschedule(task_id):
+    schedule(task_id, None, active=False)
+
+
+def pop_due(now, limit):
+    """
+    Retire de l'index et retourne au plus `limit` ids de tâches échues à `now`,
+    par ordre d'échéance. Le retrait est atomique (POP_DUE_SCRIPT) : deux
+    répartiteurs concurrents ne peuvent pas réclamer la même entrée.
+    """
+    client = get_client()
+    if isinstance(client, LocalReminderIndex):
+        members = client.pop_due(REMINDER_INDEX_KEY, now.timestamp(), limit)
+    else:
+        members = client.eval(POP_DUE_SCRIPT, 1, REMINDER_INDEX_KEY, now.timestamp(), limit)
+    return [int(member) for member in members]
+
+
+def pending_reminders():
+    """(id, échéance) des tâches à rappeler ; l'index partiel task_pending_reminder_idx sert la requête."""
+    return Task.objects.filter(is_completed=False, is_reminded=False, due_date__isnull=False).values_list('id', 'due_date')
+
+
+def add(rows, key=REMINDER_INDEX_KEY):
+    """Ajoute à l'index les tâches `rows` ((id, échéance)), par ZADD de REBUILD_CHUNK_SIZE entrées. Retourne leur nombre."""
+    client = get_client()
+    count = 0
+    chunk = {}
+    for task_id, due_date in rows:
+        chunk[task_id] = due_date.timestamp()
+        if len(chunk) == REBUILD_CHUNK_SIZE:
+            client.zadd(key, chunk)
+            count += len(chunk)
+            chunk = {}
+    if chunk:
+        client.zadd(key, chunk)
+        count += len(chunk)
+    return count
+
+
+def rebuild():
+    """
+    Reconstruit l'index depuis la table des tâches. Il est rempli sous une clé
+    temporaire puis substitué par RENAME : le répartiteur ne voit jamais un index
+    vide ou partiel. Une planification faite pendant la reconstruction peut être
+    perdue ; le balayage de secours `send_reminder` la rattrape. Retourne le nombre
+    d'entrées.
+    """
+    client = get_client()
+    staging = f'{REMINDER_INDEX_KEY}:rebuild'
+    client.delete(staging)
+    count = add(pending_reminders().iterator(chunk_size=REBUILD_CHUNK_SIZE), key=staging)
+    if count:
+        client.rename(staging, REMINDER_INDEX_KEY)
+    else:
+        client.delete(REMINDER_INDEX_KEY)
+    return count
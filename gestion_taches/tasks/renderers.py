@@ -0,0 +1,57 @@
+# renderers.py - Rendu JSON de l'API avec orjson
+# orjson encode les listes de tâches plusieurs fois plus vite que le module json de
+# la bibliothèque standard utilisé par JSONRenderer. La sortie est la même que celle
+# de DRF (JSON compact en UTF-8, dates ISO 8601 avec « Z » pour UTC, \u2028 et
+# \u2029 échappés) ; les types inconnus d'orjson (chaînes traduites paresseuses,
+# Decimal, timedelta, QuerySet...) sont convertis par l'encodeur de DRF. Tout ce
+# qu'orjson refuse encore (entier hors 64 bits, indentation demandée, réglages
+# UNICODE_JSON / COMPACT_JSON / STRICT_JSON modifiés) passe par JSONRenderer.
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from gestion_taches.tasks.instrumentation import measure
+
+OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+_encoder = JSONEncoder()
+
+
+def dumps(data):
+    """
+    Encode `data` comme JSONRenderer (JSON compact en UTF-8). Lève
+    orjson.JSONEncodeError pour ce qu'orjson ne sait pas encoder.
+    """
+    ret = orjson.dumps(data, default=_encoder.default, option=OPTIONS)
+    # Même sortie que DRF : JSON strictement inclus dans JavaScript. La recherche d'un
+    # seul octet (premier octet UTF-8 de U+2028/U+2029) évite deux parcours complets.
+    if b'\xe2' in ret:
+        ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+    return ret
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer encodé par orjson, avec repli sur le rendu de DRF lorsqu'orjson ne
+    peut pas produire exactement la même sortie.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with measure('serialize'):
+            return self._render(data, accepted_media_type, renderer_context)
+
+    def _render(self, data, accepted_media_type, renderer_context):
+        if data is None:
+            return b''
+        if (
+            self.ensure_ascii
+            or not self.compact
+            or not self.strict
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            return dumps(data)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
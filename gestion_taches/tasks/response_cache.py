@@ -0,0 +1,65 @@
+# response_cache.py - Cache des réponses de lecture de l'API, versionné par utilisateur
+# Les réponses de TaskViewSet.list/retrieve et CategoryViewSet.list sont mises en
+# cache (cache Django "default", Redis en production) sous une clé qui contient un
+# compteur de version propre à l'utilisateur. Toute écriture sur ses tâches ou ses
+# catégories incrémente ce compteur (voir signals.py) : les anciennes entrées ne sont
+# plus jamais lues et expirent d'elles-mêmes, sans suppression par motif.
+# TASK_RESPONSE_CACHE_TIMEOUT = 0 désactive le cache (tests).
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+
+def _version_key(user_id):
+    return f'tasks:api:version:{user_id}'
+
+
+def enabled():
+    return settings.TASK_RESPONSE_CACHE_TIMEOUT > 0
+
+
+def get_version(user_id):
+    """
+    Version courante des réponses de l'utilisateur. Une version absente (jamais
+    écrite ou évincée) repart de l'horloge, pour ne pas retomber sur une ancienne
+    version dont des réponses seraient encore en cache.
+    """
+    key = _version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump(user_id):
+    key = _version_key(user_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def invalidate(user_id):
+    """Invalide les réponses de l'utilisateur une fois la transaction validée."""
+    if enabled():
+        transaction.on_commit(lambda: bump(user_id), robust=True)
+
+
+def response_key(request, view_name):
+    user_id = request.user.pk
+    url = hashlib.md5(request.build_absolute_uri().encode(), usedforsecurity=False).hexdigest()
+    renderer = getattr(request, 'accepted_media_type', '')
+    return f'tasks:api:{user_id}:{get_version(user_id)}:{view_name}:{renderer}:{url}'
+
+
+def load(key):
+    return cache.get(key)
+
+
+def store(key, value):
+    cache.set(key, value, timeout=settings.TASK_RESPONSE_CACHE_TIMEOUT)
@@ -1,10 +1,37 @@
+from datetime import timedelta
+
 from celery.schedules import crontab
 
 # Configuration du planning pour les tâches périodiques avec Celery Beat
 CELERY_BEAT_SCHEDULE = {
-    'check-reminders-every-5-minutes': {
+    # Répartiteur des rappels : ne lit que les entrées échues de l'index Redis
+    'dispatch-due-reminders': {
+        'task': 'gestion_taches.tasks.tasks.dispatch_due_reminders',
+        'schedule': timedelta(seconds=15),
+        'args': (),
+    },
+    # Balayage complet de secours (index Redis perdu ou indisponible)
+    'check-reminders-hourly': {
         'task': 'gestion_taches.tasks.tasks.send_reminder',
-        'schedule': crontab(minute='*/5'),
+        'schedule': crontab(minute=0),
+        'args': (),
+    },
+    # Filet de sécurité : vide l'outbox si un déclenchement après commit a été perdu
+    'drain-email-outbox-every-minute': {
+        'task': 'gestion_taches.tasks.tasks.drain_email_outbox',
+        'schedule': crontab(minute='*'),
+        'args': (),
+    },
+    # Les compteurs temporels du tableau de bord glissent avec l'heure
+    'refresh-task-stats-every-15-minutes': {
+        'task': 'gestion_taches.tasks.tasks.refresh_task_stats',
+        'schedule': crontab(minute='*/15'),
+        'args': (),
+    },
+    # Traces de suppression au-delà de la rétention de la synchronisation
+    'purge-tombstones-daily': {
+        'task': 'gestion_taches.tasks.tasks.purge_tombstones',
+        'schedule': crontab(minute=30, hour=3),
         'args': (),
     },
-}
\ No newline at end of file
+}
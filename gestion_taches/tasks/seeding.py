@@ -0,0 +1,245 @@
+# seeding.py - Jeux de données synthétiques pour les tests de charge et la préproduction
+# Les distributions imitent la production : quelques utilisateurs et quelques
+# catégories concentrent la plupart des tâches (loi de Zipf), les dates de création
+# s'étalent sur l'historique et une partie des tâches échues attend son rappel.
+# Même graine (et même nombre de processus), mêmes lignes.
+#
+# Sur PostgreSQL les tâches sont envoyées par COPY FROM STDIN au format binaire, sans
+# passer par des instances de modèle : le coût dominant devient le calcul de la
+# colonne générée search_vector par le serveur, réparti sur plusieurs connexions avec
+# `jobs`. Ailleurs (SQLite), repli sur bulk_create par lots.
+# Ce calcul (to_tsvector sur le titre et la description) plafonne le débit à quelques
+# milliers de lignes par seconde et par connexion : environ 8 700 lignes/s mesurées
+# avec `jobs=4` (300 000 tâches en 34 s), loin des centaines de milliers de lignes/s
+# d'un COPY sans colonne générée. Passer par une table intermédiaire ne ferait que
+# déplacer ce coût dans l'INSERT ... SELECT final.
+#
+# Ni COPY ni bulk_create n'émettent de signaux : les tâches en attente de rappel sont
+# ajoutées ensuite à l'index Redis des échéances (reminder_index.py).
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+from itertools import accumulate
+
+import django
+from django.db import connection
+from django.db import connections
+from django.db import transaction
+from django.utils import timezone
+
+from gestion_taches.tasks import reminder_index
+from gestion_taches.tasks import stats
+from gestion_taches.tasks.models import Category
+from gestion_taches.tasks.models import Task
+from gestion_taches.users.models import User
+
+# Vocabulaire des titres et descriptions, tiré selon une loi de Zipf comme un texte
+# réel : les premiers mots reviennent souvent, les derniers rarement (recherche)
+WORDS = (
+    "facture client réunion rapport projet appeler envoyer préparer valider relancer "
+    "budget équipe contrat livraison commande planning revue courrier présentation "
+    "devis paiement stock inventaire formation recrutement audit bilan archive "
+    "serveur sauvegarde migration déploiement sécurité maintenance fournisseur "
+    "partenaire juridique assurance déclaration impôts banque notaire voyage salon"
+).split()
+PRIORITIES = tuple(Task.Priority)
+
+# Colonnes écrites par COPY, dans l'ordre des tuples de `task_rows`, et leurs types
+COLUMNS = (
+    'user_id', 'title', 'description', 'due_date', 'is_completed', 'is_reminded',
+    'priority', 'category_id', 'created_at', 'updated_at',
+)
+COPY_TYPES = ('int8', 'text', 'text', 'timestamptz', 'bool', 'bool', 'int2', 'int8', 'timestamptz', 'timestamptz')
+
+# Titres et descriptions distincts tirés à l'avance, puis réutilisés
+TEXT_POOL_SIZE = 4096
+# Lignes tirées d'un coup (listes de nombres aléatoires) par `task_rows`
+CHUNK_SIZE = 10_000
+
+
+@dataclass(frozen=True)
+class Distribution:
+    """Volumes et proportions du jeu de données ; les défauts imitent la production."""
+    users: int = 0  # 0 : déduit du nombre de tâches, voir `user_count`
+    categories_per_user: int = 12
+    zipf_exponent: float = 1.1
+    uncategorized_rate: float = 0.25
+    no_due_date_rate: float = 0.2
+    empty_description_rate: float = 0.4
+    completed_rate: float = 0.55
+    # Part des tâches échues et en attente déjà rappelées (le reste alimente le balayage)
+    reminded_rate: float = 0.9
+    priority_weights: tuple = (0.3, 0.5, 0.2)
+    history_days: int = 365
+
+    def user_count(self, size):
+        return self.users or max(5, round(size ** 0.5 / 3))
+
+
+def zipf_weights(count, exponent):
+    """Poids cumulés de `count` éléments selon une loi de Zipf (rang 1 le plus fréquent)."""
+    return list(accumulate(1 / rank ** exponent for rank in range(1, count + 1)))
+
+
+def _text_pool(rng, distribution, min_words, max_words, empty_rate=0.0):
+    weights = zipf_weights(len(WORDS), distribution.zipf_exponent)
+    return [
+        "" if rng.random() < empty_rate
+        else " ".join(rng.choices(WORDS, cum_weights=weights, k=rng.randint(min_words, max_words)))
+        for _ in range(TEXT_POOL_SIZE)
+    ]
+
+
+def task_rows(size, owners, distribution, rng, now):
+    """
+    Génère `size` tuples dans l'ordre de COLUMNS. `owners` associe à chaque
+    identifiant d'utilisateur, du plus au moins actif, les identifiants de ses
+    catégories (même nombre pour tous, du plus au moins utilisé).
+    """
+    d = distribution
+    user_ids = list(owners)
+    user_weights = zipf_weights(len(user_ids), d.zipf_exponent)
+    ranks = range(d.categories_per_user)
+    category_weights = zipf_weights(d.categories_per_user, d.zipf_exponent)
+    priority_weights = list(accumulate(d.priority_weights))
+    titles = [title.capitalize() for title in _text_pool(rng, d, 2, 6)]
+    descriptions = _text_pool(rng, d, 3, 25, d.empty_description_rate)
+    history = timedelta(days=d.history_days)
+    random_ = rng.random
+    for start in range(0, size, CHUNK_SIZE):
+        count = min(CHUNK_SIZE, size - start)
+        for user_id, category_rank, priority, title, description in zip(
+            rng.choices(user_ids, cum_weights=user_weights, k=count),
+            rng.choices(ranks, cum_weights=category_weights, k=count),
+            rng.choices(PRIORITIES, cum_weights=priority_weights, k=count),
+            rng.choices(titles, k=count),
+            rng.choices(descriptions, k=count),
+            strict=True,
+        ):
+            created_at = now - history * random_()
+            due_date = None if random_() < d.no_due_date_rate else created_at + timedelta(days=95 * random_() - 5)
+            is_completed = random_() < d.completed_rate
+            yield (
+                user_id,
+                title,
+                description,
+                due_date,
+                is_completed,
+                not is_completed and due_date is not None and due_date <= now and random_() < d.reminded_rate,
+                priority,
+                None if random_() < d.uncategorized_rate else owners[user_id][category_rank],
+                created_at,
+                min(created_at + timedelta(days=30 * random_()), now),
+            )
+
+
+def create_owners(size, distribution, prefix):
+    """
+    Crée les utilisateurs `<prefix>-<rang>` et leurs catégories. Retourne
+    {id utilisateur: [ids de catégories]}, du plus au moins actif.
+    """
+    users = User.objects.bulk_create(
+        User(username=f"{prefix}-{rank}", email=f"{prefix}-{rank}@example.com", password="!")
+        for rank in range(distribution.user_count(size))
+    )
+    categories = Category.objects.bulk_create(
+        Category(user=user, name=f"{WORDS[index].capitalize()} {rank}", description="")
+        for rank, user in enumerate(users)
+        for index in range(distribution.categories_per_user)
+    )
+    owners = {user.pk: [] for user in users}
+    for category in categories:
+        owners[category.user_id].append(category.pk)
+    return owners
+
+
+def copy_tasks(rows, using='default'):
+    """Envoie les tuples `rows` dans la table des tâches par COPY binaire. Retourne leur nombre."""
+    count = 0
+    table = connections[using].ops.quote_name(Task._meta.db_table)
+    with connections[using].cursor() as cursor:
+        with cursor.cursor.copy(f"COPY {table} ({', '.join(COLUMNS)}) FROM STDIN (FORMAT BINARY)") as copy:
+            copy.set_types(COPY_TYPES)
+            write_row = copy.write_row
+            for row in rows:
+                write_row(row)
+                count += 1
+    return count
+
+
+@contextmanager
+def explicit_timestamps():
+    """
+    Désactive auto_now_add / auto_now de Task le temps d'insérer des dates de
+    création et de mise à jour étalées dans le passé (bulk_create les écraserait).
+    """
+    fields = [Task._meta.get_field('created_at'), Task._meta.get_field('updated_at')]
+    saved = [(field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, (auto_now, auto_now_add) in zip(fields, saved, strict=True):
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def bulk_create_tasks(rows, batch_size):
+    """Repli hors PostgreSQL : instances de modèle insérées par lots de `batch_size`."""
+    count = 0
+    batch = []
+    with explicit_timestamps():
+        for row in rows:
+            batch.append(Task(**dict(zip(COLUMNS, row, strict=True))))
+            if len(batch) == batch_size:
+                count += len(Task.objects.bulk_create(batch))
+                batch = []
+        count += len(Task.objects.bulk_create(batch))
+    return count
+
+
+def _copy_part(size, owners, distribution, seed, now):
+    """Travail d'un processus de `seed` : sa propre connexion, sa propre transaction."""
+    try:
+        with transaction.atomic():
+            return copy_tasks(task_rows(size, owners, distribution, random.Random(seed), now))
+    finally:
+        connections.close_all()
+
+
+def seed(size, *, distribution=None, seed=0, prefix='seed', jobs=1, batch_size=5_000):
+    """
+    Insère `size` tâches synthétiques, leurs utilisateurs et leurs catégories, puis
+    recalcule les statistiques et indexe les rappels en attente. Avec `jobs` > 1 (PostgreSQL, hors transaction), les
+    tâches sont réparties entre autant de processus et de connexions, chacun validant
+    sa part. Retourne {id utilisateur: [ids de catégories]}, du plus au moins actif.
+    """
+    distribution = distribution or Distribution()
+    rng = random.Random(seed)
+    now = timezone.now()
+    owners = create_owners(size, distribution, prefix)
+    if connection.vendor != 'postgresql':
+        bulk_create_tasks(task_rows(size, owners, distribution, rng, now), batch_size)
+    elif jobs <= 1 or connection.in_atomic_block:
+        # Dans une transaction, les autres connexions ne verraient pas les utilisateurs
+        copy_tasks(task_rows(size, owners, distribution, rng, now))
+    else:
+        parts = [size // jobs + (index < size % jobs) for index in range(jobs)]
+        # Les processus fils ne doivent pas hériter de la connexion du parent
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=jobs, initializer=django.setup) as pool:
+            futures = [
+                pool.submit(_copy_part, part, owners, distribution, seed * jobs + index + 1, now)
+                for index, part in enumerate(parts) if part
+            ]
+            for future in futures:
+                future.result()
+    for user_id in owners:
+        stats.rebuild(user_id)
+    pending = reminder_index.pending_reminders().filter(user_id__in=owners)
+    reminder_index.add(pending.iterator(chunk_size=reminder_index.REBUILD_CHUNK_SIZE))
+    return owners
+
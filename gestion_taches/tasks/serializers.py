@@ -3,8 +3,14 @@
 # et valider les données entrantes pour l'API REST. Les serializers définissent
 # les champs exposés, leurs validations et les champs en lecture seule.
 
+from django.conf import settings
+from django.utils import timezone
+from django.utils.functional import cached_property
+from rest_framework import ISO_8601
 from rest_framework import serializers
-from gestion_taches.tasks.models import Task, Category
+from rest_framework.settings import api_settings
+from gestion_taches.tasks.models import Task, Category, TaskImport
+from gestion_taches.tasks.instrumentation import measure
 
 class CategorySerializer(serializers.ModelSerializer):
     """
@@ -20,7 +26,57 @@ class CategorySerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'user']
 # ... (rest of the file unchanged)
 
+class UserCategoryField(serializers.PrimaryKeyRelatedField):
+    """
+    Catégorie d'une tâche, limitée aux catégories de l'utilisateur de la requête.
+    Si le contexte fournit `categories` (dictionnaire id -> Category préchargé, voir
+    les opérations groupées de TaskViewSet), aucune requête n'est faite par élément.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        request = self.context.get('request')
+        if request is not None and request.user.is_authenticated:
+            queryset = queryset.filter(user=request.user)
+        return queryset
+
+    def to_internal_value(self, data):
+        categories = self.context.get('categories')
+        if categories is None:
+            return super().to_internal_value(data)
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            return categories[int(data)]
+        except (KeyError, TypeError, ValueError):
+            self.fail('does_not_exist', pk_value=data)
+
+
+class PriorityField(serializers.ChoiceField):
+    """
+    Priorité exposée par son code ('low', 'medium', 'high') et stockée en entier
+    (voir Task.Priority).
+    """
+    codes = {priority.value: priority.code for priority in Task.Priority}
+
+    def __init__(self, **kwargs):
+        super().__init__(choices=[(priority.code, priority.label) for priority in Task.Priority], **kwargs)
+
+    def to_internal_value(self, data):
+        return Task.Priority[super().to_internal_value(data).upper()]
+
+    def to_representation(self, value):
+        return self.codes[value]
+
+
 class TaskSerializer(serializers.ModelSerializer):
+    """
+    Serializer pour le modèle Task.
+    `fields` limite les champs exposés (ex. ('id', 'title')) et `expand` remplace
+    l'identifiant d'une relation de `expandable_fields` par l'objet sérialisé.
+    """
+    expandable_fields = {'category': CategorySerializer}
+
     title = serializers.CharField(help_text="Titre de la tâche (max 200 caractères)")
     description = serializers.CharField(
         help_text="Description détaillée (optionnel)", required=False
@@ -35,11 +91,10 @@ class TaskSerializer(serializers.ModelSerializer):
         read_only=True,
         help_text="Indique si un rappel a été envoyé"
     )
-    priority = serializers.ChoiceField(
-        choices=[('low', 'Low'), ('medium', 'Medium'), ('high', 'High')],
+    priority = PriorityField(
         help_text="Priorité de la tâche (faible, moyenne, haute)"
     )
-    category = serializers.PrimaryKeyRelatedField(
+    category = UserCategoryField(
         queryset=Category.objects.all(),
         allow_null=True,
         help_text="Identifiant de la catégorie associée (optionnel)"
@@ -53,6 +108,15 @@ class TaskSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'user', 'created_at', 'updated_at']
 
+    def __init__(self, *args, fields=None, expand=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+        for name in expand:
+            if name in self.fields:
+                self.fields[name] = self.expandable_fields[name](read_only=True)
+
     def create(self, validated_data):
         due_date = validated_data.get('due_date')
         if due_date and not timezone.is_aware(due_date):
@@ -64,4 +128,155 @@ class TaskSerializer(serializers.ModelSerializer):
         due_date = validated_data.get('due_date')
         if due_date and not timezone.is_aware(due_date):
             validated_data['due_date'] = timezone.make_aware(due_date, timezone=timezone.get_current_timezone())
-        return super().update(instance, validated_data)
\ No newline at end of file
+        return super().update(instance, validated_data)
+
+
+def _iso_datetime(tz):
+    """Équivalent de DateTimeField.to_representation (format ISO 8601) dans le fuseau `tz`."""
+    def convert(value):
+        value = value.astimezone(tz).isoformat()
+        return value[:-6] + 'Z' if value.endswith('+00:00') else value
+    return convert
+
+
+class ValuesRowSerializer:
+    """
+    Représentation en lecture seule construite à partir de lignes `values()`, identique
+    à `serializer_class(many=True).data` : mêmes clés, dans le même ordre, mêmes formats.
+    Aucune instance de modèle n'est créée : les valeurs lues en base sont recopiées
+    telles quelles, les dates ISO 8601 sont converties dans le fuseau courant résolu
+    une fois par appel, et les autres champs passent par leur `to_representation`.
+    Un serializer imbriqué (relation dépliée) est lu par jointure, avec les colonnes
+    `<relation>__<champ>`.
+    """
+    passthrough = (
+        serializers.BooleanField,
+        serializers.CharField,
+        serializers.ChoiceField,
+        serializers.IntegerField,
+        serializers.PrimaryKeyRelatedField,
+    )
+
+    def __init__(self, serializer_class, prefix='', **options):
+        self.serializer_class = serializer_class
+        self.prefix = prefix
+        self.options = options
+        self._variants = {}
+
+    def select(self, fields=None, expand=()):
+        """Variante pour `serializer_class(fields=fields, expand=expand)`, conservée pour les appels suivants."""
+        if fields is None and not expand:
+            return self
+        key = (fields, expand)
+        if key not in self._variants:
+            self._variants[key] = ValuesRowSerializer(self.serializer_class, fields=fields, expand=expand)
+        return self._variants[key]
+
+    @cached_property
+    def _fields(self):
+        # Construit au premier usage : les champs d'un ModelSerializer lisent le registre des modèles
+        return {
+            name: field for name, field in self.serializer_class(**self.options).fields.items()
+            if not field.write_only
+        }
+
+    @cached_property
+    def _nested(self):
+        return tuple(
+            (name, ValuesRowSerializer(type(field), prefix=f'{self.prefix}{field.source}__'))
+            for name, field in self._fields.items()
+            if isinstance(field, serializers.BaseSerializer)
+        )
+
+    @cached_property
+    def sources(self):
+        """Colonnes à demander à `values()`."""
+        sources = [f'{self.prefix}{field.source}' for field in self._fields.values()]
+        for _name, child in self._nested:
+            sources.extend(child.sources)
+        return tuple(sources)
+
+    @cached_property
+    def _columns(self):
+        return tuple(
+            (name, f'{self.prefix}{field.source}', self._converter(field)) for name, field in self._fields.items()
+        )
+
+    def _converter(self, field):
+        if isinstance(field, serializers.BaseSerializer) or any(
+            # Une sous-classe qui redéfinit to_representation (ex. PriorityField) n'est pas recopiée
+            isinstance(field, base) and type(field).to_representation is base.to_representation
+            for base in self.passthrough
+        ):
+            # Relation dépliée : l'identifiant lu ici est remplacé par l'objet s'il n'est pas nul
+            return None
+        if (
+            isinstance(field, serializers.DateTimeField)
+            and settings.USE_TZ
+            and not hasattr(field, 'timezone')
+            and str(getattr(field, 'format', api_settings.DATETIME_FORMAT)).lower() == ISO_8601
+        ):
+            return _iso_datetime
+        return field.to_representation
+
+    def _bind(self, iso_datetime):
+        columns = [
+            (name, source, iso_datetime if convert is _iso_datetime else convert)
+            for name, source, convert in self._columns
+        ]
+        return columns, [(name, child._bind(iso_datetime)) for name, child in self._nested]
+
+    @staticmethod
+    def _represent(row, columns, nested):
+        item = {}
+        for name, source, convert in columns:
+            value = row[source]
+            item[name] = value if convert is None or value is None else convert(value)
+        for name, (child_columns, child_nested) in nested:
+            if item[name] is not None:
+                item[name] = ValuesRowSerializer._represent(row, child_columns, child_nested)
+        return item
+
+    def to_representation(self, rows):
+        columns, nested = self._bind(_iso_datetime(timezone.get_current_timezone()))
+        represent = self._represent
+        with measure('serialize'):
+            return [represent(row, columns, nested) for row in rows]
+
+
+task_rows = ValuesRowSerializer(TaskSerializer)
+
+
+class TaskImportSerializer(serializers.ModelSerializer):
+    """
+    Serializer pour le modèle TaskImport.
+    À la création, seul le fichier est attendu (le format est déduit de son extension
+    s'il n'est pas précisé) ; les autres champs décrivent la progression de l'import.
+    """
+    file = serializers.FileField(write_only=True, help_text="Fichier CSV ou NDJSON à importer")
+    file_format = serializers.ChoiceField(
+        choices=[(TaskImport.FORMAT_CSV, 'CSV'), (TaskImport.FORMAT_NDJSON, 'NDJSON')],
+        required=False,
+        help_text="Format du fichier (déduit de l'extension .csv, .ndjson ou .jsonl si absent)"
+    )
+    progress = serializers.IntegerField(read_only=True, help_text="Avancement en pourcentage")
+
+    class Meta:
+        model = TaskImport
+        fields = [
+            'id', 'file', 'file_format', 'status', 'progress', 'rows_processed', 'created_count',
+            'error_count', 'errors', 'created_at', 'started_at', 'finished_at',
+        ]
+        read_only_fields = [
+            'id', 'status', 'rows_processed', 'created_count', 'error_count', 'errors',
+            'created_at', 'started_at', 'finished_at',
+        ]
+
+    def validate(self, attrs):
+        from gestion_taches.tasks.imports import detect_format  # noqa: PLC0415
+
+        if not attrs.get('file_format'):
+            attrs['file_format'] = detect_format(attrs['file'].name)
+            if attrs['file_format'] is None:
+                raise serializers.ValidationError({'file_format': ["Format introuvable : précisez csv ou ndjson."]})
+        return attrs
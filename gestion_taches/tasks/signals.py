@@ -0,0 +1,185 @@
+# signals.py - Récepteurs de signaux du modèle Task
+# Centralise les effets de bord d'une écriture sur une tâche, pour qu'ils
+# s'appliquent de la même façon depuis l'API, le tableau de bord et l'admin.
+# Les opérations groupées (bulk_create, bulk_update) ne déclenchent pas ces
+# signaux ; elles utilisent `bulk_writes()` et appliquent `after_bulk_write()`.
+
+import threading
+from contextlib import contextmanager
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.db.models.signals import pre_delete
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from gestion_taches.tasks import delta_sync
+from gestion_taches.tasks import reminder_index
+from gestion_taches.tasks import response_cache
+from gestion_taches.tasks import stats
+from gestion_taches.tasks.models import Category
+from gestion_taches.tasks.models import Task
+from gestion_taches.tasks.models import Tombstone
+
+_local = threading.local()
+
+
+@contextmanager
+def bulk_writes():
+    """
+    Suspend les récepteurs de ce module pendant une écriture groupée, par exemple
+    un `queryset.delete()` qui enverrait sinon un signal par tâche supprimée.
+    """
+    previous = getattr(_local, 'suspended', False)
+    _local.suspended = True
+    try:
+        yield
+    finally:
+        _local.suspended = previous
+
+
+def _suspended():
+    return getattr(_local, 'suspended', False)
+
+
+def after_bulk_write(user_id, saved=(), deleted=(), *, created=False, update_stats=True):
+    """
+    Effets de bord d'une écriture groupée : statistiques, index des rappels, cache
+    et traces de suppression pour la synchronisation. `saved` contient les tâches
+    créées (`created=True`) ou modifiées, `deleted` les tâches supprimées, chargées
+    avec les champs de `Task.stats_state`. Les statistiques sont mises à jour par
+    différence, comme pour une écriture unitaire ; un appelant qui écrit en
+    plusieurs lots peut passer `update_stats=False` et les reconstruire une fois.
+    """
+    saved, deleted = list(saved), list(deleted)
+    if update_stats:
+        _apply_bulk_stats(user_id, saved, deleted, created)
+    response_cache.invalidate(user_id)
+    schedules = [
+        (task.id, task.due_date, not task.is_completed and not task.is_reminded) for task in saved
+    ]
+    deleted_ids = [task.pk for task in deleted]
+    delta_sync.record_deletions(user_id, Tombstone.KIND_TASK, deleted_ids)
+
+    def update_index():
+        for task_id, due_date, active in schedules:
+            reminder_index.schedule(task_id, due_date, active=active)
+        for task_id in deleted_ids:
+            reminder_index.unschedule(task_id)
+
+    transaction.on_commit(update_index)
+
+
+def _apply_bulk_stats(user_id, saved, deleted, created):
+    changes = []
+    for task in saved:
+        old_state = None if created else getattr(task, '_stats_state', None)
+        new_state = task.stats_state()
+        if new_state is None or (not created and old_state is None):
+            # État incomplet : même repli que `update_task_stats`
+            stats.rebuild(user_id)
+            return
+        changes.append((old_state, new_state))
+    for task in deleted:
+        old_state = getattr(task, '_stats_state', None) or task.stats_state()
+        if old_state is None:
+            stats.rebuild(user_id)
+            return
+        changes.append((old_state, None))
+    stats.apply_changes(changes)
+    for task in saved:
+        task._stats_state = task.stats_state()
+
+
+@receiver(post_save, sender=Task)
+def update_reminder_index(sender, instance, **kwargs):
+    if _suspended():
+        return
+    # Mise à jour de l'index après le commit, avec les valeurs du moment de l'écriture
+    task_id, due_date = instance.id, instance.due_date
+    active = not instance.is_completed and not instance.is_reminded
+    transaction.on_commit(lambda: reminder_index.schedule(task_id, due_date, active=active))
+
+
+@receiver(post_delete, sender=Task)
+def remove_from_reminder_index(sender, instance, **kwargs):
+    if _suspended():
+        return
+    task_id = instance.id
+    transaction.on_commit(lambda: reminder_index.unschedule(task_id))
+
+
+@receiver(post_save, sender=Task)
+def update_task_stats(sender, instance, created, **kwargs):
+    if _suspended():
+        return
+    old_state = None if created else getattr(instance, '_stats_state', None)
+    new_state = instance.stats_state()
+    if new_state is None or (not created and old_state is None):
+        # État incomplet (instance partielle ou construite à la main) : recalcul
+        stats.rebuild(instance.user_id)
+    else:
+        stats.apply_change(old_state, new_state)
+    instance._stats_state = new_state
+
+
+@receiver(post_delete, sender=Task)
+def remove_from_task_stats(sender, instance, **kwargs):
+    if _suspended():
+        return
+    old_state = getattr(instance, '_stats_state', None) or instance.stats_state()
+    if old_state is not None:
+        stats.apply_change(old_state, None)
+
+
+@receiver(post_save, sender=Category)
+def count_created_category(sender, instance, created, **kwargs):
+    if _suspended():
+        return
+    if created:
+        stats.apply_category_change(instance.user_id, 1)
+
+
+@receiver(post_delete, sender=Category)
+def count_deleted_category(sender, instance, **kwargs):
+    if _suspended():
+        return
+    stats.apply_category_change(instance.user_id, -1)
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_response_cache(sender, instance, **kwargs):
+    if _suspended():
+        return
+    response_cache.invalidate(instance.user_id)
+
+
+def _deleted_with_user(origin):
+    # Suppression en cascade d'un compte : rien à synchroniser
+    return isinstance(origin, get_user_model())
+
+
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=Category)
+def record_tombstone(sender, instance, origin=None, **kwargs):
+    if _suspended() or _deleted_with_user(origin):
+        return
+    kind = Tombstone.KIND_TASK if sender is Task else Tombstone.KIND_CATEGORY
+    delta_sync.record_deletions(instance.user_id, kind, [instance.pk])
+
+
+@receiver(pre_delete, sender=Category)
+def touch_category_tasks(sender, instance, origin=None, **kwargs):
+    """
+    SET_NULL détache les tâches de la catégorie par un UPDATE qui ne touche pas
+    updated_at : on l'avance ici pour que la synchronisation et l'ETag voient le
+    changement de ces tâches.
+    """
+    if _suspended() or _deleted_with_user(origin):
+        return
+    Task.objects.filter(category=instance).update(updated_at=timezone.now())
@@ -0,0 +1,205 @@
+# stats.py - Maintenance incrémentale des statistiques du tableau de bord
+# Chaque écriture sur une tâche applique à TaskStats (et à Category.open_task_count)
+# la différence entre la contribution de l'ancien état et celle du nouvel état, par
+# des UPDATE ... SET x = x + delta atomiques. La lecture du tableau de bord devient
+# une lecture d'une seule ligne, quel que soit le nombre de tâches.
+# Les compteurs "en retard" et "7 prochains jours" dépendent de l'heure : ils sont
+# recalculés par `refresh_time_buckets` ; `rebuild` répare toute dérive. Entre deux
+# recalculs, une écriture les évalue à l'instant `refreshed_at` de la ligne, dans
+# l'UPDATE lui-même, et non à l'heure courante : l'ancien état d'une tâche est retiré
+# du compartiment où il avait été compté, même si son échéance est passée depuis.
+
+from collections import Counter
+from datetime import timedelta
+
+from django.db.models import Case
+from django.db.models import Count
+from django.db.models import F
+from django.db.models import OuterRef
+from django.db.models import Q
+from django.db.models import Subquery
+from django.db.models import Value
+from django.db.models import When
+from django.db.models.functions import Coalesce
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from gestion_taches.tasks.models import Category
+from gestion_taches.tasks.models import Task
+from gestion_taches.tasks.models import TaskStats
+
+UPCOMING_WINDOW = timedelta(days=7)
+PRIORITY_FIELDS = {
+    Task.Priority.HIGH: 'high_priority_tasks',
+    Task.Priority.MEDIUM: 'medium_priority_tasks',
+    Task.Priority.LOW: 'low_priority_tasks',
+}
+
+
+def _contribution(state):
+    """Compteurs TaskStats, hors compteurs temporels, auxquels contribue une tâche dans l'état `state`."""
+    counts = Counter(total_tasks=1)
+    if state['is_completed']:
+        counts['completed_tasks'] += 1
+        return counts
+    if state['priority'] in PRIORITY_FIELDS:
+        counts[PRIORITY_FIELDS[state['priority']]] += 1
+    return counts
+
+
+def _pending_due_date(state):
+    if state is None or state['is_completed']:
+        return None
+    return state['due_date']
+
+
+def _time_bucket_updates(due_dates):
+    """
+    Expressions UPDATE des compteurs temporels pour `due_dates` ({échéance: +n / -n}),
+    évaluées par rapport à la colonne refreshed_at, comme l'a fait le dernier recalcul.
+    """
+    overdue, upcoming = [], []
+    for due_date, delta in due_dates.items():
+        overdue.append(When(refreshed_at__gt=due_date, then=Value(delta)))
+        upcoming.append(When(refreshed_at__lte=due_date, refreshed_at__gte=due_date - UPCOMING_WINDOW, then=Value(delta)))
+    return {
+        # Plancher à 0 : une course avec `refresh_time_buckets` ne laisse pas de compteur négatif
+        field: Greatest(F(field) + Case(*whens, default=Value(0)), Value(0))
+        for field, whens in (('overdue_tasks', overdue), ('upcoming_tasks', upcoming))
+    }
+
+
+def _open_category(state):
+    if state is None or state['is_completed']:
+        return None
+    return state['category_id']
+
+
+def apply_change(old_state, new_state):
+    """
+    Applique le passage d'une tâche de `old_state` à `new_state` (None pour une
+    création ou une suppression). Si la ligne TaskStats de l'utilisateur n'existe
+    pas encore, elle est reconstruite depuis la base, sauf pour une suppression
+    (l'utilisateur lui-même peut être en cours de suppression).
+    """
+    apply_changes([(old_state, new_state)])
+
+
+def apply_changes(changes):
+    """
+    Variante groupée de `apply_change` pour une liste de couples (ancien état,
+    nouvel état) : les différences sont cumulées puis appliquées en un UPDATE par
+    utilisateur et un seul UPDATE pour les compteurs de toutes les catégories.
+    """
+    deltas = {}
+    due_deltas = {}
+    created_for = set()
+    category_deltas = Counter()
+    category_owners = {}
+    for old_state, new_state in changes:
+        if old_state is not None:
+            deltas.setdefault(old_state['user_id'], Counter()).subtract(_contribution(old_state))
+            if (due_date := _pending_due_date(old_state)) is not None:
+                due_deltas.setdefault(old_state['user_id'], Counter())[due_date] -= 1
+        if new_state is not None:
+            deltas.setdefault(new_state['user_id'], Counter()).update(_contribution(new_state))
+            if (due_date := _pending_due_date(new_state)) is not None:
+                due_deltas.setdefault(new_state['user_id'], Counter())[due_date] += 1
+            created_for.add(new_state['user_id'])
+        old_category, new_category = _open_category(old_state), _open_category(new_state)
+        if old_category != new_category:
+            if old_category is not None:
+                category_deltas[old_category] -= 1
+                category_owners[old_category] = old_state['user_id']
+            if new_category is not None:
+                category_deltas[new_category] += 1
+                category_owners[new_category] = new_state['user_id']
+
+    rebuilt = set()
+    for user_id, counts in deltas.items():
+        fields = {field: F(field) + delta for field, delta in counts.items() if delta}
+        due_dates = {due_date: delta for due_date, delta in due_deltas.get(user_id, {}).items() if delta}
+        if due_dates:
+            fields.update(_time_bucket_updates(due_dates))
+        if fields and not TaskStats.objects.filter(user_id=user_id).update(**fields) and user_id in created_for:
+            # La reconstruction inclut déjà les compteurs des catégories
+            rebuild(user_id)
+            rebuilt.add(user_id)
+
+    category_deltas = {
+        category_id: delta for category_id, delta in category_deltas.items()
+        if delta and category_owners[category_id] not in rebuilt
+    }
+    if category_deltas:
+        Category.objects.filter(id__in=category_deltas).update(open_task_count=F('open_task_count') + Case(
+            *(When(id=category_id, then=Value(delta)) for category_id, delta in category_deltas.items()),
+            default=Value(0),
+        ))
+
+
+def apply_category_change(user_id, delta):
+    updated = TaskStats.objects.filter(user_id=user_id).update(total_categories=F('total_categories') + delta)
+    if not updated and delta > 0:
+        rebuild(user_id)
+
+
+def _time_bucket_aggregates(now):
+    pending = Q(is_completed=False)
+    return {
+        'overdue_tasks': Count('id', filter=pending & Q(due_date__lt=now)),
+        'upcoming_tasks': Count('id', filter=pending & Q(due_date__gte=now, due_date__lte=now + UPCOMING_WINDOW)),
+    }
+
+
+def rebuild(user_id):
+    """Recalcule entièrement les statistiques d'un utilisateur."""
+    now = timezone.now()
+    pending = Q(is_completed=False)
+    values = Task.objects.filter(user_id=user_id).aggregate(
+        total_tasks=Count('id'),
+        completed_tasks=Count('id', filter=Q(is_completed=True)),
+        **{field: Count('id', filter=pending & Q(priority=priority)) for priority, field in PRIORITY_FIELDS.items()},
+        **_time_bucket_aggregates(now),
+    )
+    values['total_categories'] = Category.objects.filter(user_id=user_id).count()
+    open_tasks = (
+        Task.objects.filter(category=OuterRef('pk'), is_completed=False)
+        .order_by()
+        .values('category')
+        .annotate(count=Count('id'))
+        .values('count')
+    )
+    Category.objects.filter(user_id=user_id).update(open_task_count=Coalesce(Subquery(open_tasks), 0))
+    stats, _created = TaskStats.objects.update_or_create(user_id=user_id, defaults={**values, 'refreshed_at': now})
+    return stats
+
+
+def get_stats(user):
+    """Statistiques de l'utilisateur, reconstruites si elles n'existent pas encore."""
+    try:
+        return TaskStats.objects.get(user=user)
+    except TaskStats.DoesNotExist:
+        return rebuild(user.pk)
+
+
+def refresh_time_buckets():
+    """
+    Recalcule les compteurs temporels de tous les utilisateurs, en une requête
+    groupée sur les seules tâches en attente échues ou proches de l'échéance.
+    """
+    now = timezone.now()
+    buckets = {
+        row['user_id']: row
+        for row in Task.objects.filter(is_completed=False, due_date__lte=now + UPCOMING_WINDOW)
+        .order_by()
+        .values('user_id')
+        .annotate(**_time_bucket_aggregates(now))
+    }
+    TaskStats.objects.exclude(user_id__in=buckets).update(overdue_tasks=0, upcoming_tasks=0, refreshed_at=now)
+    stats = list(TaskStats.objects.filter(user_id__in=buckets))
+    for row in stats:
+        row.overdue_tasks = buckets[row.user_id]['overdue_tasks']
+        row.upcoming_tasks = buckets[row.user_id]['upcoming_tasks']
+        row.refreshed_at = now
+    TaskStats.objects.bulk_update(stats, ['overdue_tasks', 'upcoming_tasks', 'refreshed_at'], batch_size=1000)
+    return len(stats)
@@ -1,45 +1,202 @@
+import logging
+from datetime import timedelta
+
 from celery import shared_task
-from django.core.mail import send_mail
+from django.conf import settings
+from django.core.mail import EmailMessage
+from django.core.mail import get_connection
+from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone
-from .models import Task
+from . import delta_sync
+from . import imports
+from . import reminder_index
+from . import response_cache
+from . import stats
+from .models import OutboxEmail, Task
+
+logger = logging.getLogger(__name__)
+
+
+def _reminder_message(task, connection):
+    return EmailMessage(
+        'Rappel de tâche',
+        f'Rappel : Votre tâche "{task.title}" est due ou en retard. Description : {task.description[:50]}... Date d\'échéance : {task.due_date}.',
+        'votre_email_expéditeur@example.com',
+        [task.user.email],
+        connection=connection,
+    )
+
+
+def _send_reminders(tasks):
+    """
+    Envoie les rappels d'un lot de tâches sur une seule connexion SMTP, puis marque
+    en une seule requête celles dont l'envoi a réussi. Retourne les ids rappelés.
+    """
+    sent = []
+    try:
+        with get_connection() as connection:
+            for task in tasks:
+                try:
+                    _reminder_message(task, connection).send()
+                except Exception as e:
+                    logger.warning("Erreur envoi rappel pour tâche %s : %s", task.id, e)
+                else:
+                    sent.append(task.id)
+    except Exception as e:
+        # Connexion impossible : le lot sera repris au prochain balayage
+        logger.warning("Connexion SMTP impossible pour les rappels : %s", e)
+    if sent:
+        Task.objects.filter(id__in=sent).update(is_reminded=True, updated_at=timezone.now())
+        # `update()` n'émet pas de signal : les réponses en cache exposent is_reminded
+        sent_ids = set(sent)
+        for user_id in {task.user_id for task in tasks if task.id in sent_ids}:
+            response_cache.invalidate(user_id)
+    return sent
+
+
+def _claim_and_send(pending):
+    """
+    Verrouille les tâches de `pending` (SKIP LOCKED) et envoie leurs rappels dans
+    la même transaction. Le balayage horaire et le répartiteur peuvent viser les
+    mêmes tâches : l'un passe les lignes verrouillées par l'autre, puis les voit
+    rappelées une fois la transaction validée. Retourne (tâches réclamées, ids rappelés).
+    """
+    with transaction.atomic():
+        tasks = list(pending.select_for_update(skip_locked=True, of=('self',)))
+        return tasks, _send_reminders(tasks) if tasks else []
+
+
+def _due_reminders(now):
+    return (
+        Task.objects.filter(is_completed=False, is_reminded=False, due_date__lte=now)
+        .select_related('user')
+        .only('id', 'title', 'description', 'due_date', 'user__email')
+    )
+
 
 @shared_task
 def send_reminder(task_id=None):
     now = timezone.now()
     if task_id:
         # Handle single task
-        try:
-            task = Task.objects.get(id=task_id, is_completed=False, is_reminded=False, due_date__lte=now)
-            send_mail(
-                'Rappel de tâche',
-                f'Rappel : Votre tâche "{task.title}" est due ou en retard. Description : {task.description[:50]}... Date d\'échéance : {task.due_date}.',
-                'votre_email_expéditeur@example.com',
-                [task.user.email],
-                fail_silently=False,
-            )
-            task.is_reminded = True
-            task.save()
-        except Task.DoesNotExist:
-            print(f"Tâche {task_id} non trouvée ou ne nécessite pas de rappel.")
-        except Exception as e:
-            print(f"Erreur envoi rappel pour tâche {task_id} : {e}")
-    else:
-        # Batch mode (as before)
-        tasks = Task.objects.filter(
-            is_completed=False,
-            is_reminded=False,
-            due_date__lte=now
-        )
+        tasks, sent = _claim_and_send(_due_reminders(now).filter(id=task_id))
+        if not tasks:
+            logger.info("Tâche %s non trouvée, déjà en cours de rappel ou sans rappel à envoyer.", task_id)
+        return len(sent)
+
+    # Batch mode : parcours par lots bornés, dans l'ordre de l'index partiel
+    # (due_date, id). Les tâches en échec restent à rappeler mais sont dépassées
+    # par le curseur, ce qui garantit la terminaison du balayage.
+    batch_size = settings.REMINDER_BATCH_SIZE
+    pending = _due_reminders(now).order_by('due_date', 'id')
+    reminded = 0
+    last = None
+    while True:
+        chunk = pending
+        if last is not None:
+            chunk = chunk.filter(Q(due_date__gt=last.due_date) | Q(due_date=last.due_date, id__gt=last.id))
+        chunk, sent = _claim_and_send(chunk[:batch_size])
+        if not chunk:
+            break
+        reminded += len(sent)
+        last = chunk[-1]
+    return reminded
+
+
+@shared_task
+def dispatch_due_reminders():
+    """
+    Répartiteur léger : retire de l'index Redis uniquement les rappels échus et
+    les envoie. Les envois en échec sont replanifiés après REMINDER_RETRY_DELAY.
+    """
+    batch_size = settings.REMINDER_BATCH_SIZE
+    reminded = 0
+    while True:
+        now = timezone.now()
+        task_ids = reminder_index.pop_due(now, batch_size)
+        if not task_ids:
+            break
+        tasks, sent = _claim_and_send(_due_reminders(now).filter(id__in=task_ids))
+        sent = set(sent)
+        retry_at = now + timedelta(seconds=settings.REMINDER_RETRY_DELAY)
         for task in tasks:
+            if task.id not in sent:
+                reminder_index.schedule(task.id, retry_at)
+        reminded += len(sent)
+        if len(task_ids) < batch_size:
+            break
+    return reminded
+
+
+@shared_task(bind=True, max_retries=5)
+def drain_email_outbox(self):
+    """
+    Envoie les emails en attente de l'outbox par lots, sur une seule connexion SMTP
+    par lot. Un email en échec est retenté plus tard avec un délai exponentiel ;
+    au-delà de EMAIL_OUTBOX_MAX_ATTEMPTS il est marqué en échec définitif.
+    Les lignes sont verrouillées avec SKIP LOCKED pour que plusieurs workers
+    puissent vider l'outbox en parallèle sans envoyer deux fois le même email.
+    """
+    batch_size = settings.EMAIL_OUTBOX_BATCH_SIZE
+    sent_count = 0
+    while True:
+        with transaction.atomic():
+            emails = list(
+                OutboxEmail.objects.select_for_update(skip_locked=True)
+                .filter(status=OutboxEmail.STATUS_PENDING, next_attempt_at__lte=timezone.now())
+                .order_by('next_attempt_at')[:batch_size]
+            )
+            if not emails:
+                break
+            connection = get_connection()
             try:
-                send_mail(
-                    'Rappel de tâche',
-                    f'Rappel : Votre tâche "{task.title}" est due ou en retard. Description : {task.description[:50]}... Date d\'échéance : {task.due_date}.',
-                    'votre_email_expéditeur@example.com',
-                    [task.user.email],
-                    fail_silently=False,
-                )
-                task.is_reminded = True
-                task.save()
-            except Exception as e:
-                print(f"Erreur envoi rappel pour tâche {task.id} : {e}")
\ No newline at end of file
+                connection.open()
+            except Exception as exc:
+                # Serveur SMTP injoignable : on retente toute la vidange plus tard
+                raise self.retry(exc=exc, countdown=settings.EMAIL_OUTBOX_RETRY_DELAY * 2 ** self.request.retries)
+            sent, failed = [], []
+            try:
+                for email in emails:
+                    message = EmailMessage(email.subject, email.body, settings.DEFAULT_FROM_EMAIL, [email.to], connection=connection)
+                    try:
+                        message.send()
+                    except Exception as exc:
+                        email.attempts += 1
+                        email.last_error = str(exc)
+                        if email.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+                            email.status = OutboxEmail.STATUS_FAILED
+                        else:
+                            delay = settings.EMAIL_OUTBOX_RETRY_DELAY * 2 ** (email.attempts - 1)
+                            email.next_attempt_at = timezone.now() + timedelta(seconds=delay)
+                        failed.append(email)
+                    else:
+                        sent.append(email.id)
+            finally:
+                connection.close()
+            OutboxEmail.objects.filter(id__in=sent).update(status=OutboxEmail.STATUS_SENT, sent_at=timezone.now())
+            OutboxEmail.objects.bulk_update(failed, ['attempts', 'last_error', 'status', 'next_attempt_at'])
+            for email in failed:
+                logger.warning("Erreur envoi email %s : %s", email.id, email.last_error)
+        sent_count += len(sent)
+        if len(emails) < batch_size:
+            break
+    return sent_count
+
+
+@shared_task
+def refresh_task_stats():
+    """Recalcule les compteurs "en retard" / "7 prochains jours" de TaskStats."""
+    return stats.refresh_time_buckets()
+
+
+@shared_task
+def purge_tombstones():
+    """Supprime les traces de suppression au-delà de la rétention de la synchronisation."""
+    return delta_sync.purge_tombstones()
+
+
+@shared_task
+def import_tasks(import_id):
+    """Traite un fichier déposé via /api/task-imports/ (voir imports.py)."""
+    return imports.run_import(import_id)
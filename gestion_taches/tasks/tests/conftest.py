@@ -0,0 +1,18 @@
+import pytest
+from rest_framework.test import APIClient
+
+from gestion_taches.tasks import reminder_index
+from gestion_taches.users.models import User
+
+
+@pytest.fixture
+def api_client(user: User) -> APIClient:
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def _reminder_index(monkeypatch):
+    # Index des rappels en mémoire, vidé pour chaque test
+    monkeypatch.setattr(reminder_index, "_client", reminder_index.LocalReminderIndex())
@@ -0,0 +1,26 @@
+from factory import Faker
+from factory import SubFactory
+from factory.django import DjangoModelFactory
+
+from gestion_taches.tasks.models import Category
+from gestion_taches.tasks.models import Task
+from gestion_taches.users.tests.factories import UserFactory
+
+
+class CategoryFactory(DjangoModelFactory[Category]):
+    user = SubFactory(UserFactory)
+    name = Faker("word")
+    description = Faker("sentence")
+
+    class Meta:
+        model = Category
+
+
+class TaskFactory(DjangoModelFactory[Task]):
+    user = SubFactory(UserFactory)
+    title = Faker("sentence", nb_words=4)
+    description = Faker("paragraph")
+    priority = Task.Priority.MEDIUM
+
+    class Meta:
+        model = Task
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+from django.core.management import CommandError
+from django.core.management import call_command
+
+from gestion_taches.tasks.benchmarks import compare
+from gestion_taches.tasks.management.commands.benchmark_api import SCENARIOS
+from gestion_taches.tasks.models import Task
+
+
+def _result(median_ms, queries=5):
+    return {"min_ms": median_ms, "median_ms": median_ms, "max_ms": median_ms, "runs": 1, "queries": queries}
+
+
+class TestCompare:
+    def test_slower_median_is_a_regression(self):
+        baseline = {"1000": {"api.list": _result(10), "dashboard_home": _result(10)}}
+        results = {"1000": {"api.list": _result(13), "dashboard_home": _result(11.9)}}
+
+        regressions = compare(results, baseline, threshold=0.2)
+
+        assert [(r["scenario"], r["ratio"]) for r in regressions] == [("api.list", 1.3)]
+
+    def test_extra_query_is_a_regression(self):
+        regressions = compare({"1000": {"api.list": _result(9, queries=6)}}, {"1000": {"api.list": _result(10)}}, 0.2)
+
+        assert regressions[0]["current_queries"] == 6
+
+    def test_new_sizes_and_scenarios_are_ignored(self):
+        baseline = {"1000": {"api.list": _result(10)}}
+        results = {"1000": {"api.search": _result(50)}, "100000": {"api.list": _result(50)}}
+
+        assert compare(results, baseline, threshold=0.2) == []
+
+
+@pytest.mark.django_db
+class TestBenchmarkApiCommand:
+    def test_writes_results_and_rolls_back(self, tmp_path):
+        output = tmp_path / "results.json"
+
+        call_command("benchmark_api", "--sizes", "100", "--repeat", "1", "--output", str(output))
+
+        report = json.loads(output.read_text())
+        assert set(report["results"]["100"]) == {*SCENARIOS, "send_reminder"}
+        assert report["results"]["100"]["api.list"]["queries"] > 0
+        assert not Task.objects.exists()
+
+    def test_compare_flags_regressions(self, tmp_path):
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps({"results": {"100": {"api.list": _result(0.001, queries=1)}}}))
+
+        with pytest.raises(CommandError, match="1 régression"):
+            call_command("benchmark_api", "--sizes", "100", "--repeat", "1", "--compare", str(baseline))
@@ -0,0 +1,154 @@
+from datetime import timedelta
+
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from gestion_taches.tasks import reminder_index
+from gestion_taches.tasks import stats
+from gestion_taches.tasks.models import Category
+from gestion_taches.tasks.models import OutboxEmail
+from gestion_taches.tasks.models import Task
+from gestion_taches.tasks.models import TaskStats
+from gestion_taches.tasks.stats import rebuild
+from gestion_taches.tasks.tests.factories import CategoryFactory
+from gestion_taches.tasks.tests.factories import TaskFactory
+from gestion_taches.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+URL = reverse("tasks:task-bulk")
+
+
+def _task_data(**kwargs):
+    data = {
+        "title": "Tâche",
+        "description": "Description",
+        "is_completed": False,
+        "priority": "medium",
+        "category": None,
+    }
+    data.update(kwargs)
+    return data
+
+
+def _assert_stats_consistent(user):
+    stats = TaskStats.objects.filter(user=user).values().get()
+    rebuild(user.pk)
+    assert stats | {"refreshed_at": None} == TaskStats.objects.filter(user=user).values().get() | {"refreshed_at": None}
+
+
+class TestBulkCreate:
+    def test_creates_all_tasks_with_one_notification(
+        self, api_client: APIClient, user: User, django_capture_on_commit_callbacks,
+    ):
+        category = CategoryFactory(user=user)
+        due = timezone.now() + timedelta(days=1)
+        payload = [
+            _task_data(title="A", category=category.pk, due_date=due.isoformat()),
+            _task_data(title="B", priority="high"),
+        ]
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.post(URL, payload, format="json")
+
+        assert response.status_code == 201
+        assert [item["title"] for item in response.data] == ["A", "B"]
+        assert Task.objects.filter(user=user).count() == 2
+        assert OutboxEmail.objects.count() == 1
+        assert Category.objects.get(pk=category.pk).open_task_count == 1
+        task = Task.objects.get(title="A")
+        assert reminder_index.pop_due(due + timedelta(seconds=1), 10) == [task.pk]
+        _assert_stats_consistent(user)
+
+    def test_accepts_string_category_ids(self, api_client: APIClient, user: User):
+        category = CategoryFactory(user=user)
+        payload = [_task_data(title="A", category=str(category.pk)), _task_data(title="B", category=True)]
+
+        response = api_client.post(URL, payload, format="json")
+        assert response.status_code == 400
+        assert "category" in response.data[1]
+
+        response = api_client.post(URL, payload[:1], format="json")
+        assert response.status_code == 201
+        assert Task.objects.get(title="A").category_id == category.pk
+
+    def test_rejects_other_users_category(self, api_client: APIClient):
+        foreign = CategoryFactory()
+        response = api_client.post(URL, [_task_data(), _task_data(category=foreign.pk)], format="json")
+
+        assert response.status_code == 400
+        assert "category" in response.data[1]
+        assert not Task.objects.exists()
+
+    @override_settings(TASK_BULK_MAX_ITEMS=2)
+    def test_rejects_oversized_or_empty_batch(self, api_client: APIClient):
+        assert api_client.post(URL, [_task_data()] * 3, format="json").status_code == 400
+        assert api_client.post(URL, [], format="json").status_code == 400
+        assert not Task.objects.exists()
+
+
+class TestBulkUpdate:
+    def test_partial_update(self, api_client: APIClient, user: User):
+        category = CategoryFactory(user=user)
+        first, second = TaskFactory.create_batch(2, user=user, is_completed=False, priority=Task.Priority.LOW, category=None)
+        payload = [
+            {"id": first.pk, "is_completed": True},
+            {"id": second.pk, "priority": "high", "category": category.pk},
+        ]
+        response = api_client.patch(URL, payload, format="json")
+
+        assert response.status_code == 200
+        first.refresh_from_db()
+        second.refresh_from_db()
+        assert first.is_completed
+        assert first.priority == Task.Priority.LOW
+        assert (second.priority, second.category_id) == (Task.Priority.HIGH, category.pk)
+        assert OutboxEmail.objects.count() == 1
+        _assert_stats_consistent(user)
+
+    def test_unknown_or_foreign_id_rejects_batch(self, api_client: APIClient, user: User):
+        own = TaskFactory(user=user, priority=Task.Priority.LOW)
+        foreign = TaskFactory()
+        payload = [{"id": own.pk, "priority": "high"}, {"id": foreign.pk, "priority": "high"}]
+        response = api_client.patch(URL, payload, format="json")
+
+        assert response.status_code == 400
+        own.refresh_from_db()
+        assert own.priority == Task.Priority.LOW
+
+
+class TestBulkDelete:
+    def test_deletes_only_own_tasks(self, api_client: APIClient, user: User):
+        own = TaskFactory.create_batch(3, user=user)
+        foreign = TaskFactory()
+        ids = [task.pk for task in own[:2]] + [foreign.pk]
+        response = api_client.delete(URL, {"ids": ids}, format="json")
+
+        assert response.status_code == 200
+        assert response.data == {"deleted": 2}
+        assert list(Task.objects.filter(user=user).values_list("id", flat=True)) == [own[2].pk]
+        assert Task.objects.filter(pk=foreign.pk).exists()
+        assert OutboxEmail.objects.count() == 1
+        _assert_stats_consistent(user)
+
+
+def test_bulk_writes_update_stats_incrementally(monkeypatch, api_client: APIClient, user: User):
+    first, second = CategoryFactory.create_batch(2, user=user)
+    TaskFactory.create_batch(3, user=user, category=first, is_completed=False)
+
+    def forbidden(user_id):
+        raise AssertionError("rebuild")
+
+    monkeypatch.setattr(stats, "rebuild", forbidden)
+    created = api_client.post(URL, [_task_data(category=first.pk), _task_data(category=second.pk)], format="json")
+    ids = [item["id"] for item in created.data]
+    changes = [{"id": ids[0], "category": second.pk}, {"id": ids[1], "is_completed": True}]
+    assert api_client.patch(URL, changes, format="json").status_code == 200
+    assert api_client.delete(URL, {"ids": [ids[0]]}, format="json").status_code == 200
+    monkeypatch.undo()
+
+    assert Category.objects.get(pk=first.pk).open_task_count == 3
+    assert Category.objects.get(pk=second.pk).open_task_count == 0
+    _assert_stats_consistent(user)
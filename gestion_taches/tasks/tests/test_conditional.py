@@ -0,0 +1,105 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from gestion_taches.tasks.models import Category
+from gestion_taches.tasks.tests.factories import CategoryFactory
+from gestion_taches.tasks.tests.factories import TaskFactory
+from gestion_taches.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def _revalidate(client, url, etag, **params):
+    return client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+
+
+class TestTaskListETag:
+    def test_not_modified_without_serialization(self, api_client: APIClient, user: User):
+        TaskFactory.create_batch(3, user=user)
+        url = reverse("tasks:task-list")
+        first = api_client.get(url)
+        assert first.status_code == 200
+        etag = first["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = _revalidate(api_client, url, etag)
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response["ETag"] == etag
+        # Seul l'agrégat touche la table des tâches : aucune ligne n'est chargée
+        task_queries = [q["sql"] for q in queries if "tasks_task" in q["sql"]]
+        assert len(task_queries) == 1
+        assert "MAX" in task_queries[0]
+
+    def test_changes_invalidate(self, api_client: APIClient, user: User):
+        tasks = TaskFactory.create_batch(2, user=user)
+        url = reverse("tasks:task-list")
+        etag = api_client.get(url)["ETag"]
+
+        tasks[0].title = "Nouveau titre"
+        tasks[0].save()
+        assert _revalidate(api_client, url, etag).status_code == 200
+        etag = api_client.get(url)["ETag"]
+
+        tasks[1].delete()
+        assert _revalidate(api_client, url, etag).status_code == 200
+        etag = api_client.get(url)["ETag"]
+
+        TaskFactory(user=user)
+        assert _revalidate(api_client, url, etag).status_code == 200
+
+    def test_etag_depends_on_query_and_user(self, api_client: APIClient, user: User):
+        TaskFactory.create_batch(2, user=user)
+        url = reverse("tasks:task-list")
+        etag = api_client.get(url)["ETag"]
+        assert _revalidate(api_client, url, etag, ordering="due_date").status_code == 200
+        assert _revalidate(api_client, url, f"W/{etag}").status_code == 304
+
+        other = APIClient()
+        other.force_authenticate(user=TaskFactory().user)
+        assert _revalidate(other, url, etag).status_code == 200
+
+    def test_retrieve(self, api_client: APIClient, user: User):
+        task = TaskFactory(user=user)
+        url = reverse("tasks:task-detail", args=[task.pk])
+        etag = api_client.get(url)["ETag"]
+        assert _revalidate(api_client, url, etag).status_code == 304
+
+        task.is_completed = not task.is_completed
+        task.save()
+        assert _revalidate(api_client, url, etag).status_code == 200
+
+    def test_expanded_category_rename_invalidates(self, api_client: APIClient, user: User):
+        category = CategoryFactory(user=user, name="Travail")
+        task = TaskFactory(user=user, category=category)
+        urls = [reverse("tasks:task-list"), reverse("tasks:task-detail", args=[task.pk])]
+        etags = [api_client.get(url, {"expand": "category"})["ETag"] for url in urls]
+        for url, etag in zip(urls, etags, strict=True):
+            assert _revalidate(api_client, url, etag, expand="category").status_code == 304
+
+        category.name = "Renommée"
+        category.save()
+
+        for url, etag in zip(urls, etags, strict=True):
+            response = _revalidate(api_client, url, etag, expand="category")
+            assert response.status_code == 200
+            assert "Renommée" in response.content.decode()
+        # Sans dépliage, la représentation des tâches n'a pas changé
+        assert _revalidate(api_client, urls[1], api_client.get(urls[1])["ETag"]).status_code == 304
+
+
+class TestCategoryListETag:
+    def test_rename_invalidates(self, api_client: APIClient, user: User):
+        category = CategoryFactory(user=user)
+        url = reverse("tasks:category-list")
+        etag = api_client.get(url)["ETag"]
+        assert _revalidate(api_client, url, etag).status_code == 304
+
+        before = category.updated_at
+        category.name = "Renommée"
+        category.save()
+        assert Category.objects.get(pk=category.pk).updated_at > before
+        assert _revalidate(api_client, url, etag).status_code == 200
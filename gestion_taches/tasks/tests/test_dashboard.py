@@ -0,0 +1,121 @@
+import json
+from datetime import timedelta
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from gestion_taches.tasks.models import Task
+from gestion_taches.tasks.pagination import KeysetCursorPagination
+from gestion_taches.tasks.tests.factories import CategoryFactory
+from gestion_taches.tasks.tests.factories import TaskFactory
+from gestion_taches.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def logged_client(client: Client, user: User) -> Client:
+    client.force_login(user)
+    return client
+
+
+class TestDashboardHome:
+    def test_context(self, user: User, logged_client: Client):
+        now = timezone.now()
+        work = CategoryFactory(user=user, name="Travail")
+        CategoryFactory(user=user, name="Maison")
+        TaskFactory(user=user, priority=Task.Priority.HIGH, category=work, due_date=now - timedelta(days=1))
+        TaskFactory(user=user, priority=Task.Priority.LOW, due_date=now + timedelta(days=2))
+        TaskFactory(user=user, priority=Task.Priority.HIGH, is_completed=True, category=work)
+        TaskFactory(priority=Task.Priority.HIGH)  # autre utilisateur
+
+        response = logged_client.get(reverse("tasks:dashboard"))
+
+        context = response.context
+        assert context["total_tasks"] == 3
+        assert context["completed_tasks"] == 1
+        assert context["pending_tasks"] == 2
+        assert context["overdue_tasks"] == 1
+        assert context["upcoming_tasks"] == 1
+        assert context["high_priority_tasks"] == 1
+        assert context["medium_priority_tasks"] == 0
+        assert context["low_priority_tasks"] == 1
+        assert context["total_categories"] == 2
+        assert [(c.name, c.task_count) for c in context["tasks_by_category"]] == [("Travail", 1), ("Maison", 0)]
+        assert len(context["recent_tasks"]) == 3
+
+    @pytest.mark.parametrize("size", [1, 50])
+    def test_query_count_is_constant(self, size, user: User, logged_client: Client, django_assert_num_queries):
+        categories = CategoryFactory.create_batch(3, user=user)
+        for i in range(size):
+            TaskFactory(user=user, category=categories[i % 3])
+
+        # savepoint ATOMIC_REQUESTS (x2), session + utilisateur, agrégat des tâches,
+        # catégories, tâches récentes
+        with django_assert_num_queries(7):
+            logged_client.get(reverse("tasks:dashboard"))
+
+
+def _page_data(response, element_id):
+    content = response.content.decode()
+    start = content.index(f'id="{element_id}"')
+    start = content.index(">", start) + 1
+    return json.loads(content[start:content.index("</script>", start)])
+
+
+def _follow(client, url):
+    rows = []
+    while url:
+        page = client.get(url, HTTP_ACCEPT="application/json").json()
+        rows += page["results"]
+        url = page["next"]
+    return rows
+
+
+class TestTaskDashboardPage:
+    def test_only_first_page_is_embedded(self, monkeypatch, user: User, logged_client: Client):
+        monkeypatch.setattr(KeysetCursorPagination, "page_size", 3)
+        category = CategoryFactory(user=user, name="Travail")
+        tasks = TaskFactory.create_batch(5, user=user, category=category)
+        TaskFactory()  # autre utilisateur
+        response = logged_client.get(reverse("tasks:task"))
+
+        assert response.status_code == 200
+        assert [row["id"] for row in response.context["tasks"]] == [task.pk for task in reversed(tasks)][:3]
+        page = _page_data(response, "task-page-data")
+        assert len(page["results"]) == 3
+        assert page["results"][0]["category_name"] == "Travail"
+        assert page["next"].startswith("http://testserver" + reverse("tasks:task_data"))
+
+        rows = page["results"] + _follow(logged_client, page["next"])
+        assert [row["id"] for row in rows] == [task.pk for task in reversed(tasks)]
+
+    def test_data_filters(self, user: User, logged_client: Client):
+        category = CategoryFactory(user=user)
+        report = TaskFactory(user=user, title="Rapport annuel", category=category)
+        done = TaskFactory(user=user, title="Courses", is_completed=True)
+        url = reverse("tasks:task_data")
+
+        assert [row["id"] for row in _follow(logged_client, f"{url}?search=rapport")] == [report.pk]
+        assert [row["id"] for row in _follow(logged_client, f"{url}?category={category.pk}")] == [report.pk]
+        assert [row["id"] for row in _follow(logged_client, f"{url}?category=none")] == [done.pk]
+        assert [row["id"] for row in _follow(logged_client, f"{url}?is_completed=true")] == [done.pk]
+
+    def test_data_requires_login(self, client: Client):
+        assert client.get(reverse("tasks:task_data")).status_code == 403
+
+
+class TestCategoryDashboardPage:
+    def test_only_first_page_is_embedded(self, monkeypatch, user: User, logged_client: Client):
+        monkeypatch.setattr(KeysetCursorPagination, "page_size", 2)
+        categories = CategoryFactory.create_batch(3, user=user)
+        CategoryFactory()
+        response = logged_client.get(reverse("tasks:category"))
+
+        page = _page_data(response, "category-page-data")
+        assert len(response.context["categories"]) == 2
+        rows = page["results"] + _follow(logged_client, page["next"])
+        assert [row["id"] for row in rows] == [category.pk for category in reversed(categories)]
+        assert [row["id"] for row in _follow(logged_client, reverse("tasks:category_data") + f"?search={categories[0].name}")] == [categories[0].pk]
@@ -0,0 +1,68 @@
+import csv
+import io
+import json
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from gestion_taches.tasks.tests.factories import TaskFactory
+from gestion_taches.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+URL = reverse("tasks:task-export")
+
+
+def _content(response):
+    assert response.streaming
+    return b"".join(response.streaming_content).decode()
+
+
+def _listed(client, **params):
+    return client.get(reverse("tasks:task-list"), {"page_size": 500, **params}).data["results"]
+
+
+@pytest.fixture(autouse=True)
+def _small_chunks(settings):
+    # Plusieurs paquets du curseur serveur même avec peu de tâches
+    settings.TASK_EXPORT_CHUNK_SIZE = 2
+
+
+class TestExport:
+    def test_ndjson_matches_list(self, api_client: APIClient, user: User):
+        TaskFactory.create_batch(5, user=user)
+        TaskFactory()
+        response = api_client.get(URL)
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert 'filename="tasks.ndjson"' in response["Content-Disposition"]
+        rows = [json.loads(line) for line in _content(response).splitlines()]
+        assert rows == [dict(item) for item in _listed(api_client)]
+
+    def test_csv(self, api_client: APIClient, user: User):
+        tasks = TaskFactory.create_batch(3, user=user, due_date=None)
+        response = api_client.get(URL, {"output": "csv"})
+
+        assert response["Content-Type"] == "text/csv; charset=utf-8"
+        rows = list(csv.DictReader(io.StringIO(_content(response))))
+        assert [int(row["id"]) for row in rows] == [task.pk for task in reversed(tasks)]
+        assert {row["due_date"] for row in rows} == {""}
+        assert rows[0]["title"] == tasks[-1].title
+
+    def test_same_search_and_ordering_as_list(self, api_client: APIClient, user: User):
+        now = timezone.now()
+        for days in (3, 1, 2):
+            TaskFactory(user=user, title=f"Rapport {days}", due_date=now + timedelta(days=days))
+        TaskFactory(user=user, title="Courses")
+        params = {"search": "rapport", "ordering": "-due_date"}
+        rows = [json.loads(line) for line in _content(api_client.get(URL, params)).splitlines()]
+
+        assert [row["id"] for row in rows] == [item["id"] for item in _listed(api_client, **params)]
+        assert [row["title"] for row in rows] == ["Rapport 3", "Rapport 2", "Rapport 1"]
+
+    def test_unknown_format(self, api_client: APIClient):
+        assert api_client.get(URL, {"output": "xml"}).status_code == 400
@@ -0,0 +1,113 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from gestion_taches.tasks.models import Task
+from gestion_taches.tasks.tests.factories import CategoryFactory
+from gestion_taches.tasks.tests.factories import TaskFactory
+from gestion_taches.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+URL = reverse("tasks:task-list")
+
+
+def _ids(client, **params):
+    response = client.get(URL, {"page_size": 500, **params})
+    assert response.status_code == 200, response.data
+    return sorted(item["id"] for item in response.data["results"])
+
+
+def _pks(*tasks):
+    return sorted(task.pk for task in tasks)
+
+
+class TestTaskFilters:
+    def test_status_and_reminder(self, api_client: APIClient, user: User):
+        done = TaskFactory(user=user, is_completed=True)
+        reminded = TaskFactory(user=user, is_reminded=True)
+        pending = TaskFactory(user=user)
+
+        assert _ids(api_client, is_completed="true") == _pks(done)
+        assert _ids(api_client, is_completed="false") == _pks(reminded, pending)
+        assert _ids(api_client, is_reminded="1") == _pks(reminded)
+
+    def test_priorities(self, api_client: APIClient, user: User):
+        low, medium, high = (TaskFactory(user=user, priority=p) for p in Task.Priority)
+
+        assert _ids(api_client, priority="high") == _pks(high)
+        assert _ids(api_client, priority="high, low") == _pks(low, high)
+        assert medium.pk not in _ids(api_client, priority="low")
+
+    def test_categories(self, api_client: APIClient, user: User):
+        work, home = CategoryFactory(user=user), CategoryFactory(user=user)
+        in_work, in_home, without = (TaskFactory(user=user, category=c) for c in (work, home, None))
+
+        assert _ids(api_client, category=str(work.pk)) == _pks(in_work)
+        assert _ids(api_client, category=f"{work.pk},{home.pk}") == _pks(in_work, in_home)
+        assert _ids(api_client, category="none") == _pks(without)
+        assert _ids(api_client, category=f"none,{home.pk}") == _pks(in_home, without)
+
+    def test_date_ranges(self, api_client: APIClient, user: User):
+        now = timezone.now()
+        soon = TaskFactory(user=user, due_date=now + timedelta(days=2))
+        later = TaskFactory(user=user, due_date=now + timedelta(days=10))
+        TaskFactory(user=user, due_date=None)
+        Task.objects.filter(pk=later.pk).update(created_at=now - timedelta(days=30))
+
+        week = {"due_date_after": now.isoformat(), "due_date_before": (now + timedelta(days=7)).isoformat()}
+        assert _ids(api_client, **week) == _pks(soon)
+        assert _ids(api_client, due_date_after=(now + timedelta(days=5)).isoformat()) == _pks(later)
+        assert later.pk not in _ids(api_client, created_at_after=(now - timedelta(days=1)).isoformat())
+        assert _ids(api_client, created_at_before=(now - timedelta(days=1)).isoformat()) == _pks(later)
+
+    def test_overdue(self, api_client: APIClient, user: User):
+        past = timezone.now() - timedelta(days=1)
+        overdue = TaskFactory(user=user, due_date=past)
+        done_late = TaskFactory(user=user, due_date=past, is_completed=True)
+        undated = TaskFactory(user=user, due_date=None)
+        upcoming = TaskFactory(user=user, due_date=timezone.now() + timedelta(days=1))
+
+        assert _ids(api_client, overdue="true") == _pks(overdue)
+        assert _ids(api_client, overdue="false") == _pks(done_late, undated, upcoming)
+
+    def test_combined_with_search_and_other_users(self, api_client: APIClient, user: User):
+        work = CategoryFactory(user=user)
+        now = timezone.now()
+        wanted = TaskFactory(user=user, title="Rapport", priority=Task.Priority.HIGH, category=work, due_date=now + timedelta(days=3))
+        TaskFactory(user=user, title="Rapport", priority=Task.Priority.HIGH, category=work, due_date=now + timedelta(days=3), is_completed=True)
+        TaskFactory(user=user, title="Rapport", priority=Task.Priority.LOW, category=work, due_date=now + timedelta(days=3))
+        TaskFactory(title="Rapport", priority=Task.Priority.HIGH, due_date=now + timedelta(days=3))
+        params = {
+            "is_completed": "false",
+            "priority": "high",
+            "category": str(work.pk),
+            "due_date_after": now.isoformat(),
+            "due_date_before": (now + timedelta(days=7)).isoformat(),
+        }
+
+        assert _ids(api_client, **params) == _pks(wanted)
+        assert _ids(api_client, search="rapport", **params) == _pks(wanted)
+
+    def test_empty_parameters_are_ignored(self, api_client: APIClient, user: User):
+        tasks = TaskFactory.create_batch(2, user=user)
+        assert _ids(api_client, is_completed="", category="") == _pks(*tasks)
+
+    @pytest.mark.parametrize(
+        "params",
+        [{"is_completed": "peut-être"}, {"priority": "urgent"}, {"category": "abc"}, {"due_date_after": "demain"}],
+    )
+    def test_invalid_values(self, api_client: APIClient, params):
+        response = api_client.get(URL, params)
+        assert response.status_code == 400
+        assert set(response.data) == set(params)
+
+    def test_export_uses_same_filters(self, api_client: APIClient, user: User):
+        TaskFactory(user=user, priority=Task.Priority.LOW)
+        high = TaskFactory(user=user, priority=Task.Priority.HIGH)
+        content = b"".join(api_client.get(reverse("tasks:task-export"), {"priority": "high"}).streaming_content)
+        assert len(content.splitlines()) == 1
+        assert f'"id":{high.pk},'.encode() in content
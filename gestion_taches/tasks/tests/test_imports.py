@@ -0,0 +1,121 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from gestion_taches.tasks import imports
+from gestion_taches.tasks.imports import run_import
+from gestion_taches.tasks.models import Category
+from gestion_taches.tasks.models import Task
+from gestion_taches.tasks.models import TaskImport
+from gestion_taches.tasks.models import TaskStats
+from gestion_taches.tasks.tests.factories import CategoryFactory
+from gestion_taches.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+URL = reverse("tasks:taskimport-list")
+
+
+@pytest.fixture(autouse=True)
+def _import_settings(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path / "media"
+    settings.TASK_IMPORT_ROOT = tmp_path / "imports"
+    # Plusieurs lots même avec un petit fichier
+    settings.TASK_IMPORT_BATCH_SIZE = 2
+
+
+def _stored_files(root):
+    return [path for path in root.rglob("*") if path.is_file()]
+
+
+def _upload(client, name, content, django_capture_on_commit_callbacks, **data):
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(URL, {"file": SimpleUploadedFile(name, content.encode()), **data}, format="multipart")
+    assert response.status_code == 202, response.data
+    return client.get(reverse("tasks:taskimport-detail", args=[response.data["id"]])).data
+
+
+class TestTaskImport:
+    def test_csv_import(self, api_client: APIClient, user: User, django_capture_on_commit_callbacks):
+        work = CategoryFactory(user=user, name="Travail")
+        CategoryFactory(name="Maison")  # même nom chez un autre utilisateur
+        content = (
+            "title,description,due_date,priority,is_completed,category\n"
+            "Rapport,Trimestriel,2030-01-15T09:00:00,high,false,Travail\n"
+            "Courses,,,low,,Maison\n"
+            ",Sans titre,,,,\n"
+            "Ménage,,,urgent,,Maison\n"
+            "Jardin,,,,true,Maison\n"
+        )
+        status = _upload(api_client, "tasks.csv", content, django_capture_on_commit_callbacks)
+
+        assert status["status"] == TaskImport.STATUS_COMPLETED
+        assert status["progress"] == 100
+        assert (status["rows_processed"], status["created_count"], status["error_count"]) == (5, 3, 2)
+        assert [error["line"] for error in status["errors"]] == [4, 5]
+        assert "priority" in status["errors"][1]["errors"]
+
+        home = Category.objects.get(user=user, name="Maison")
+        assert Category.objects.filter(user=user).count() == 2
+        tasks = {task.title: task for task in Task.objects.filter(user=user)}
+        assert tasks["Rapport"].category_id == work.pk
+        assert (tasks["Rapport"].priority, tasks["Rapport"].due_date.year) == (Task.Priority.HIGH, 2030)
+        assert (tasks["Courses"].category_id, tasks["Courses"].priority) == (home.pk, Task.Priority.LOW)
+        assert tasks["Jardin"].is_completed
+        stats = TaskStats.objects.get(user=user)
+        assert (stats.total_tasks, stats.completed_tasks, stats.total_categories) == (3, 1, 2)
+        assert Category.objects.get(pk=home.pk).open_task_count == 1
+
+    def test_ndjson_import(self, api_client: APIClient, user: User, django_capture_on_commit_callbacks):
+        lines = [
+            json.dumps({"title": "Un", "category": "Projet"}),
+            "{pas du json",
+            "",
+            json.dumps(["liste"]),
+            json.dumps({"title": "Deux", "category": "Projet", "priority": "high"}),
+        ]
+        status = _upload(api_client, "export.jsonl", "\n".join(lines), django_capture_on_commit_callbacks)
+
+        assert (status["created_count"], status["error_count"]) == (2, 2)
+        assert [error["line"] for error in status["errors"]] == [2, 4]
+        assert Category.objects.filter(user=user, name="Projet").count() == 1
+        assert set(Task.objects.filter(user=user).values_list("category__name", flat=True)) == {"Projet"}
+
+    def test_format_required(self, api_client: APIClient, django_capture_on_commit_callbacks):
+        response = api_client.post(URL, {"file": SimpleUploadedFile("tasks.txt", b"x")}, format="multipart")
+        assert response.status_code == 400
+        status = _upload(api_client, "tasks.txt", "title\nUn\n", django_capture_on_commit_callbacks, file_format="csv")
+        assert status["created_count"] == 1
+
+    def test_imports_are_private(self, api_client: APIClient, django_capture_on_commit_callbacks):
+        status = _upload(api_client, "tasks.csv", "title\nUn\n", django_capture_on_commit_callbacks)
+        other = APIClient()
+        other.force_authenticate(user=CategoryFactory().user)
+        assert other.get(reverse("tasks:taskimport-detail", args=[status["id"]])).status_code == 404
+
+    def test_file_is_private_and_deleted(self, settings, api_client: APIClient):
+        response = api_client.post(URL, {"file": SimpleUploadedFile("clients.csv", b"title\nUn\n")}, format="multipart")
+        task_import = TaskImport.objects.get(pk=response.data["id"])
+
+        (stored,) = _stored_files(settings.TASK_IMPORT_ROOT)
+        assert "clients" not in stored.name
+        assert stored.suffix == ".csv"
+        assert not settings.MEDIA_ROOT.exists()
+        with pytest.raises(ValueError, match="URL"):
+            task_import.file.url
+
+        run_import(task_import.pk)
+        assert not _stored_files(settings.TASK_IMPORT_ROOT)
+
+    def test_file_is_deleted_when_import_fails(self, settings, monkeypatch, api_client: APIClient):
+        monkeypatch.setattr(imports, "_import_batch", Mock(side_effect=RuntimeError("panne")))
+        response = api_client.post(URL, {"file": SimpleUploadedFile("tasks.csv", b"title\nUn\n")}, format="multipart")
+
+        run_import(response.data["id"])
+
+        assert TaskImport.objects.get(pk=response.data["id"]).status == TaskImport.STATUS_FAILED
+        assert not _stored_files(settings.TASK_IMPORT_ROOT)
@@ -0,0 +1,150 @@
+import json
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.db.models import Count
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from gestion_taches.tasks.filters import TaskFilter
+from gestion_taches.tasks.models import Task
+from gestion_taches.tasks.pagination import KeysetCursorPagination
+from gestion_taches.tasks.tests.factories import CategoryFactory
+from gestion_taches.tasks.tests.factories import TaskFactory
+from gestion_taches.tasks.views.task_views import TaskViewSet
+from gestion_taches.users.models import User
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.skipif(connection.vendor != "postgresql", reason="EXPLAIN PostgreSQL"),
+]
+
+
+def _page(queryset, params=None, after=None):
+    """
+    Requête d'une page telle que la construit KeysetCursorPagination : tri complété
+    par les champs de départage et, pour une page suivante, filtre du curseur
+    positionné sur la tâche `after`.
+    """
+    paginator = KeysetCursorPagination()
+    request = Request(APIRequestFactory().get("/api/tasks/", params or {}))
+    queryset = paginator.order_queryset(queryset, request, TaskViewSet())
+    if after is not None:
+        position = json.loads(paginator._get_position_from_instance(after, paginator.ordering))
+        queryset = queryset.filter(paginator._keyset_filter(position, reverse=False))
+    return queryset[:paginator.page_size + 1]
+
+
+@pytest.fixture
+def no_seqscan():
+    # Sur des tables presque vides le planificateur préfère toujours un seq scan
+    # suivi d'un tri ; on les pénalise pour vérifier quel index sert la requête.
+    with connection.cursor() as cursor:
+        for setting in ("enable_seqscan", "enable_bitmapscan", "enable_sort"):
+            cursor.execute(f"SET LOCAL {setting} = off")
+
+
+@pytest.mark.usefixtures("no_seqscan")
+class TestTaskIndexes:
+    def test_list_uses_user_created_index(self, user: User):
+        TaskFactory.create_batch(3, user=user)
+
+        plan = _page(Task.objects.filter(user=user)).explain()
+
+        assert "task_user_created_idx" in plan
+        assert "Sort" not in plan
+
+    def test_next_page_cursor_is_an_index_condition(self, user: User):
+        tasks = TaskFactory.create_batch(3, user=user)
+
+        plan = _page(Task.objects.filter(user=user), after=tasks[1]).explain()
+
+        assert "task_user_created_idx" in plan
+        assert "Index Cond: ((user_id = " in plan and "ROW(created_at, id) <" in plan
+        assert "Filter" not in plan
+
+    def test_overdue_uses_status_due_index(self, user: User):
+        plan = (
+            Task.objects.filter(user=user, is_completed=False, due_date__lt=timezone.now())
+            .order_by("due_date")
+            .explain()
+        )
+
+        assert "task_user_status_due_idx" in plan
+
+    def test_priority_counts_use_status_priority_index(self, user: User):
+        plan = (
+            Task.objects.filter(user=user, is_completed=False)
+            .values("priority")
+            .annotate(count=Count("id"))
+            .order_by("priority")
+            .explain()
+        )
+
+        assert "task_user_status_prio_due_idx" in plan
+
+    def test_reminder_sweep_uses_partial_index(self):
+        TaskFactory.create_batch(3, due_date=timezone.now() - timedelta(hours=1))
+
+        plan = (
+            Task.objects.filter(is_completed=False, is_reminded=False, due_date__lte=timezone.now())
+            .order_by("due_date")
+            .explain()
+        )
+
+        assert "task_pending_reminder_idx" in plan
+
+
+def _filtered(user, **params):
+    """Tâches de `user` filtrées par TaskFilter avec les paramètres de requête `params`."""
+    request = Request(APIRequestFactory().get("/api/tasks/", params))
+    return TaskFilter().filter_queryset(request, Task.objects.filter(user=user), view=None)
+
+
+@pytest.fixture
+def populated(user: User):
+    """Assez de tâches, avec statistiques à jour, pour que le planificateur choisisse par sélectivité."""
+    categories = CategoryFactory.create_batch(10, user=user)
+    Task.objects.bulk_create(
+        Task(user=user, title=f"Tâche {i}", priority=tuple(Task.Priority)[i % 3],
+             is_completed=i % 2 == 0, category=categories[i % 10])
+        for i in range(2000)
+    )
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE tasks_task")
+    return categories
+
+
+@pytest.mark.usefixtures("populated", "no_seqscan")
+class TestTaskFilterIndexes:
+    def test_overdue_uses_status_due_index(self, user: User):
+        plan = _filtered(user, overdue="true").order_by("due_date").explain()
+        assert "task_user_status_due_idx" in plan
+
+    def test_due_range_uses_status_due_index(self, user: User):
+        now = timezone.now()
+        params = {"is_completed": "false", "due_date_after": now.isoformat(), "due_date_before": (now + timedelta(days=7)).isoformat()}
+        plan = _filtered(user, **params).order_by("due_date").explain()
+        assert "task_user_status_due_idx" in plan
+
+    def test_priority_uses_status_priority_index(self, user: User):
+        plan = _filtered(user, is_completed="false", priority="high,low").order_by("priority").explain()
+        assert "task_user_status_prio_due_idx" in plan
+
+    def test_most_urgent_first_is_an_index_scan(self, user: User):
+        plan = _page(_filtered(user, is_completed="false"), {"ordering": "-priority,due_date"}).explain()
+        assert "task_user_status_prio_due_idx" in plan
+        # L'index fournit l'ordre ; seuls les ex aequo sont triés sur (created_at, id)
+        assert "Presorted Key: priority, due_date" in plan
+
+    def test_created_range_uses_created_index(self, user: User):
+        since = (timezone.now() - timedelta(days=7)).isoformat()
+        plan = _page(_filtered(user, created_at_after=since)).explain()
+        assert "task_user_created_idx" in plan
+
+    def test_category_page_uses_category_index(self, user: User, populated):
+        plan = _page(_filtered(user, category=str(populated[0].pk))).explain()
+        assert "task_category_created_idx" in plan
+        assert "Sort" not in plan
@@ -0,0 +1,116 @@
+import logging
+import re
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from gestion_taches.tasks import instrumentation
+from gestion_taches.tasks.instrumentation import RequestMetrics
+from gestion_taches.tasks.instrumentation import activate
+from gestion_taches.tasks.instrumentation import measure
+from gestion_taches.tasks.instrumentation import normalize_sql
+from gestion_taches.tasks.tests.factories import TaskFactory
+from gestion_taches.users.models import User
+
+
+class TestNormalizeSql:
+    @pytest.mark.parametrize(
+        ("sql", "expected"),
+        [
+            (
+                'SELECT "tasks_task"."id" FROM "tasks_task" WHERE "tasks_task"."user_id" = %s LIMIT 21',
+                'SELECT "tasks_task"."id" FROM "tasks_task" WHERE "tasks_task"."user_id" = ? LIMIT ?',
+            ),
+            (
+                "SELECT * FROM t WHERE title = 'l''été' AND id IN (1, 2, 3)",
+                "SELECT * FROM t WHERE title = ? AND id IN (...)",
+            ),
+            ("SELECT * FROM t WHERE id IN (%s,\n   %s)", "SELECT * FROM t WHERE id IN (...)"),
+            ('INSERT INTO "t" ("a", "b") VALUES (%s, %s), (%s, %s)', 'INSERT INTO "t" ("a", "b") VALUES (...)'),
+            ('SELECT "tasks_task"."title2" FROM t2', 'SELECT "tasks_task"."title2" FROM t2'),
+        ],
+    )
+    def test_values_are_replaced(self, sql, expected):
+        assert normalize_sql(sql) == expected
+
+    def test_n_plus_one_has_one_form(self):
+        metrics = RequestMetrics()
+        for pk in range(3):
+            metrics.execute_wrapper(lambda *args: None, f"SELECT * FROM t WHERE id = {pk}", None, False, {})
+
+        assert metrics.queries == 3
+        assert [(sql, count) for sql, count, _ in metrics.top_statements(5)] == [("SELECT * FROM t WHERE id = ?", 3)]
+
+    def test_normalization_is_deferred(self, monkeypatch):
+        metrics = RequestMetrics()
+        for _ in range(2):
+            metrics.execute_wrapper(lambda *args: None, "SELECT * FROM t WHERE id = %s", (1,), False, {})
+        calls = []
+        monkeypatch.setattr(instrumentation, "normalize_sql", lambda sql: calls.append(sql) or sql)
+
+        metrics.execute_wrapper(lambda *args: None, "SELECT * FROM t WHERE id = %s", (2,), False, {})
+        assert calls == []
+        assert metrics.top_statements(5)[0][:2] == ("SELECT * FROM t WHERE id = %s", 3)
+        assert calls == ["SELECT * FROM t WHERE id = %s"]
+
+
+class TestMeasure:
+    def test_outside_request_is_noop(self):
+        with measure("serialize"):
+            pass
+
+    def test_adds_to_current_request(self):
+        with activate(RequestMetrics()) as metrics:
+            with measure("serialize"):
+                pass
+            with measure("serialize"):
+                pass
+
+        assert set(metrics.timings) == {"serialize"}
+        assert metrics.timings["serialize"] > 0
+
+
+@pytest.mark.django_db
+class TestRequestMetricsMiddleware:
+    def test_server_timing_header(self, settings, user: User, api_client: APIClient):
+        settings.SERVER_TIMING_HEADER = True
+        TaskFactory.create_batch(3, user=user)
+
+        response = api_client.get(reverse("tasks:task-list"))
+
+        header = response["Server-Timing"]
+        assert re.fullmatch(r'total;dur=[\d.]+, db;dur=[\d.]+;desc="\d+ SQL", serialize;dur=[\d.]+', header)
+        assert int(re.search(r'desc="(\d+) SQL"', header).group(1)) >= 1
+
+    def test_header_can_be_disabled(self, settings, api_client: APIClient):
+        settings.SERVER_TIMING_HEADER = False
+
+        response = api_client.get(reverse("tasks:task-list"))
+
+        assert not response.has_header("Server-Timing")
+
+    def test_slow_request_logs_top_queries(self, settings, monkeypatch, user: User, api_client: APIClient, caplog):
+        monkeypatch.setattr(RequestMetrics, "elapsed", lambda self: 2.5)
+        settings.SLOW_REQUEST_THRESHOLD_MS = 2000
+        settings.SLOW_REQUEST_TOP_QUERIES = 2
+        TaskFactory.create_batch(3, user=user)
+
+        with caplog.at_level(logging.WARNING, logger="gestion_taches.tasks.middleware"):
+            api_client.get(reverse("tasks:task-list"))
+
+        (record,) = caplog.records
+        message = record.getMessage()
+        assert message.startswith("Requête lente GET /api/tasks/ (200) : 2500.0 ms")
+        statements = message.splitlines()[1:]
+        assert len(statements) == 2
+        assert all(re.match(r"\s*\d+ x\s+[\d.]+ ms  SELECT ", line) for line in statements)
+        assert "%s" not in message
+
+    def test_fast_request_is_not_logged(self, settings, api_client: APIClient, caplog):
+        settings.SLOW_REQUEST_THRESHOLD_MS = 0
+
+        with caplog.at_level(logging.WARNING, logger="gestion_taches.tasks.middleware"):
+            api_client.get(reverse("tasks:task-list"))
+
+        assert not caplog.records
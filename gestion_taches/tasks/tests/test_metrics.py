@@ -0,0 +1,155 @@
+import os
+import subprocess
+import sys
+import textwrap
+from datetime import timedelta
+
+import pytest
+from django.conf import settings as django_settings
+from django.urls import reverse
+from django.utils import timezone
+from prometheus_client import REGISTRY
+from prometheus_client.parser import text_string_to_metric_families
+from rest_framework.test import APIClient
+
+from gestion_taches.tasks import tasks
+from gestion_taches.tasks.tests.factories import TaskFactory
+from gestion_taches.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.fixture(autouse=True)
+def _metrics_token(settings):
+    settings.METRICS_TOKEN = "secret"
+
+
+def _scrape(client, Authorization="Bearer secret"):
+    response = client.get(reverse("metrics"), headers={"Authorization": Authorization})
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain")
+    return {
+        sample.name: sample.value
+        for family in text_string_to_metric_families(response.content.decode())
+        for sample in family.samples
+        if not sample.labels
+    }
+
+
+class TestHttpMetrics:
+    def test_latency_per_url_name(self, api_client: APIClient):
+        labels = {"view": "tasks:task-list", "method": "GET"}
+        before = _sample("http_request_duration_seconds_count", **labels)
+
+        api_client.get(reverse("tasks:task-list"))
+        api_client.get(reverse("tasks:task-list"), {"ordering": "due_date"})
+
+        assert _sample("http_request_duration_seconds_count", **labels) == before + 2
+        assert _sample("http_requests_in_progress") == 0
+
+    def test_unresolved_paths_share_one_series(self, client):
+        labels = {"view": "<unresolved>", "method": "GET"}
+        before = _sample("http_request_duration_seconds_count", **labels)
+
+        client.get("/introuvable/1/")
+        client.get("/introuvable/2/")
+
+        assert _sample("http_request_duration_seconds_count", **labels) == before + 2
+
+
+class TestMetricsEndpoint:
+    def test_reminder_backlog_gauges(self, client, user: User):
+        now = timezone.now()
+        TaskFactory(user=user, due_date=now - timedelta(hours=2))
+        TaskFactory(user=user, due_date=now - timedelta(minutes=5))
+        TaskFactory(user=user, due_date=now - timedelta(days=1), is_reminded=True)
+        TaskFactory(user=user, due_date=now - timedelta(days=1), is_completed=True)
+        TaskFactory(user=user, due_date=now + timedelta(days=1))
+
+        samples = _scrape(client)
+
+        assert samples["reminder_backlog_tasks"] == 2
+        assert 7200 <= samples["reminder_oldest_overdue_seconds"] < 7300
+
+    def test_empty_backlog(self, client):
+        samples = _scrape(client)
+
+        assert samples["reminder_backlog_tasks"] == 0
+        assert samples["reminder_oldest_overdue_seconds"] == 0
+
+    def test_token_required_when_configured(self, client):
+        assert client.get(reverse("metrics")).status_code == 403
+        assert client.get(reverse("metrics"), headers={"Authorization": "Bearer autre"}).status_code == 403
+        _scrape(client, Authorization="Bearer secret")
+
+    def test_hidden_without_token_outside_debug(self, settings, client):
+        settings.METRICS_TOKEN = ""
+
+        assert client.get(reverse("metrics")).status_code == 404
+        settings.DEBUG = True
+        assert client.get(reverse("metrics")).status_code == 200
+
+
+class TestCeleryMetrics:
+    def test_task_duration(self):
+        labels = {"task": tasks.send_reminder.name, "state": "SUCCESS"}
+        before = _sample("celery_task_duration_seconds_count", **labels)
+
+        tasks.send_reminder.apply()
+
+        assert _sample("celery_task_duration_seconds_count", **labels) == before + 1
+
+    def test_task_failure(self, monkeypatch):
+        def broken(now):
+            raise RuntimeError
+
+        monkeypatch.setattr(tasks, "_due_reminders", broken)
+        before = _sample("celery_task_failures_total", task=tasks.send_reminder.name)
+
+        result = tasks.send_reminder.apply()
+
+        assert result.failed()
+        assert _sample("celery_task_failures_total", task=tasks.send_reminder.name) == before + 1
+        assert _sample("celery_task_duration_seconds_count", task=tasks.send_reminder.name, state="FAILURE") >= 1
+
+
+# Un worker Celery prefork : la tâche s'exécute dans un processus fils, le serveur
+# de métriques tourne dans le processus principal
+CHILD_PROCESS_SCRIPT = textwrap.dedent("""
+    import multiprocessing
+
+    import django
+
+    django.setup()
+
+    from prometheus_client import generate_latest
+
+    from config.celery_app import app
+    from gestion_taches.tasks import metrics
+
+
+    @app.task(name="metrics-child-task")
+    def child_task():
+        return None
+
+
+    child = multiprocessing.get_context("fork").Process(target=child_task.apply)
+    child.start()
+    child.join()
+    print(generate_latest(metrics.process_registry()).decode())
+""")
+
+
+def test_child_process_metrics_are_exported(tmp_path):
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD_PROCESS_SCRIPT],
+        env=env, cwd=django_settings.BASE_DIR, capture_output=True, text=True, check=True, timeout=60,
+    )
+
+    assert 'celery_task_duration_seconds_count{state="SUCCESS",task="metrics-child-task"} 1.0' in result.stdout
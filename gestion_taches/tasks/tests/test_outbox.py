@@ -0,0 +1,88 @@
+from datetime import timedelta
+
+import pytest
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from gestion_taches.tasks.models import OutboxEmail
+from gestion_taches.tasks.notifications import queue_email
+from gestion_taches.tasks.tasks import drain_email_outbox
+from gestion_taches.tasks.tests.factories import TaskFactory
+from gestion_taches.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+class TestQueueing:
+    def test_api_create_queues_email_without_sending(self, user: User, api_client: APIClient):
+        response = api_client.post(
+            reverse("tasks:task-list"),
+            {"title": "Nouvelle tâche", "priority": "high", "is_completed": False, "category": None},
+            format="json",
+        )
+
+        assert response.status_code == 201
+        assert len(mail.outbox) == 0
+        email = OutboxEmail.objects.get()
+        assert email.to == user.email
+        assert email.subject == "Tâche créée avec succès"
+
+    def test_api_destroy_queues_email(self, user: User, api_client: APIClient):
+        task = TaskFactory(user=user)
+
+        api_client.delete(reverse("tasks:task-detail", args=[task.pk]))
+
+        assert OutboxEmail.objects.get().body == f'Votre tâche "{task.title}" a été supprimée.'
+
+    def test_drain_is_scheduled_on_commit(self, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks() as callbacks:
+            queue_email("Sujet", "Corps", "a@example.com")
+
+        assert len(callbacks) == 1
+
+
+class TestDrainEmailOutbox:
+    def test_sends_pending_emails_in_batches(self, settings):
+        settings.EMAIL_OUTBOX_BATCH_SIZE = 2
+        for i in range(5):
+            OutboxEmail.objects.create(subject=f"Sujet {i}", body="Corps", to=f"user{i}@example.com")
+
+        sent = drain_email_outbox()
+
+        assert sent == 5
+        assert len(mail.outbox) == 5
+        assert not OutboxEmail.objects.exclude(status=OutboxEmail.STATUS_SENT).exists()
+
+    def test_skips_emails_not_yet_due(self):
+        OutboxEmail.objects.create(
+            subject="Plus tard", body="Corps", to="a@example.com",
+            next_attempt_at=timezone.now() + timedelta(minutes=5),
+        )
+
+        assert drain_email_outbox() == 0
+        assert len(mail.outbox) == 0
+
+    def test_failure_backs_off_then_gives_up(self, settings, monkeypatch):
+        settings.EMAIL_OUTBOX_MAX_ATTEMPTS = 2
+        settings.EMAIL_OUTBOX_RETRY_DELAY = 60
+
+        def refuse(self, messages):
+            raise OSError("SMTP indisponible")
+
+        monkeypatch.setattr(EmailBackend, "send_messages", refuse)
+        email = OutboxEmail.objects.create(subject="Sujet", body="Corps", to="a@example.com")
+
+        drain_email_outbox()
+        email.refresh_from_db()
+        assert email.status == OutboxEmail.STATUS_PENDING
+        assert email.attempts == 1
+        assert email.next_attempt_at > timezone.now() + timedelta(seconds=50)
+
+        OutboxEmail.objects.filter(pk=email.pk).update(next_attempt_at=timezone.now())
+        drain_email_outbox()
+        email.refresh_from_db()
+        assert email.status == OutboxEmail.STATUS_FAILED
+        assert email.last_error == "SMTP indisponible"
@@ -0,0 +1,95 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from gestion_taches.tasks.models import Task
+from gestion_taches.tasks.tests.factories import CategoryFactory
+from gestion_taches.tasks.tests.factories import TaskFactory
+from gestion_taches.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def _walk(api_client: APIClient, url: str, params: dict) -> list[int]:
+    ids = []
+    response = api_client.get(url, params)
+    while True:
+        assert response.status_code == 200
+        ids += [task["id"] for task in response.data["results"]]
+        if not response.data["next"]:
+            return ids
+        response = api_client.get(response.data["next"])
+
+
+class TestKeysetCursorPagination:
+    def test_default_order_matches_meta_ordering(self, user: User, api_client: APIClient):
+        TaskFactory.create_batch(7, user=user)
+        TaskFactory.create_batch(3)  # tâches d'un autre utilisateur
+
+        ids = _walk(api_client, reverse("tasks:task-list"), {"page_size": 3})
+
+        expected = list(Task.objects.filter(user=user).order_by("-created_at", "-id").values_list("id", flat=True))
+        assert ids == expected
+
+    def test_created_at_ties_are_split_by_id(self, user: User, api_client: APIClient):
+        TaskFactory.create_batch(5, user=user)
+        Task.objects.update(created_at=timezone.now())
+        url = reverse("tasks:task-list")
+
+        ids = _walk(api_client, url, {"page_size": 2})
+        third = api_client.get(api_client.get(api_client.get(url, {"page_size": 2}).data["next"]).data["next"])
+        back = api_client.get(third.data["previous"])
+
+        assert ids == sorted(ids, reverse=True)
+        assert [t["id"] for t in back.data["results"]] == ids[2:4]
+
+    def test_ordering_filter_with_nullable_field(self, user: User, api_client: APIClient):
+        now = timezone.now()
+        for days in (3, None, 1, 1, None, 2):
+            TaskFactory(user=user, due_date=now + timedelta(days=days) if days else None)
+
+        ids = _walk(api_client, reverse("tasks:task-list"), {"page_size": 2, "ordering": "due_date"})
+
+        tasks = Task.objects.in_bulk(ids)
+        due_dates = [tasks[pk].due_date for pk in ids]
+        assert len(ids) == 6
+        assert due_dates[:4] == sorted(due_dates[:4])
+        assert due_dates[4:] == [None, None]
+
+    def test_previous_link_returns_previous_page(self, user: User, api_client: APIClient):
+        TaskFactory.create_batch(5, user=user)
+        url = reverse("tasks:task-list")
+
+        first = api_client.get(url, {"page_size": 2})
+        second = api_client.get(first.data["next"])
+        back = api_client.get(second.data["previous"])
+
+        assert first.data["previous"] is None
+        assert [t["id"] for t in back.data["results"]] == [t["id"] for t in first.data["results"]]
+
+    def test_priority_ordering_is_by_level(self, user: User, api_client: APIClient):
+        for priority in (Task.Priority.MEDIUM, Task.Priority.HIGH, Task.Priority.LOW):
+            TaskFactory(user=user, priority=priority)
+        url = reverse("tasks:task-list")
+
+        ascending = api_client.get(url, {"ordering": "priority"}).data["results"]
+        descending = api_client.get(url, {"ordering": "-priority"}).data["results"]
+
+        assert [task["priority"] for task in ascending] == ["low", "medium", "high"]
+        assert [task["priority"] for task in descending] == ["high", "medium", "low"]
+
+    def test_invalid_cursor(self, api_client: APIClient):
+        response = api_client.get(reverse("tasks:task-list"), {"cursor": "invalide"})
+
+        assert response.status_code == 404
+
+    def test_categories_are_paginated(self, user: User, api_client: APIClient):
+        CategoryFactory.create_batch(4, user=user)
+
+        response = api_client.get(reverse("tasks:category-list"), {"page_size": 3})
+
+        assert len(response.data["results"]) == 3
+        assert response.data["next"] is not None
@@ -0,0 +1,292 @@
+from types import SimpleNamespace
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from gestion_taches.tasks import reminder_index
+from gestion_taches.tasks import seeding
+from gestion_taches.tasks import tasks
+from gestion_taches.tasks.models import Category
+from gestion_taches.tasks.models import OutboxEmail
+from gestion_taches.tasks.models import Task
+from gestion_taches.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+# Un seul utilisateur possède toutes les tâches : ses listes et ses agrégats portent
+# sur tout le jeu de données. La moitié des tâches échues attend son rappel.
+DISTRIBUTION = seeding.Distribution(users=1, categories_per_user=5, reminded_rate=0.5)
+
+# Nombre maximal de requêtes SQL par point d'entrée. Chaque budget est vérifié à 10
+# et à 1000 tâches : une requête par ligne (N+1) le dépasse au second passage.
+# Les requêtes HTTP comptent les deux savepoints d'ATOMIC_REQUESTS ; les vues du
+# tableau de bord comptent aussi la session et l'utilisateur.
+BUDGETS = {
+    # API : savepoints (x2) + lecture ; les écritures ajoutent les signaux
+    # (statistiques, outbox) et la suppression les cascades et traces de synchronisation
+    "api.tasks.list": 4,
+    "api.tasks.retrieve": 3,
+    "api.tasks.create": 7,
+    "api.tasks.update": 9,
+    "api.tasks.delete": 8,
+    "api.tasks.sync": 4,
+    "api.tasks.export": 3,
+    "api.categories.list": 4,
+    "api.categories.retrieve": 3,
+    "api.categories.create": 4,
+    "api.categories.update": 4,
+    "api.categories.delete": 8,
+    # Tableaux de bord : savepoints (x2) + session + utilisateur, puis la vue
+    "dashboard.home": 7,
+    "dashboard.tasks": 6,
+    "dashboard.tasks.data": 5,
+    "dashboard.tasks.create": 9,
+    "dashboard.tasks.edit": 10,
+    "dashboard.tasks.delete": 10,
+    "dashboard.categories": 5,
+    "dashboard.categories.data": 5,
+    "dashboard.categories.create": 6,
+    "dashboard.categories.edit": 6,
+    "dashboard.categories.delete": 10,
+    # Celery, un lot : SELECT + UPDATE (+ le SELECT vide qui termine le balayage) ;
+    # les rappels réclament leurs lignes dans une transaction (savepoints x2 par lot)
+    "celery.send_reminder": 7,
+    "celery.send_reminder.single": 4,
+    "celery.dispatch_due_reminders": 4,
+    "celery.drain_email_outbox": 7,
+    "celery.refresh_task_stats": 4,
+    "celery.purge_tombstones": 1,
+}
+
+# Nom du budget -> fonction qui prépare le scénario et retourne l'appel mesuré
+SCENARIOS = {}
+
+
+def scenario(name):
+    def register(function):
+        SCENARIOS[name] = function
+        return function
+    return register
+
+
+@pytest.fixture(params=[10, 1000], ids=lambda size: f"{size}-taches")
+def dataset(request, settings):
+    size = request.param
+    owners = seeding.seed(size, distribution=DISTRIBUTION, prefix="budget")
+    user = User.objects.get(pk=next(iter(owners)))
+    # Un seul lot pour les tâches Celery : le budget mesure le coût d'un lot
+    settings.REMINDER_BATCH_SIZE = size
+    settings.EMAIL_OUTBOX_BATCH_SIZE = size
+
+    client = Client()
+    client.force_login(user)
+    api = APIClient()
+    api.force_authenticate(user=user)
+    task = Task.objects.filter(user=user).exclude(category=None).order_by("pk").first()
+    data = SimpleNamespace(
+        size=size,
+        user=user,
+        client=client,
+        api=api,
+        task=task,
+        # Une autre catégorie que celle de `task` : la modification change de catégorie
+        category=Category.objects.filter(user=user).exclude(pk=task.category_id).order_by("pk").first(),
+        due=Task.objects.filter(user=user, is_completed=False, is_reminded=False, due_date__lte=timezone.now()),
+    )
+    assert data.due.exists()
+    return data
+
+
+def _ok(response):
+    assert response.status_code < 300, response.content
+    # Les réponses en flux (export) ne lisent leurs lignes qu'à la consommation
+    if response.streaming:
+        b"".join(response.streaming_content)
+    return response
+
+
+def _assert_equal(value, expected):
+    assert value == expected
+
+
+def _request(method, *args, **kwargs):
+    return lambda: _ok(method(*args, **kwargs))
+
+
+@scenario("api.tasks.list")
+def _(data):
+    return _request(data.api.get, reverse("tasks:task-list"), {"expand": "category"})
+
+
+@scenario("api.tasks.retrieve")
+def _(data):
+    return _request(data.api.get, reverse("tasks:task-detail", args=[data.task.pk]), {"expand": "category"})
+
+
+@scenario("api.tasks.create")
+def _(data):
+    payload = {
+        "title": "Nouvelle", "priority": "high", "is_completed": False,
+        "category": data.category.pk, "due_date": timezone.now(),
+    }
+    return _request(data.api.post, reverse("tasks:task-list"), payload, format="json")
+
+
+@scenario("api.tasks.update")
+def _(data):
+    payload = {"title": "Modifiée", "due_date": timezone.now(), "category": data.category.pk}
+    return _request(data.api.patch, reverse("tasks:task-detail", args=[data.task.pk]), payload, format="json")
+
+
+@scenario("api.tasks.delete")
+def _(data):
+    return _request(data.api.delete, reverse("tasks:task-detail", args=[data.task.pk]))
+
+
+@scenario("api.tasks.sync")
+def _(data):
+    return _request(data.api.get, reverse("tasks:task-sync"))
+
+
+@scenario("api.tasks.export")
+def _(data):
+    return _request(data.api.get, reverse("tasks:task-export"))
+
+
+@scenario("api.categories.list")
+def _(data):
+    return _request(data.api.get, reverse("tasks:category-list"))
+
+
+@scenario("api.categories.retrieve")
+def _(data):
+    return _request(data.api.get, reverse("tasks:category-detail", args=[data.category.pk]))
+
+
+@scenario("api.categories.create")
+def _(data):
+    return _request(data.api.post, reverse("tasks:category-list"), {"name": "Nouvelle"}, format="json")
+
+
+@scenario("api.categories.update")
+def _(data):
+    url = reverse("tasks:category-detail", args=[data.category.pk])
+    return _request(data.api.patch, url, {"name": "Modifiée"}, format="json")
+
+
+@scenario("api.categories.delete")
+def _(data):
+    return _request(data.api.delete, reverse("tasks:category-detail", args=[data.category.pk]))
+
+
+@scenario("dashboard.home")
+def _(data):
+    return _request(data.client.get, reverse("tasks:dashboard"))
+
+
+@scenario("dashboard.tasks")
+def _(data):
+    return _request(data.client.get, reverse("tasks:task"))
+
+
+@scenario("dashboard.tasks.data")
+def _(data):
+    return _request(data.client.get, reverse("tasks:task_data"), {"is_completed": "false"}, HTTP_ACCEPT="application/json")
+
+
+@scenario("dashboard.tasks.create")
+def _(data):
+    payload = {"action": "create", "title": "Nouvelle", "due_date": "2030-01-01T09:00", "category": data.category.pk}
+    return _request(data.client.post, reverse("tasks:task"), payload)
+
+
+@scenario("dashboard.tasks.edit")
+def _(data):
+    payload = {"action": "edit", "task_id": data.task.pk, "title": "Modifiée", "due_date": "2030-01-01T09:00"}
+    return _request(data.client.post, reverse("tasks:task"), payload)
+
+
+@scenario("dashboard.tasks.delete")
+def _(data):
+    return _request(data.client.post, reverse("tasks:task"), {"action": "delete", "task_id": data.task.pk})
+
+
+@scenario("dashboard.categories")
+def _(data):
+    return _request(data.client.get, reverse("tasks:category"))
+
+
+@scenario("dashboard.categories.data")
+def _(data):
+    return _request(data.client.get, reverse("tasks:category_data"), HTTP_ACCEPT="application/json")
+
+
+@scenario("dashboard.categories.create")
+def _(data):
+    return _request(data.client.post, reverse("tasks:category"), {"action": "create", "name": "Nouvelle"})
+
+
+@scenario("dashboard.categories.edit")
+def _(data):
+    payload = {"action": "edit", "category_id": data.category.pk, "name": "Modifiée"}
+    return _request(data.client.post, reverse("tasks:category"), payload)
+
+
+@scenario("dashboard.categories.delete")
+def _(data):
+    payload = {"action": "delete", "category_id": data.category.pk}
+    return _request(data.client.post, reverse("tasks:category"), payload)
+
+
+@scenario("celery.send_reminder")
+def _(data):
+    count = data.due.count()
+    return lambda: _assert_equal(tasks.send_reminder(), count)
+
+
+@scenario("celery.send_reminder.single")
+def _(data):
+    task_id = data.due.first().pk
+    return lambda: _assert_equal(tasks.send_reminder(task_id), 1)
+
+
+@scenario("celery.dispatch_due_reminders")
+def _(data):
+    due = list(data.due.values_list("pk", "due_date"))
+    for task_id, due_date in due:
+        reminder_index.schedule(task_id, due_date)
+    return lambda: _assert_equal(tasks.dispatch_due_reminders(), len(due))
+
+
+@scenario("celery.drain_email_outbox")
+def _(data):
+    OutboxEmail.objects.bulk_create(
+        OutboxEmail(subject="Sujet", body="Corps", to=data.user.email) for _ in range(data.size)
+    )
+    return lambda: _assert_equal(tasks.drain_email_outbox(), data.size)
+
+
+@scenario("celery.refresh_task_stats")
+def _(data):
+    return tasks.refresh_task_stats
+
+
+@scenario("celery.purge_tombstones")
+def _(data):
+    Task.objects.filter(user=data.user, is_completed=True).delete()
+    return tasks.purge_tombstones
+
+
+def test_every_budget_has_a_scenario():
+    assert set(SCENARIOS) == set(BUDGETS)
+
+
+@pytest.mark.parametrize("name", BUDGETS)
+def test_query_budget(name, dataset, django_assert_max_num_queries):
+    run = SCENARIOS[name](dataset)
+
+    with django_assert_max_num_queries(BUDGETS[name]):
+        run()
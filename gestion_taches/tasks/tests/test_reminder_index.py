@@ -0,0 +1,137 @@
+import importlib
+from datetime import timedelta
+
+import pytest
+from django.core import mail
+from django.apps import apps
+from django.core.management import call_command
+from django_celery_beat.models import CrontabSchedule
+from django_celery_beat.models import PeriodicTask
+from django.urls import reverse
+from django.utils import timezone
+
+from gestion_taches.tasks import reminder_index
+from gestion_taches.tasks.tasks import dispatch_due_reminders
+from gestion_taches.tasks.tests.factories import TaskFactory
+from gestion_taches.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def _indexed():
+    return reminder_index.get_client().zcard(reminder_index.REMINDER_INDEX_KEY)
+
+
+class TestIndexMaintenance:
+    def test_create_complete_and_delete(self, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            task = TaskFactory(due_date=timezone.now() + timedelta(days=1))
+        assert _indexed() == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            task.is_completed = True
+            task.save()
+        assert _indexed() == 0
+
+        with django_capture_on_commit_callbacks(execute=True):
+            task.is_completed = False
+            task.save()
+            task.delete()
+        assert _indexed() == 0
+
+    def test_task_without_due_date_is_not_indexed(self, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            TaskFactory(due_date=None)
+
+        assert _indexed() == 0
+
+    def test_dashboard_create_does_not_enqueue_reminder(self, user: User, client, django_capture_on_commit_callbacks):
+        client.force_login(user)
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.post(
+                reverse("tasks:task"),
+                {"action": "create", "title": "Échéance", "due_date": "2030-01-01T09:00"},
+            )
+
+        assert response.status_code == 200
+        assert _indexed() == 1
+
+
+class TestDispatchDueReminders:
+    def test_pops_only_due_entries(self, django_capture_on_commit_callbacks):
+        now = timezone.now()
+        with django_capture_on_commit_callbacks(execute=True):
+            due = TaskFactory(due_date=now - timedelta(minutes=1))
+            later = TaskFactory(due_date=now + timedelta(hours=1))
+
+        assert dispatch_due_reminders() == 1
+
+        assert [m.to[0] for m in mail.outbox] == [due.user.email]
+        due.refresh_from_db()
+        later.refresh_from_db()
+        assert due.is_reminded
+        assert not later.is_reminded
+        assert _indexed() == 1
+
+    def test_stale_entry_for_completed_task_is_dropped(self):
+        task = TaskFactory(due_date=timezone.now() - timedelta(minutes=1), is_completed=True)
+        reminder_index.schedule(task.id, task.due_date)
+
+        assert dispatch_due_reminders() == 0
+        assert _indexed() == 0
+
+
+class TestPopDue:
+    def test_future_entries_are_left_in_place(self):
+        now = timezone.now()
+        reminder_index.schedule(1, now - timedelta(minutes=2))
+        reminder_index.schedule(2, now - timedelta(minutes=1))
+        reminder_index.schedule(3, now + timedelta(hours=1))
+
+        assert reminder_index.pop_due(now, 1) == [1]
+        assert reminder_index.pop_due(now, 10) == [2]
+        assert reminder_index.pop_due(now, 10) == []
+        assert _indexed() == 1
+
+    def test_rescheduled_entry_is_not_claimed(self):
+        now = timezone.now()
+        reminder_index.schedule(1, now - timedelta(minutes=1))
+        reminder_index.schedule(1, now + timedelta(days=1))
+
+        assert reminder_index.pop_due(now, 10) == []
+        assert reminder_index.pop_due(now + timedelta(days=2), 10) == [1]
+
+
+class TestRebuild:
+    def test_indexes_existing_pending_tasks_only(self):
+        now = timezone.now()
+        # Créées hors transaction.on_commit : absentes de l'index, comme après un COPY
+        pending = TaskFactory(due_date=now - timedelta(minutes=1))
+        TaskFactory(due_date=now - timedelta(minutes=1), is_completed=True)
+        TaskFactory(due_date=now - timedelta(minutes=1), is_reminded=True)
+        TaskFactory(due_date=None)
+        reminder_index.schedule(999_999, now)  # entrée périmée
+        assert _indexed() == 1
+
+        call_command("rebuild_reminder_index")
+
+        assert _indexed() == 1
+        assert reminder_index.pop_due(now, 10) == [pending.pk]
+
+    def test_empty_table_clears_the_index(self):
+        reminder_index.schedule(999_999, timezone.now())
+
+        assert reminder_index.rebuild() == 0
+        assert _indexed() == 0
+
+
+class TestLegacyBeat:
+    def test_five_minute_sweep_is_removed(self):
+        migration = importlib.import_module("gestion_taches.tasks.migrations.0015_remove_legacy_reminder_beat")
+        crontab = CrontabSchedule.objects.create(minute="*/5")
+        for name in (migration.LEGACY_NAME, "check-reminders-hourly"):
+            PeriodicTask.objects.create(name=name, task="gestion_taches.tasks.tasks.send_reminder", crontab=crontab)
+
+        migration.delete_legacy_beat(apps, None)
+
+        assert list(PeriodicTask.objects.values_list("name", flat=True)) == ["check-reminders-hourly"]
@@ -0,0 +1,85 @@
+import threading
+from datetime import timedelta
+
+import pytest
+from django.core import mail
+from django.db import connection
+from django.db import transaction
+from django.utils import timezone
+
+from gestion_taches.tasks.models import Task
+from gestion_taches.tasks.tasks import send_reminder
+from gestion_taches.tasks.tests.factories import TaskFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def past():
+    return timezone.now() - timedelta(hours=1)
+
+
+class TestSendReminder:
+    def test_batch_reminds_due_tasks_only(self, past):
+        due = TaskFactory.create_batch(3, due_date=past)
+        TaskFactory(due_date=past, is_completed=True)
+        TaskFactory(due_date=past, is_reminded=True)
+        TaskFactory(due_date=timezone.now() + timedelta(days=1))
+
+        assert send_reminder() == 3
+
+        assert sorted(m.to[0] for m in mail.outbox) == sorted(t.user.email for t in due)
+        assert set(Task.objects.filter(is_reminded=True, is_completed=False).values_list("id", flat=True)) >= {
+            t.id for t in due
+        }
+
+    def test_batch_query_count_is_per_chunk(self, settings, past, django_assert_num_queries):
+        settings.REMINDER_BATCH_SIZE = 4
+        TaskFactory.create_batch(10, due_date=past)
+
+        # 3 lots : 1 SELECT FOR UPDATE (avec jointure user) + 1 UPDATE chacun, puis le
+        # SELECT final vide ; chacune des 4 transactions ajoute SAVEPOINT et RELEASE
+        with django_assert_num_queries(15):
+            assert send_reminder() == 10
+
+    def test_single_task(self, past):
+        task = TaskFactory(due_date=past)
+
+        assert send_reminder(task.id) == 1
+        task.refresh_from_db()
+        assert task.is_reminded
+
+    def test_single_task_not_due(self):
+        task = TaskFactory(due_date=timezone.now() + timedelta(days=1))
+
+        assert send_reminder(task.id) == 0
+        assert len(mail.outbox) == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_task_claimed_elsewhere_is_skipped(past):
+    locked, free = TaskFactory.create_batch(2, due_date=past)
+    claimed, release = threading.Event(), threading.Event()
+
+    def hold_lock():
+        # Un autre worker (répartiteur ou balayage) en train d'envoyer ce rappel
+        try:
+            with transaction.atomic():
+                Task.objects.select_for_update().get(pk=locked.pk)
+                claimed.set()
+                release.wait(5)
+        finally:
+            connection.close()
+
+    worker = threading.Thread(target=hold_lock)
+    worker.start()
+    try:
+        assert claimed.wait(5)
+        assert send_reminder() == 1
+        assert send_reminder(locked.id) == 0
+    finally:
+        release.set()
+        worker.join()
+
+    assert [m.to[0] for m in mail.outbox] == [free.user.email]
+    assert not Task.objects.get(pk=locked.pk).is_reminded
@@ -0,0 +1,100 @@
+import io
+import uuid
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+from datetime import UTC
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+import pytest
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from gestion_taches.tasks.parsers import ORJSONParser
+from gestion_taches.tasks.renderers import ORJSONRenderer
+from gestion_taches.tasks.tests.factories import TaskFactory
+from gestion_taches.users.models import User
+
+
+def _both(data, accepted_media_type=None, renderer_context=None):
+    return (
+        ORJSONRenderer().render(data, accepted_media_type, renderer_context),
+        JSONRenderer().render(data, accepted_media_type, renderer_context),
+    )
+
+
+class TestORJSONRenderer:
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"utc": datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=UTC)},
+            {"douala": datetime(2026, 1, 2, 3, 4, 5, tzinfo=ZoneInfo("Africa/Douala"))},
+            {"naive": datetime(2026, 1, 2, 3, 4, 5), "date": date(2026, 1, 2), "time": time(8, 30)},
+            {"decimal": Decimal("12.50"), "duration": timedelta(hours=1, seconds=3)},
+            {"uuid": uuid.UUID("12345678-1234-5678-1234-567812345678")},
+            {"lazy": gettext_lazy("This field is required."), "nested": [{"lazy": [gettext_lazy("Invalid value.")]}]},
+            {"text": "Tâche « urgente » — séparateurs \u2028 et \u2029 🚀"},
+            {1: "clé entière", "tuple": (1, 2), "set": {3}},
+            [None, True, 1.5, "", {}],
+        ],
+    )
+    def test_same_bytes_as_drf(self, data):
+        rendered, expected = _both(data)
+        assert rendered == expected
+
+    def test_iterables_through_drf_encoder(self):
+        assert ORJSONRenderer().render({"generator": (n for n in range(2))}) == b'{"generator":[0,1]}'
+
+    def test_falls_back_beyond_64_bits(self):
+        rendered, expected = _both({"big": 2**70})
+        assert rendered == expected == b'{"big":1180591620717411303424}'
+
+    def test_indent_uses_drf(self):
+        rendered, expected = _both({"a": [1]}, "application/json; indent=2")
+        assert rendered == expected
+        assert b"\n" in rendered
+
+    def test_none_is_empty_body(self):
+        assert ORJSONRenderer().render(None) == b""
+
+
+class TestORJSONParser:
+    def _parse(self, body, parser=None, **context):
+        return (parser or ORJSONParser()).parse(io.BytesIO(body), "application/json", context)
+
+    def test_same_result_as_drf(self):
+        body = '{"title": "Tâche", "ids": [1, 2], "done": false, "due_date": null}'.encode()
+        assert self._parse(body) == self._parse(body, JSONParser())
+
+    @pytest.mark.parametrize("body", [b"", b"{", b'{"a": NaN}', b"\xff"])
+    def test_invalid_json(self, body):
+        with pytest.raises(ParseError):
+            self._parse(body)
+
+    def test_other_encoding_uses_drf(self):
+        body = '{"title": "Tâche"}'.encode("latin-1")
+        assert self._parse(body, encoding="latin-1") == {"title": "Tâche"}
+
+
+@pytest.mark.django_db
+class TestAPIDefaults:
+    def test_list_rendered_with_orjson(self, api_client: APIClient, user: User):
+        TaskFactory(user=user, title="Réunion")
+        response = api_client.get(reverse("tasks:task-list"))
+        assert isinstance(response.accepted_renderer, ORJSONRenderer)
+        assert "Réunion".encode() in response.content
+
+    def test_bulk_create_parsed_with_orjson(self, api_client: APIClient):
+        response = api_client.post(
+            reverse("tasks:task-bulk"),
+            b'[{"title": "A", "is_completed": false, "priority": "low", "category": null}]',
+            content_type="application/json",
+        )
+        assert response.status_code == 201
+        assert isinstance(response.renderer_context["request"].parsers[0], ORJSONParser)
@@ -0,0 +1,93 @@
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from gestion_taches.tasks.models import Task
+from gestion_taches.tasks.tasks import send_reminder
+from gestion_taches.tasks.tests.factories import CategoryFactory
+from gestion_taches.tasks.tests.factories import TaskFactory
+from gestion_taches.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def _response_cache(settings):
+    settings.TASK_RESPONSE_CACHE_TIMEOUT = 300
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _data_queries(queries):
+    return [q["sql"] for q in queries if "tasks_task" in q["sql"] or "tasks_category" in q["sql"]]
+
+
+class TestResponseCache:
+    def test_repeated_reads_skip_the_database(self, api_client: APIClient, user: User):
+        task = TaskFactory(user=user)
+        for url in (reverse("tasks:task-list"), reverse("tasks:task-detail", args=[task.pk]), reverse("tasks:category-list")):
+            first = api_client.get(url)
+            with CaptureQueriesContext(connection) as queries:
+                second = api_client.get(url)
+            assert second.status_code == 200
+            assert second.data == first.data
+            assert second["ETag"] == first["ETag"]
+            assert _data_queries(queries) == []
+
+            with CaptureQueriesContext(connection) as queries:
+                assert api_client.get(url, HTTP_IF_NONE_MATCH=first["ETag"]).status_code == 304
+            assert _data_queries(queries) == []
+
+    def test_query_string_and_user_are_part_of_the_key(self, api_client: APIClient, user: User):
+        TaskFactory.create_batch(3, user=user)
+        url = reverse("tasks:task-list")
+        assert len(api_client.get(url).data["results"]) == 3
+        assert len(api_client.get(url, {"page_size": 1}).data["results"]) == 1
+
+        other = APIClient()
+        other.force_authenticate(user=TaskFactory().user)
+        assert len(other.get(url).data["results"]) == 1
+
+    def test_overdue_filter_is_not_cached(self, api_client: APIClient, user: User):
+        task = TaskFactory(user=user, due_date=timezone.now() + timedelta(hours=1))
+        url = reverse("tasks:task-list")
+        assert api_client.get(url, {"overdue": "true"}).data["results"] == []
+
+        # L'échéance passe sans aucune écriture (update() n'émet pas de signal)
+        Task.objects.filter(pk=task.pk).update(due_date=timezone.now() - timedelta(minutes=1))
+
+        assert [t["id"] for t in api_client.get(url, {"overdue": "true"}).data["results"]] == [task.pk]
+
+    def test_writes_bump_the_version(self, api_client: APIClient, user: User, django_capture_on_commit_callbacks):
+        task = TaskFactory(user=user, title="Avant", due_date=timezone.now() - timedelta(minutes=1))
+        category = CategoryFactory(user=user, name="Avant")
+        tasks_url, categories_url = reverse("tasks:task-list"), reverse("tasks:category-list")
+        api_client.get(tasks_url)
+        api_client.get(categories_url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.patch(reverse("tasks:task-detail", args=[task.pk]), {"title": "API"}, format="json")
+        assert response.status_code == 200
+        assert api_client.get(tasks_url).data["results"][0]["title"] == "API"
+
+        # Écritures hors API (tableau de bord, admin) : mêmes signaux
+        with django_capture_on_commit_callbacks(execute=True):
+            category.name = "Après"
+            category.save()
+        assert api_client.get(categories_url).data["results"][0]["name"] == "Après"
+
+        # Rappel envoyé par Celery via update(), sans signal post_save
+        with django_capture_on_commit_callbacks(execute=True):
+            assert send_reminder(task.pk) == 1
+        assert api_client.get(tasks_url).data["results"][0]["is_reminded"] is True
+
+        with django_capture_on_commit_callbacks(execute=True):
+            api_client.delete(reverse("tasks:task-detail", args=[task.pk]))
+        assert api_client.get(tasks_url).data["results"] == []
@@ -0,0 +1,66 @@
+import pytest
+from django.contrib.postgres.search import SearchQuery
+from django.db import connection
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from gestion_taches.tasks.models import Task
+from gestion_taches.tasks.tests.factories import TaskFactory
+from gestion_taches.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def _search(api_client: APIClient, term: str, **params) -> list[str]:
+    response = api_client.get(reverse("tasks:task-list"), {"search": term, **params})
+    assert response.status_code == 200
+    return [task["title"] for task in response.data["results"]]
+
+
+class TestFullTextSearch:
+    def test_french_stemming(self, user: User, api_client: APIClient):
+        TaskFactory(user=user, title="Réparer les serveurs", description="")
+        TaskFactory(user=user, title="Acheter du pain", description="")
+
+        assert _search(api_client, "serveur") == ["Réparer les serveurs"]
+
+    def test_english_stemming(self, user: User, api_client: APIClient):
+        TaskFactory(user=user, title="Running the migrations", description="")
+
+        assert _search(api_client, "run") == ["Running the migrations"]
+
+    def test_prefix_and_all_words(self, user: User, api_client: APIClient):
+        TaskFactory(user=user, title="Préparer la réunion budget", description="")
+        TaskFactory(user=user, title="Préparer le déménagement", description="")
+
+        assert _search(api_client, "prép budg") == ["Préparer la réunion budget"]
+
+    def test_title_ranks_above_description(self, user: User, api_client: APIClient):
+        TaskFactory(user=user, title="Appeler le client", description="Revoir la facture")
+        TaskFactory(user=user, title="Envoyer la facture", description="")
+
+        assert _search(api_client, "facture") == ["Envoyer la facture", "Appeler le client"]
+
+    def test_explicit_ordering_wins(self, user: User, api_client: APIClient):
+        TaskFactory(user=user, title="Facture A", description="", priority=Task.Priority.LOW)
+        TaskFactory(user=user, title="Autre", description="facture", priority=Task.Priority.HIGH)
+
+        assert _search(api_client, "facture", ordering="-priority") == ["Autre", "Facture A"]
+
+    def test_only_own_tasks(self, user: User, api_client: APIClient):
+        TaskFactory(title="Facture secrète", description="")
+
+        assert _search(api_client, "facture") == []
+
+    def test_punctuation_only_is_ignored(self, user: User, api_client: APIClient):
+        TaskFactory(user=user)
+
+        assert len(_search(api_client, "%&!")) == 1
+
+    def test_uses_gin_index(self, user: User):
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        plan = Task.objects.filter(search_vector=SearchQuery("facture", config="french")).order_by().explain()
+
+        assert "task_search_vector_idx" in plan
@@ -0,0 +1,107 @@
+import random
+from collections import Counter
+from datetime import timedelta
+
+import pytest
+from django.core.management import CommandError
+from django.core.management import call_command
+from django.db.models import F
+from django.utils import timezone
+
+from gestion_taches.tasks import reminder_index
+from gestion_taches.tasks import seeding
+from gestion_taches.tasks import stats
+from gestion_taches.tasks.models import Category
+from gestion_taches.tasks.models import Task
+from gestion_taches.tasks.models import TaskStats
+from gestion_taches.users.models import User
+
+
+def _stored():
+    return list(Task.objects.order_by("pk").values_list(*seeding.COLUMNS))
+
+
+@pytest.mark.django_db
+class TestSeed:
+    def test_skewed_and_reproducible(self):
+        owners = seeding.seed(2000, prefix="a")
+        first, last = list(owners)[0], list(owners)[-1]
+        titles = list(Task.objects.order_by("pk").values_list("title", flat=True)[:50])
+        per_user = Counter(Task.objects.values_list("user_id", flat=True))
+
+        assert Task.objects.count() == 2000
+        assert per_user[first] > 5 * per_user[last]
+        assert TaskStats.objects.get(user_id=first).total_tasks == per_user[first]
+
+        Task.objects.all().delete()
+        seeding.seed(2000, prefix="b")
+        assert list(Task.objects.order_by("pk").values_list("title", flat=True)[:50]) == titles
+
+    def test_history_and_reminder_backlog(self):
+        seeding.seed(1000)
+        now = timezone.now()
+
+        assert Task.objects.filter(created_at__lt=now - timedelta(days=180)).exists()
+        assert not Task.objects.filter(updated_at__lt=F("created_at")).exists()
+        assert Task.objects.filter(is_completed=False, is_reminded=False, due_date__lte=now).exists()
+        assert Task.objects.filter(category=None).exists()
+        assert Task.objects.filter(due_date=None).exists()
+        assert Task.objects.filter(description="").exists()
+
+    def test_pending_tasks_are_indexed(self):
+        seeding.seed(1000)
+        now = timezone.now()
+        due = set(
+            Task.objects.filter(is_completed=False, is_reminded=False, due_date__lte=now).values_list("pk", flat=True),
+        )
+
+        assert due
+        assert set(reminder_index.pop_due(now, 1000)) == due
+
+    def test_categories_belong_to_task_owner(self):
+        seeding.seed(500, distribution=seeding.Distribution(users=4, categories_per_user=3))
+
+        assert User.objects.count() == 4
+        assert Category.objects.count() == 12
+        assert not Task.objects.exclude(category=None).exclude(category__user=F("user")).exists()
+
+    def test_copy_and_bulk_create_store_the_same_rows(self):
+        distribution = seeding.Distribution(users=3)
+        owners = seeding.create_owners(300, distribution, "c")
+        rows = list(seeding.task_rows(300, owners, distribution, random.Random(1), timezone.now()))
+
+        assert seeding.copy_tasks(rows) == 300
+        copied = _stored()
+        for user_id in owners:
+            stats.rebuild(user_id)
+        Task.objects.all().delete()
+        assert seeding.bulk_create_tasks(rows, batch_size=128) == 300
+
+        assert _stored() == copied
+        assert Task._meta.get_field("created_at").auto_now_add
+
+
+@pytest.mark.django_db(transaction=True)
+def test_parallel_copy():
+    owners = seeding.seed(3000, jobs=3, prefix="p")
+
+    assert Task.objects.count() == 3000
+    assert sum(TaskStats.objects.filter(user_id__in=owners).values_list("total_tasks", flat=True)) == 3000
+    assert Task.objects.filter(search_vector=seeding.WORDS[0]).exists()
+
+
+@pytest.mark.django_db
+class TestSeedTasksCommand:
+    def test_seeds_requested_volume(self, capsys):
+        call_command("seed_tasks", "--tasks", "400", "--users", "4", "--completed-rate", "1", "--jobs", "1")
+
+        assert Task.objects.count() == 400
+        assert not Task.objects.filter(is_completed=False).exists()
+        assert User.objects.filter(username__startswith="seed-").count() == 4
+        assert "400 tâches, 4 utilisateurs, 48 catégories" in capsys.readouterr().out
+
+    def test_existing_prefix_is_refused(self):
+        User.objects.create(username="seed-0")
+
+        with pytest.raises(CommandError, match="--prefix"):
+            call_command("seed_tasks", "--tasks", "10", "--jobs", "1")
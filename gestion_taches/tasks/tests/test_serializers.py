@@ -0,0 +1,68 @@
+from datetime import datetime
+from datetime import timedelta
+from datetime import UTC
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from gestion_taches.tasks.models import Task
+from gestion_taches.tasks.serializers import TaskSerializer
+from gestion_taches.tasks.serializers import task_rows
+from gestion_taches.tasks.tests.factories import CategoryFactory
+from gestion_taches.tasks.tests.factories import TaskFactory
+from gestion_taches.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def _render(data):
+    return JSONRenderer().render(data)
+
+
+@pytest.fixture
+def varied_tasks(user: User):
+    category = CategoryFactory(user=user)
+    return [
+        TaskFactory(user=user, category=category, due_date=datetime(2026, 3, 1, 8, 30, 15, 123456, tzinfo=UTC)),
+        TaskFactory(user=user, title="Réunion « équipe » 🚀", description="", priority=Task.Priority.HIGH, is_completed=True),
+        TaskFactory(user=user, priority=Task.Priority.LOW, is_reminded=True, due_date=timezone.now() + timedelta(days=2)),
+    ]
+
+
+class TestValuesRowSerializer:
+    """Contrat : la mise en forme des lignes values() est identique octet pour octet à TaskSerializer."""
+
+    def test_same_fields_in_same_order(self):
+        assert [name for name, _source, _convert in task_rows._columns] == TaskSerializer.Meta.fields
+
+    @pytest.mark.parametrize("tz", ["Africa/Douala", "UTC", "America/New_York"])
+    def test_byte_identical_to_serializer(self, varied_tasks, tz):
+        queryset = Task.objects.order_by("id")
+        with timezone.override(tz):
+            expected = _render(TaskSerializer(queryset, many=True).data)
+            actual = _render(task_rows.to_representation(queryset.values(*task_rows.sources)))
+        assert actual == expected
+
+    @pytest.mark.parametrize(
+        ("fields", "expand"),
+        [(("id", "title", "is_completed"), ()), (None, ("category",)), (("id", "due_date", "category"), ("category",))],
+    )
+    def test_variants_byte_identical(self, varied_tasks, fields, expand):
+        queryset = Task.objects.order_by("id")
+        rows = task_rows.select(fields, expand)
+        expected = _render(TaskSerializer(queryset, many=True, fields=fields, expand=expand).data)
+        assert _render(rows.to_representation(queryset.values(*rows.sources))) == expected
+        assert task_rows.select(fields, expand) is rows
+
+    def test_list_endpoint_matches_serializer(self, api_client: APIClient, user: User, varied_tasks):
+        response = api_client.get(reverse("tasks:task-list"))
+        expected = TaskSerializer(Task.objects.filter(user=user).order_by("-created_at", "-id"), many=True).data
+        assert _render(response.data["results"]) == _render(expected)
+
+    def test_search_rank_not_exposed(self, api_client: APIClient, user: User):
+        TaskFactory(user=user, title="Rapport annuel")
+        results = api_client.get(reverse("tasks:task-list"), {"search": "rapport"}).data["results"]
+        assert list(results[0]) == TaskSerializer.Meta.fields
@@ -0,0 +1,98 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from gestion_taches.tasks.pagination import KeysetCursorPagination
+from gestion_taches.tasks.tests.factories import CategoryFactory
+from gestion_taches.tasks.tests.factories import TaskFactory
+from gestion_taches.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+LIST_URL = reverse("tasks:task-list")
+
+
+def _task_selects(queries):
+    return [q["sql"] for q in queries if q["sql"].startswith("SELECT") and 'FROM "tasks_task"' in q["sql"]]
+
+
+class TestSparseFields:
+    def test_list_only_selected_fields(self, api_client: APIClient, user: User):
+        TaskFactory.create_batch(2, user=user)
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(LIST_URL, {"fields": "title,id,is_completed"})
+
+        assert response.status_code == 200
+        assert [list(item) for item in response.data["results"]] == [["id", "title", "is_completed"]] * 2
+        rows_query = _task_selects(queries)[-1]
+        assert '"tasks_task"."title"' in rows_query
+        assert '"tasks_task"."description"' not in rows_query
+
+    def test_retrieve_only_loads_selected_columns(self, api_client: APIClient, user: User):
+        task = TaskFactory(user=user)
+        url = reverse("tasks:task-detail", args=[task.pk])
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(url, {"fields": "id,title"})
+
+        assert response.data == {"id": task.pk, "title": task.title}
+        assert all('"tasks_task"."description"' not in sql for sql in _task_selects(queries))
+
+    def test_unknown_field(self, api_client: APIClient):
+        response = api_client.get(LIST_URL, {"fields": "id,secret"})
+        assert response.status_code == 400
+        assert "secret" in str(response.data["fields"])
+        assert api_client.get(LIST_URL, {"expand": "user"}).status_code == 400
+
+    def test_pagination_with_sparse_fields(self, api_client: APIClient, user: User, monkeypatch):
+        monkeypatch.setattr(KeysetCursorPagination, "page_size", 2)
+        tasks = TaskFactory.create_batch(3, user=user)
+        first = api_client.get(LIST_URL, {"fields": "id", "ordering": "priority"}).data
+        second = api_client.get(first["next"]).data
+
+        ids = [item["id"] for item in first["results"] + second["results"]]
+        assert sorted(ids) == sorted(task.pk for task in tasks)
+        assert list(second["results"][0]) == ["id"]
+
+    def test_writes_return_all_fields(self, api_client: APIClient, user: User):
+        task = TaskFactory(user=user)
+        url = reverse("tasks:task-detail", args=[task.pk])
+        response = api_client.patch(f"{url}?fields=id", {"title": "Nouveau"}, format="json")
+
+        assert response.status_code == 200
+        assert response.data["title"] == "Nouveau"
+        assert "description" in response.data
+
+
+class TestExpandCategory:
+    def test_list_inlines_category_with_one_join(self, api_client: APIClient, user: User):
+        category = CategoryFactory(user=user)
+        TaskFactory.create_batch(3, user=user, category=category)
+        TaskFactory(user=user)
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(LIST_URL, {"expand": "category"})
+
+        categories = [item["category"] for item in response.data["results"]]
+        assert categories == [None] + [{"id": category.pk, "user": user.pk, "name": category.name}] * 3
+        assert not [q for q in queries if 'FROM "tasks_category"' in q["sql"]]
+        assert 'JOIN "tasks_category"' in _task_selects(queries)[-1]
+
+    def test_retrieve_uses_select_related(self, api_client: APIClient, user: User):
+        task = TaskFactory(user=user, category=CategoryFactory(user=user))
+        url = reverse("tasks:task-detail", args=[task.pk])
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(url, {"expand": "category", "fields": "id,category"})
+
+        assert response.data == {"id": task.pk, "category": {"id": task.category_id, "user": user.pk, "name": task.category.name}}
+        assert not [q for q in queries if 'FROM "tasks_category"' in q["sql"]]
+
+    def test_expand_ignored_when_field_not_selected(self, api_client: APIClient, user: User):
+        TaskFactory(user=user, category=CategoryFactory(user=user))
+        response = api_client.get(LIST_URL, {"expand": "category", "fields": "id"})
+        assert list(response.data["results"][0]) == ["id"]
+
+    def test_variants_have_their_own_etag(self, api_client: APIClient, user: User):
+        TaskFactory(user=user)
+        plain = api_client.get(LIST_URL)["ETag"]
+        assert api_client.get(LIST_URL, {"fields": "id"})["ETag"] != plain
@@ -0,0 +1,130 @@
+from datetime import timedelta
+
+import pytest
+from django.contrib.admin.sites import AdminSite
+from django.core.management import call_command
+from django.db.models import F
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from gestion_taches.tasks.admin import TaskAdmin
+from gestion_taches.tasks.models import Category
+from gestion_taches.tasks.models import Task
+from gestion_taches.tasks.models import TaskStats
+from gestion_taches.tasks.stats import rebuild
+from gestion_taches.tasks.stats import refresh_time_buckets
+from gestion_taches.tasks.tests.factories import CategoryFactory
+from gestion_taches.tasks.tests.factories import TaskFactory
+from gestion_taches.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+COUNTERS = [
+    "total_tasks", "completed_tasks", "overdue_tasks", "upcoming_tasks",
+    "high_priority_tasks", "medium_priority_tasks", "low_priority_tasks", "total_categories",
+]
+
+
+def _counters(user):
+    stats = TaskStats.objects.get(user=user)
+    return {field: getattr(stats, field) for field in COUNTERS}
+
+
+def _assert_consistent(user):
+    """Les compteurs incrémentaux doivent égaler un recalcul complet."""
+    incremental = _counters(user)
+    open_counts = dict(Category.objects.filter(user=user).values_list("id", "open_task_count"))
+    rebuild(user.pk)
+    assert incremental == _counters(user)
+    assert open_counts == dict(Category.objects.filter(user=user).values_list("id", "open_task_count"))
+
+
+class TestIncrementalStats:
+    def test_lifecycle(self, user: User):
+        work, home = CategoryFactory.create_batch(2, user=user)
+        task = TaskFactory(user=user, priority=Task.Priority.HIGH, category=work, due_date=timezone.now() - timedelta(hours=1))
+        TaskFactory(user=user, priority=Task.Priority.LOW, due_date=timezone.now() + timedelta(days=2))
+        _assert_consistent(user)
+
+        task = Task.objects.get(pk=task.pk)
+        task.priority = Task.Priority.MEDIUM
+        task.category = home
+        task.save()
+        _assert_consistent(user)
+
+        task.is_completed = True
+        task.save()
+        _assert_consistent(user)
+        assert _counters(user)["completed_tasks"] == 1
+
+        task.delete()
+        home.delete()
+        _assert_consistent(user)
+        assert _counters(user)["total_categories"] == 1
+
+    def test_api_and_dashboard_writes(self, user: User, api_client: APIClient, client):
+        category = CategoryFactory(user=user)
+        task = TaskFactory(user=user, category=category)
+        api_client.patch(reverse("tasks:task-detail", args=[task.pk]), {"is_completed": True}, format="json")
+        client.force_login(user)
+        client.post(reverse("tasks:task"), {"action": "create", "title": "Depuis le dashboard", "category": category.pk})
+
+        _assert_consistent(user)
+        assert Category.objects.get(pk=category.pk).open_task_count == 1
+
+    def test_admin_delete_action(self, user: User, rf):
+        tasks = TaskFactory.create_batch(3, user=user, priority=Task.Priority.HIGH)
+        request = rf.post("/")
+        request.user = user
+
+        TaskAdmin(Task, AdminSite()).delete_queryset(request, Task.objects.filter(pk__in=[t.pk for t in tasks[:2]]))
+
+        _assert_consistent(user)
+        assert _counters(user)["total_tasks"] == 1
+
+    def test_user_deletion_cascades(self, user: User):
+        CategoryFactory(user=user)
+        TaskFactory(user=user)
+
+        user.delete()
+
+        assert not TaskStats.objects.exists()
+
+
+class TestRepairs:
+    def test_refresh_time_buckets(self, user: User):
+        task = TaskFactory(user=user, due_date=timezone.now() + timedelta(days=1))
+        assert _counters(user)["upcoming_tasks"] == 1
+        # L'échéance passe : seule la tâche périodique peut le voir
+        Task.objects.filter(pk=task.pk).update(due_date=timezone.now() - timedelta(minutes=1))
+
+        refresh_time_buckets()
+
+        assert _counters(user)["upcoming_tasks"] == 0
+        assert _counters(user)["overdue_tasks"] == 1
+
+    def test_due_date_passing_between_writes(self, user: User):
+        task = TaskFactory(user=user, due_date=timezone.now() + timedelta(days=1))
+        assert _counters(user)["upcoming_tasks"] == 1
+        # Deux jours passent sans recalcul : la tâche, comptée "à venir", est échue
+        TaskStats.objects.filter(user=user).update(refreshed_at=F("refreshed_at") - timedelta(days=2))
+        Task.objects.filter(pk=task.pk).update(due_date=F("due_date") - timedelta(days=2))
+        task = Task.objects.get(pk=task.pk)
+        task.title = "Modifiée"
+        task.save()
+        assert (_counters(user)["overdue_tasks"], _counters(user)["upcoming_tasks"]) == (0, 1)
+
+        task.is_completed = True
+        task.save()
+
+        assert (_counters(user)["overdue_tasks"], _counters(user)["upcoming_tasks"]) == (0, 0)
+        _assert_consistent(user)
+
+    def test_rebuild_command_repairs_drift(self, user: User):
+        TaskFactory.create_batch(2, user=user)
+        TaskStats.objects.filter(user=user).update(total_tasks=42)
+
+        call_command("rebuild_task_stats", "--user", user.username)
+
+        assert _counters(user)["total_tasks"] == 2
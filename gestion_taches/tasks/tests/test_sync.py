@@ -0,0 +1,137 @@
+from datetime import timedelta
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from gestion_taches.tasks.delta_sync import make_token
+from gestion_taches.tasks.delta_sync import purge_tombstones
+from gestion_taches.tasks.models import Task
+from gestion_taches.tasks.models import Tombstone
+from gestion_taches.tasks.pagination import SyncPagination
+from gestion_taches.tasks.tests.factories import CategoryFactory
+from gestion_taches.tasks.tests.factories import TaskFactory
+from gestion_taches.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+URL = reverse("tasks:task-sync")
+
+
+def _ids(items):
+    return sorted(item["id"] for item in items)
+
+
+@pytest.fixture
+def no_overlap(settings):
+    # Jeton exact : seules les écritures postérieures sont renvoyées
+    settings.TASK_SYNC_OVERLAP_SECONDS = 0
+
+
+class TestDeltaSync:
+    def test_initial_sync_returns_everything(self, api_client: APIClient, user: User):
+        category = CategoryFactory(user=user)
+        tasks = TaskFactory.create_batch(2, user=user, category=category)
+        TaskFactory()
+        response = api_client.get(URL)
+
+        assert response.status_code == 200
+        assert _ids(response.data["tasks"]) == sorted(task.pk for task in tasks)
+        assert _ids(response.data["categories"]) == [category.pk]
+        assert response.data["deleted"] == {"tasks": [], "categories": []}
+        assert response.data["token"]
+
+    @pytest.mark.usefixtures("no_overlap")
+    def test_only_changes_since_token(self, api_client: APIClient, user: User):
+        unchanged, changed, removed = TaskFactory.create_batch(3, user=user, category=CategoryFactory(user=user))
+        token = api_client.get(URL).data["token"]
+
+        changed.title = "Modifiée"
+        changed.save()
+        created = TaskFactory(user=user, category=unchanged.category)
+        api_client.delete(reverse("tasks:task-detail", args=[removed.pk]))
+        response = api_client.get(URL, {"since": token})
+
+        assert response.status_code == 200
+        assert _ids(response.data["tasks"]) == sorted([changed.pk, created.pk])
+        assert response.data["categories"] == []
+        assert response.data["deleted"] == {"tasks": [removed.pk], "categories": []}
+
+        response = api_client.get(URL, {"since": response.data["token"]})
+        assert response.data["tasks"] == []
+        assert response.data["deleted"] == {"tasks": [], "categories": []}
+
+    @pytest.mark.usefixtures("no_overlap")
+    def test_dashboard_and_bulk_deletions_leave_tombstones(self, client: Client, api_client: APIClient, user: User):
+        first, second, third = TaskFactory.create_batch(3, user=user, category=CategoryFactory(user=user))
+        token = api_client.get(URL).data["token"]
+
+        client.force_login(user)
+        client.post(reverse("tasks:task"), {"action": "delete", "task_id": first.pk})
+        api_client.delete(reverse("tasks:task-bulk"), {"ids": [second.pk]}, format="json")
+        category_id = third.category_id
+        third.category.delete()
+        response = api_client.get(URL, {"since": token})
+
+        assert sorted(response.data["deleted"]["tasks"]) == sorted([first.pk, second.pk])
+        assert response.data["deleted"]["categories"] == [category_id]
+        # La tâche détachée de la catégorie supprimée est renvoyée
+        assert [(item["id"], item["category"]) for item in response.data["tasks"]] == [(third.pk, None)]
+
+    def test_user_deletion_writes_no_tombstone(self, user: User):
+        TaskFactory.create_batch(2, user=user)
+        user.delete()
+        assert not Tombstone.objects.exists()
+        assert not Task.objects.exists()
+
+    def test_invalid_and_expired_tokens(self, api_client: APIClient, settings):
+        assert api_client.get(URL, {"since": "n'importe quoi"}).status_code == 400
+
+        old = timezone.now() - timedelta(days=settings.TASK_SYNC_TOMBSTONE_RETENTION_DAYS + 1)
+        assert api_client.get(URL, {"since": make_token(old)}).status_code == 410
+
+    def test_purge_old_tombstones(self, user: User, settings):
+        old = timezone.now() - timedelta(days=settings.TASK_SYNC_TOMBSTONE_RETENTION_DAYS + 1)
+        Tombstone.objects.create(user=user, kind=Tombstone.KIND_TASK, object_id=1, deleted_at=old)
+        recent = Tombstone.objects.create(user=user, kind=Tombstone.KIND_CATEGORY, object_id=2)
+
+        assert purge_tombstones() == 1
+        assert list(Tombstone.objects.all()) == [recent]
+
+
+@pytest.mark.usefixtures("no_overlap")
+class TestPagedSync:
+    def test_initial_sync_is_paged_and_token_comes_last(self, monkeypatch, api_client: APIClient, user: User):
+        monkeypatch.setattr(SyncPagination, "page_size", 2)
+        category = CategoryFactory(user=user)
+        tasks = TaskFactory.create_batch(5, user=user, category=category)
+
+        first = api_client.get(URL).data
+        pages = [first]
+        while pages[-1]["next"]:
+            pages.append(api_client.get(pages[-1]["next"]).data)
+
+        assert len(pages) == 3
+        assert [len(page["tasks"]) for page in pages] == [2, 2, 1]
+        assert sorted(item["id"] for page in pages for item in page["tasks"]) == sorted(task.pk for task in tasks)
+        assert _ids(first["categories"]) == [category.pk]
+        assert pages[1]["categories"] == []
+        assert [page["token"] for page in pages[:-1]] == [None, None]
+        assert pages[-1]["token"]
+
+    def test_changes_while_paging_come_with_the_next_sync(self, monkeypatch, api_client: APIClient, user: User):
+        monkeypatch.setattr(SyncPagination, "page_size", 2)
+        first, *_ = TaskFactory.create_batch(3, user=user)
+
+        page = api_client.get(URL).data
+        first.title = "Modifiée pendant la synchronisation"
+        first.save()
+        token = api_client.get(page["next"]).data["token"]
+
+        response = api_client.get(URL, {"since": token})
+        assert [item["id"] for item in response.data["tasks"]] == [first.pk]
+
+    def test_tampered_page_token(self, api_client: APIClient):
+        assert api_client.get(URL, {"token": "falsifié"}).status_code == 400
@@ -1,9 +1,10 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from django.views.generic import TemplateView
-from gestion_taches.tasks.views.category_views import CategoryViewSet, category_dashboard
-from gestion_taches.tasks.views.task_views import TaskViewSet, task_dashboard
+from gestion_taches.tasks.views.category_views import CategoryViewSet, CategoryDashboardDataView, category_dashboard
+from gestion_taches.tasks.views.task_views import TaskViewSet, TaskDashboardDataView, task_dashboard
 from gestion_taches.tasks.views.dashboard_views import dashboard_home
+from gestion_taches.tasks.views.import_views import TaskImportViewSet
 
 # Nom de l'application pour le namespace
 app_name = 'tasks'
@@ -12,13 +13,16 @@ app_name = 'tasks'
 router = DefaultRouter()
 router.register(r'tasks', TaskViewSet)
 router.register(r'categories', CategoryViewSet)
+router.register(r'task-imports', TaskImportViewSet)
 
 urlpatterns = [
     path('', include(router.urls)),
     path('', dashboard_home, name='home'),
     path('dashboard/', dashboard_home, name='dashboard'),
     path('category/', category_dashboard, name='category'),
+    path('category/data/', CategoryDashboardDataView.as_view(), name='category_data'),
     path('task/', task_dashboard, name='task'),
+    path('task/data/', TaskDashboardDataView.as_view(), name='task_data'),
     # Routes temporaires pour éviter les erreurs
     path('company-settings/', TemplateView.as_view(template_name='dashboard/index.html'), name='company_settings_manage'),
     path('activity-log/', TemplateView.as_view(template_name='dashboard/index.html'), name='activity_log'),
@@ -1,4 +1,5 @@
 
 # Expose les vues de l'application tasks pour l'importation
 from .task_views import TaskViewSet
-from .category_views import CategoryViewSet
\ No newline at end of file
+from .category_views import CategoryViewSet
+from .import_views import TaskImportViewSet
\ No newline at end of file
@@ -1,17 +1,20 @@
-from rest_framework import viewsets
+from rest_framework import filters, generics, viewsets
 from rest_framework.permissions import IsAuthenticated
 from gestion_taches.tasks.models import Category
+from gestion_taches.tasks.pagination import KeysetCursorPagination
 from gestion_taches.tasks.serializers import CategorySerializer
+from gestion_taches.tasks.views.mixins import CachedResponseMixin, DashboardDataMixin
 from django.http import JsonResponse
 from django.shortcuts import render, get_object_or_404
 from django.views.decorators.http import require_POST
-import json
 
 # ViewSet pour gérer les opérations CRUD sur les catégories via l'API
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(CachedResponseMixin, viewsets.ModelViewSet):
+    cached_actions = ('list',)
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetCursorPagination
 
     def get_queryset(self):
         # Retourne uniquement les catégories de l'utilisateur connecté
@@ -52,17 +55,24 @@ def category_dashboard(request):
             return JsonResponse({'success': True, 'message': 'Catégorie supprimée avec succès'})
         return JsonResponse({'success': False, 'message': 'Action invalide'}, status=400)
     
-    # GET: Liste des catégories
-    categories = Category.objects.filter(user=request.user).order_by('-id')
-    categories_data = []
-    for category in categories.values('id', 'name', 'description', 'created_at'):
-        category_dict = dict(category)
-        # Convertir la datetime en string pour la sérialisation JSON
-        if category_dict['created_at']:
-            category_dict['created_at'] = category_dict['created_at'].isoformat()
-        categories_data.append(category_dict)
-    categories_json = json.dumps(categories_data)
+    # GET: coquille de la page avec la première page de catégories seulement ; la
+    # suite est chargée à la demande par le JavaScript depuis CategoryDashboardDataView
+    category_page = CategoryDashboardDataView.first_page(request)
     return render(request, 'dashboard/pages/task/task_category.html', {
-        'categories': categories,
-        'categories_json': categories_json,
-    })
\ No newline at end of file
+        'categories': category_page['results'],
+        'category_page': category_page,
+    })
+
+
+# Vue JSON paginée des lignes du tableau des catégories (défilement du tableau de bord)
+class CategoryDashboardDataView(DashboardDataMixin, generics.ListAPIView):
+    url_name = 'tasks:category_data'
+    row_fields = ('id', 'name', 'description', 'created_at')
+    permission_classes = [IsAuthenticated]
+    pagination_class = KeysetCursorPagination
+    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    search_fields = ['name']
+    ordering_fields = ['name', 'created_at']
+
+    def get_queryset(self):
+        return Category.objects.filter(user=self.request.user).values(*self.row_fields)
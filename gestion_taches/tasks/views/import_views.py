@@ -0,0 +1,35 @@
+from django.db import transaction
+from rest_framework import mixins, status, viewsets
+from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.permissions import IsAuthenticated
+from gestion_taches.tasks.models import TaskImport
+from gestion_taches.tasks.pagination import KeysetCursorPagination
+from gestion_taches.tasks.serializers import TaskImportSerializer
+from gestion_taches.tasks.tasks import import_tasks
+
+# ViewSet pour déposer un fichier de tâches et suivre son import en arrière-plan
+class TaskImportViewSet(mixins.CreateModelMixin,
+                        mixins.RetrieveModelMixin,
+                        mixins.ListModelMixin,
+                        viewsets.GenericViewSet):
+    queryset = TaskImport.objects.all()
+    serializer_class = TaskImportSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = KeysetCursorPagination
+    parser_classes = [MultiPartParser, FormParser]
+
+    def get_queryset(self):
+        # Retourne uniquement les imports de l'utilisateur connecté
+        return self.queryset.filter(user=self.request.user)
+
+    def create(self, request, *args, **kwargs):
+        # 202 : le fichier est accepté, le traitement se fait dans Celery
+        response = super().create(request, *args, **kwargs)
+        response.status_code = status.HTTP_202_ACCEPTED
+        return response
+
+    def perform_create(self, serializer):
+        upload = serializer.validated_data['file']
+        task_import = serializer.save(user=self.request.user, file_size=upload.size)
+        # Le worker ne doit voir la ligne qu'une fois la transaction validée
+        transaction.on_commit(lambda: import_tasks.delay(task_import.pk))
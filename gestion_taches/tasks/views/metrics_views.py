@@ -0,0 +1,26 @@
+import hmac
+
+from django.conf import settings
+from django.http import Http404
+from django.http import HttpResponse
+from django.http import HttpResponseForbidden
+from django.views.decorators.http import require_GET
+from prometheus_client import CONTENT_TYPE_LATEST
+
+from gestion_taches.tasks import metrics
+
+
+@require_GET
+def metrics_view(request):
+    """
+    Métriques Prometheus du web (format texte). Le collecteur envoie METRICS_TOKEN
+    dans l'en-tête « Authorization: Bearer <jeton> ». Sans jeton configuré, le point
+    d'entrée n'existe qu'en DEBUG : chaque collecte coûte un agrégat SQL.
+    """
+    token = settings.METRICS_TOKEN
+    if not token:
+        if not settings.DEBUG:
+            raise Http404
+    elif not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        return HttpResponseForbidden()
+    return HttpResponse(metrics.export(), content_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,248 @@
+# mixins.py - Comportements partagés par les ViewSets de l'API
+# Les clients interrogent les listes toutes les quelques secondes alors que rien n'a
+# changé. ConditionalGetMixin calcule un ETag par utilisateur et par requête à partir
+# d'un agrégat (max(updated_at), nombre de lignes) et répond 304 Not Modified si
+# If-None-Match correspond, sans charger ni sérialiser les objets.
+# CachedResponseMixin sert en plus les lectures répétées depuis le cache versionné
+# par utilisateur (voir response_cache.py), sans requête SQL sur les données.
+# DashboardDataMixin sert les lignes des pages du tableau de bord en JSON paginé.
+# ValuesListMixin construit les listes de l'API à partir de lignes values(), sans
+# instancier de modèles ni parcourir les champs du serializer pour chaque objet.
+# SparseFieldsetMixin limite les champs renvoyés et les colonnes lues (?fields=) et
+# déplie les relations demandées par jointure (?expand=).
+
+import hashlib
+
+from django.db.models import Count
+from django.db.models import Max
+from django.urls import reverse
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
+from django.utils.http import quote_etag
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+
+from gestion_taches.tasks import response_cache
+
+
+class ConditionalGetMixin:
+    """
+    Ajoute l'en-tête ETag aux réponses `list` et `retrieve` et renvoie 304 lorsque
+    le client possède déjà la représentation courante.
+    Toute création ou modification avance max(updated_at) et toute suppression
+    change le nombre de lignes : le validateur change dès que la liste change.
+    La chaîne de requête (recherche, tri, curseur, taille de page) fait partie du
+    validateur, chaque page a donc son propre ETag. Les relations dépliées dans la
+    réponse (`?expand=category`) y ajoutent la date de modification de leurs objets :
+    renommer une catégorie change l'ETag des tâches qui l'affichent.
+    """
+    etag_field = 'updated_at'
+
+    def get_etag_relations(self):
+        options = self.get_output_options() if hasattr(self, 'get_output_options') else {}
+        return options.get('expand', ())
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        relations = self.get_etag_relations()
+        summary = queryset.order_by().aggregate(
+            last_modified=Max(self.etag_field),
+            count=Count('pk'),
+            **{f'{name}_modified': Max(f'{name}__{self.etag_field}') for name in relations},
+        )
+        related = [summary[f'{name}_modified'] for name in relations]
+        etag = self._make_etag(request, summary['last_modified'], summary['count'], related)
+        if self._etag_matches(request, etag):
+            return self._not_modified(etag)
+        return self._with_etag(super().list(request, *args, **kwargs), etag)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        related = [
+            getattr(getattr(instance, name), self.etag_field, None) for name in self.get_etag_relations()
+        ]
+        etag = self._make_etag(request, getattr(instance, self.etag_field), instance.pk, related)
+        if self._etag_matches(request, etag):
+            return self._not_modified(etag)
+        serializer = self.get_serializer(instance)
+        return self._with_etag(Response(serializer.data), etag)
+
+    def _make_etag(self, request, last_modified, discriminator, related=()):
+        stamps = '|'.join(moment.isoformat() if moment else '' for moment in (last_modified, *related))
+        key = f'{request.user.pk}|{request.get_full_path()}|{stamps}|{discriminator}'
+        return quote_etag(hashlib.md5(key.encode(), usedforsecurity=False).hexdigest())
+
+    @staticmethod
+    def _etag_matches(request, etag):
+        header = request.headers.get('If-None-Match')
+        if not header:
+            return False
+        # Comparaison faible (RFC 9110) : un proxy peut avoir ajouté le préfixe W/
+        candidates = {tag.removeprefix('W/') for tag in parse_etags(header)}
+        return '*' in candidates or etag in candidates
+
+    def _not_modified(self, etag):
+        return self._with_etag(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
+
+    @staticmethod
+    def _with_etag(response, etag):
+        response['ETag'] = etag
+        # Données propres à l'utilisateur : revalidation systématique, pas de cache partagé
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+
+class CachedResponseMixin(ConditionalGetMixin):
+    """
+    Met en cache les données (déjà sérialisées) et l'ETag des réponses 200 des
+    actions de `cached_actions`. Une réponse en cache est renvoyée telle quelle,
+    ou en 304 si l'ETag du client correspond. Seules les écritures invalident le
+    cache : une requête portant un paramètre de `time_relative_params`, dont le
+    résultat change avec l'heure (ex. `?overdue=true`), n'est pas mise en cache.
+    """
+    cached_actions = ('list', 'retrieve')
+    time_relative_params = ()
+
+    def list(self, request, *args, **kwargs):
+        return self._cached_response('list', super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached_response('retrieve', super().retrieve, request, *args, **kwargs)
+
+    def _cached_response(self, action, handler, request, *args, **kwargs):
+        if (
+            action not in self.cached_actions
+            or not response_cache.enabled()
+            or any(request.query_params.get(name) for name in self.time_relative_params)
+        ):
+            return handler(request, *args, **kwargs)
+        key = response_cache.response_key(request, f'{self.basename}-{action}')
+        cached = response_cache.load(key)
+        if cached is not None:
+            data, etag = cached
+            if self._etag_matches(request, etag):
+                return self._not_modified(etag)
+            return self._with_etag(Response(data), etag)
+        response = handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            response_cache.store(key, (response.data, response['ETag']))
+        return response
+
+
+class ValuesListMixin:
+    """
+    `list` lu avec `values()` et mis en forme par `row_serializer` (voir
+    ValuesRowSerializer) : même réponse que ListModelMixin, sans instance de modèle
+    ni serializer par objet. Les champs de tri et les annotations du queryset (ex.
+    `search_rank`) sont lus avec les colonnes pour que la pagination puisse
+    positionner son curseur ; ils ne figurent pas dans la réponse.
+    """
+    row_serializer = None
+
+    def get_row_serializer(self):
+        return self.row_serializer
+
+    def list(self, request, *args, **kwargs):
+        rows = self.get_row_serializer()
+        queryset = self.filter_queryset(self.get_queryset())
+        queryset = queryset.values(*dict.fromkeys([*rows.sources, *self._cursor_fields(), *queryset.query.annotations]))
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            return Response(rows.to_representation(queryset))
+        return self.get_paginated_response(rows.to_representation(page))
+
+    def _cursor_fields(self):
+        ordering_fields = getattr(self, 'ordering_fields', None)
+        ordering = [
+            *getattr(self.paginator, 'tiebreakers', ()),
+            *(ordering_fields if isinstance(ordering_fields, (list, tuple)) else ()),
+        ]
+        return [field.lstrip('-') for field in ordering]
+
+
+class SparseFieldsetMixin:
+    """
+    Pour les lectures, `?fields=id,title` limite les champs renvoyés et les colonnes
+    lues (`only()`), et `?expand=category` remplace l'identifiant de la relation par
+    l'objet, lu par jointure (`select_related`). Le serializer accepte les arguments
+    `fields` et `expand` et déclare `expandable_fields` (voir TaskSerializer) ; les
+    noms de champs sont ceux du modèle. Les écritures valident et renvoient toujours
+    tous les champs.
+    """
+    fields_param = 'fields'
+    expand_param = 'expand'
+
+    def get_output_options(self):
+        if not hasattr(self, '_output_options'):
+            self._output_options = self._read_output_options()
+        return self._output_options
+
+    def _read_output_options(self):
+        if self.request.method not in SAFE_METHODS:
+            return {}
+        serializer_class = self.get_serializer_class()
+        options = {}
+        fields = self._param_names(self.fields_param, serializer_class.Meta.fields)
+        if fields:
+            options['fields'] = fields
+        expand = self._param_names(self.expand_param, serializer_class.expandable_fields)
+        expand = tuple(name for name in expand if not fields or name in fields)
+        if expand:
+            options['expand'] = expand
+        return options
+
+    def _param_names(self, param, allowed):
+        names = {name.strip() for name in self.request.query_params.get(param, '').split(',') if name.strip()}
+        unknown = sorted(names - set(allowed))
+        if unknown:
+            raise ValidationError({param: [f"Champ(s) inconnu(s) : {', '.join(unknown)}."]})
+        # Ordre du serializer : une même sélection donne une même variante
+        return tuple(name for name in allowed if name in names)
+
+    def get_serializer(self, *args, **kwargs):
+        return super().get_serializer(*args, **{**self.get_output_options(), **kwargs})
+
+    def get_row_serializer(self):
+        return super().get_row_serializer().select(**self.get_output_options())
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        options = self.get_output_options()
+        expand = options.get('expand', ())
+        if 'fields' in options:
+            # Le validateur de ConditionalGetMixin est lu sur l'instance
+            etag_field = getattr(self, 'etag_field', None)
+            queryset = queryset.only(*options['fields'], *([etag_field] if etag_field else []))
+        return queryset.select_related(*expand) if expand else queryset
+
+
+class DashboardDataMixin:
+    """
+    Vue JSON paginée par curseur des lignes d'une page du tableau de bord, lues
+    avec `values(*row_fields)` sans passer par un serializer. La page HTML n'intègre
+    que la première page (`first_page`) ; le JavaScript charge la suite à la demande.
+    """
+    url_name = None
+    row_fields = ()
+
+    def list(self, request, *args, **kwargs):
+        page = self.paginate_queryset(self.filter_queryset(self.get_queryset()))
+        return self.get_paginated_response(self.format_rows(page))
+
+    def format_rows(self, rows):
+        """Mise en forme des lignes d'une page avant leur envoi (par défaut, aucune)."""
+        return rows
+
+    @classmethod
+    def first_page(cls, request):
+        """Première page pour la requête Django `request`, avec le lien vers la suivante."""
+        view = cls()
+        view.setup(request)
+        view.request = view.initialize_request(request)
+        view.format_kwarg = None
+        rows = view.paginate_queryset(view.filter_queryset(view.get_queryset()))
+        # Les pages suivantes sont servies par la vue JSON, pas par la page HTML
+        view.paginator.base_url = request.build_absolute_uri(reverse(cls.url_name))
+        return {'results': view.format_rows(rows), 'next': view.paginator.get_next_link()}
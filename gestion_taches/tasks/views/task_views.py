@@ -1,23 +1,39 @@
-from rest_framework import viewsets, filters
+from rest_framework import generics, viewsets, filters, status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from gestion_taches.tasks import delta_sync
+from gestion_taches.tasks import export as task_export
+from gestion_taches.tasks.filters import FullTextSearchFilter, TaskFilter
 from gestion_taches.tasks.models import Task, Category
-from gestion_taches.tasks.serializers import TaskSerializer
-from django.http import JsonResponse
+from gestion_taches.tasks.notifications import notify_task_created, notify_task_deleted, notify_task_updated
+from gestion_taches.tasks.notifications import notify_tasks_bulk_changed
+from gestion_taches.tasks.pagination import KeysetCursorPagination, SyncPagination
+from gestion_taches.tasks.serializers import CategorySerializer, TaskSerializer, task_rows
+from gestion_taches.tasks.signals import after_bulk_write, bulk_writes
+from gestion_taches.tasks.views.mixins import CachedResponseMixin, DashboardDataMixin, SparseFieldsetMixin, ValuesListMixin
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.http import JsonResponse, StreamingHttpResponse
 from django.shortcuts import render, get_object_or_404
 from django.views.decorators.http import require_POST
-import json
 from datetime import datetime
-from django.core.mail import send_mail  # Ajouté pour l'email
-from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
 
 # ViewSet pour gérer les opérations CRUD sur les tâches via l'API
-class TaskViewSet(viewsets.ModelViewSet):
+class TaskViewSet(CachedResponseMixin, SparseFieldsetMixin, ValuesListMixin, viewsets.ModelViewSet):
     queryset = Task.objects.all()
     serializer_class = TaskSerializer
+    row_serializer = task_rows
     permission_classes = [IsAuthenticated]
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
-    search_fields = ['title', 'description']
+    pagination_class = KeysetCursorPagination
+    filter_backends = [TaskFilter, FullTextSearchFilter, filters.OrderingFilter]
     ordering_fields = ['due_date', 'created_at', 'priority']
+    # Le filtre "en retard" compare l'échéance à l'heure courante (voir TaskFilter)
+    time_relative_params = ('overdue',)
 
     def get_queryset(self):
         # Retourne uniquement les tâches de l'utilisateur connecté
@@ -25,53 +41,195 @@ class TaskViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         task = serializer.save(user=self.request.user)
-        # Pas de send_reminder.delay ici (géré par Celery Beat)
-        # Envoi notification email pour création (cohérence avec dashboard)
-        try:
-            send_mail(
-                'Tâche créée avec succès',
-                f'Votre tâche "{task.title}" a été créée. Description : {task.description[:50]}... Date d\'échéance : {task.due_date if task.due_date else "Aucune"}.',
-                'votre_email_expéditeur@example.com',
-                [self.request.user.email],
-                fail_silently=False,
-            )
-        except Exception as e:
-            print(f"Erreur envoi email : {e}")
-            
+        # Le rappel est planifié via l'index Redis (voir signals.py)
+        # Notification email mise en file (envoyée après le commit)
+        notify_task_created(task, self.request.user.email)
+
     def perform_update(self, serializer):
         old_due_date = serializer.instance.due_date
         task = serializer.save()
         if old_due_date != task.due_date:
             task.is_reminded = False
             task.save()
-        # Envoi notification email pour modification
-        try:
-            send_mail(
-                'Tâche modifiée avec succès',
-                f'Votre tâche "{task.title}" a été modifiée. Description : {task.description[:50]}... Date d\'échéance : {task.due_date if task.due_date else "Aucune"}.',
-                'votre_email_expéditeur@example.com',
-                [self.request.user.email],
-                fail_silently=False,
-            )
-        except Exception as e:
-            print(f"Erreur envoi email : {e}")
-            
+        notify_task_updated(task, self.request.user.email)
 
     def perform_destroy(self, instance):
         title = instance.title
-        user_email = instance.user.email
         instance.delete()
-        # Envoi notification email pour suppression
+        notify_task_deleted(title, self.request.user.email)
+
+    @action(detail=False, methods=['post', 'patch', 'delete'], url_path='bulk')
+    def bulk(self, request):
+        """
+        Opérations groupées : POST crée une liste de tâches, PATCH met à jour
+        partiellement une liste d'objets {"id": ..., champs...} et DELETE supprime
+        {"ids": [...]}. Le lot entier est validé avec TaskSerializer puis écrit par
+        des opérations ORM groupées dans une seule transaction ; une seule
+        notification est mise en file par lot.
+        """
+        handler = {
+            'POST': self._bulk_create,
+            'PATCH': self._bulk_update,
+            'DELETE': self._bulk_destroy,
+        }[request.method]
+        with transaction.atomic():
+            return handler(request)
+
+    @action(detail=False, methods=['get'], url_path='sync')
+    def sync(self, request):
+        """
+        Synchronisation incrémentale : `?since=<jeton>` retourne les tâches et
+        catégories créées ou modifiées depuis le jeton, les identifiants supprimés
+        et un nouveau jeton. Sans jeton, tout est retourné. Un jeton plus ancien que
+        la rétention des suppressions renvoie 410 : le client repart de zéro.
+        Les tâches sont paginées (SyncPagination) : catégories et suppressions sont
+        sur la première page, le client suit `next` et le jeton, émis au début de
+        la synchronisation, n'est renvoyé qu'avec la dernière page.
+        """
+        token = request.query_params.get('since')
         try:
-            send_mail(
-                'Tâche supprimée',
-                f'Votre tâche "{title}" a été supprimée.',
-                'votre_email_expéditeur@example.com',
-                [user_email],
-                fail_silently=False,
+            since = delta_sync.read_token(token) if token else None
+        except delta_sync.InvalidToken:
+            raise ValidationError({'since': ['Jeton de synchronisation invalide.']}) from None
+        # Jeton émis par la première page, reporté dans les liens `next`
+        sync_token = request.query_params.get('token')
+        try:
+            if sync_token:
+                delta_sync.read_token(sync_token)
+        except delta_sync.InvalidToken:
+            raise ValidationError({'token': ['Jeton de synchronisation invalide.']}) from None
+        if since is not None and delta_sync.is_expired(since):
+            return Response(
+                {'detail': 'Jeton expiré, synchronisation complète nécessaire.'},
+                status=status.HTTP_410_GONE,
             )
-        except Exception as e:
-            print(f"Erreur envoi email : {e}")
+        paginator = SyncPagination()
+        context = self.get_serializer_context()
+        if request.query_params.get(paginator.cursor_query_param):
+            # Page suivante : catégories et suppressions ont été envoyées avec la première
+            tasks = delta_sync.changed_tasks(request.user, since)
+            categories, deleted = [], {'tasks': [], 'categories': []}
+        else:
+            changes = delta_sync.changes_since(request.user, since)
+            tasks, sync_token = changes.tasks, changes.token
+            categories = CategorySerializer(changes.categories, many=True, context=context).data
+            deleted = changes.deleted
+        page = paginator.paginate_queryset(tasks, request, self)
+        next_link = paginator.get_next_link()
+        return Response({
+            'tasks': TaskSerializer(page, many=True, context=context).data,
+            'categories': categories,
+            'deleted': deleted,
+            'next': next_link and replace_query_param(next_link, 'token', sync_token),
+            'token': None if next_link else sync_token,
+        })
+
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
+        """
+        Export en flux de toutes les tâches de l'utilisateur, en NDJSON (par défaut)
+        ou en CSV (`?output=csv`), avec les mêmes paramètres de recherche et de tri
+        que la liste. La mémoire utilisée ne dépend pas du nombre de tâches.
+        """
+        export_format = request.query_params.get('output', 'ndjson')
+        if export_format not in task_export.FORMATS:
+            raise ValidationError({'output': [f"Format inconnu (valeurs possibles : {', '.join(task_export.FORMATS)})."]})
+        queryset = self.paginator.order_queryset(self.filter_queryset(self.get_queryset()), request, self)
+        content_type, filename = task_export.FORMATS[export_format]
+        response = StreamingHttpResponse(
+            task_export.stream(export_format, queryset),
+            content_type=content_type,
+        )
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+    def _bulk_items(self, data):
+        if not isinstance(data, list) or not data:
+            raise ValidationError({'non_field_errors': ['Une liste non vide de tâches est attendue.']})
+        if len(data) > settings.TASK_BULK_MAX_ITEMS:
+            raise ValidationError({'non_field_errors': [f'Au plus {settings.TASK_BULK_MAX_ITEMS} tâches par requête.']})
+        return data
+
+    @staticmethod
+    def _category_id(value):
+        # Identifiant entier ou chaîne ("5"), comme l'accepte UserCategoryField
+        if isinstance(value, bool):
+            return None
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    def _bulk_context(self, items):
+        # Catégories du lot chargées en une requête au lieu d'une par tâche
+        category_ids = {self._category_id(item.get('category')) for item in items if isinstance(item, dict)} - {None}
+        categories = Category.objects.filter(user=self.request.user).in_bulk(category_ids)
+        return {**self.get_serializer_context(), 'categories': categories}
+
+    def _bulk_create(self, request):
+        items = self._bulk_items(request.data)
+        serializer = self.get_serializer(data=items, many=True, context=self._bulk_context(items))
+        serializer.is_valid(raise_exception=True)
+        tasks = Task.objects.bulk_create(
+            [Task(user=request.user, **data) for data in serializer.validated_data]
+        )
+        after_bulk_write(request.user.id, saved=tasks, created=True)
+        notify_tasks_bulk_changed('créées', len(tasks), request.user.email)
+        return Response(self.get_serializer(tasks, many=True).data, status=status.HTTP_201_CREATED)
+
+    def _bulk_update(self, request):
+        items = self._bulk_items(request.data)
+        ids = [item.get('id') if isinstance(item, dict) else None for item in items]
+        if not all(isinstance(task_id, int) for task_id in ids):
+            raise ValidationError({'id': ['Chaque élément doit contenir un identifiant "id" entier.']})
+        tasks = self.get_queryset().in_bulk(ids)
+        missing = sorted(set(ids) - set(tasks))
+        if missing:
+            raise ValidationError({'id': [f'Tâches introuvables : {missing}']})
+
+        context = self._bulk_context(items)
+        validated, errors = [], []
+        for item in items:
+            serializer = self.get_serializer(tasks[item['id']], data=item, partial=True, context=context)
+            errors.append({} if serializer.is_valid() else serializer.errors)
+            validated.append(serializer.validated_data if not errors[-1] else None)
+        if any(errors):
+            raise ValidationError(errors)
+
+        now = timezone.now()
+        fields = {'updated_at'}
+        for item, data in zip(items, validated, strict=True):
+            task = tasks[item['id']]
+            if 'due_date' in data and data['due_date'] != task.due_date:
+                task.is_reminded = False
+                fields.add('is_reminded')
+            for name, value in data.items():
+                setattr(task, name, value)
+            fields.update(data)
+            task.updated_at = now
+        updated = [tasks[task_id] for task_id in dict.fromkeys(ids)]
+        Task.objects.bulk_update(updated, sorted(fields), batch_size=500)
+        after_bulk_write(request.user.id, saved=updated)
+        notify_tasks_bulk_changed('modifiées', len(updated), request.user.email)
+        return Response(self.get_serializer(updated, many=True).data)
+
+    def _bulk_destroy(self, request):
+        ids = request.data.get('ids') if isinstance(request.data, dict) else None
+        if not isinstance(ids, list) or not ids or not all(isinstance(task_id, int) for task_id in ids):
+            raise ValidationError({'ids': ['Une liste non vide d\'identifiants est attendue.']})
+        if len(ids) > settings.TASK_BULK_MAX_ITEMS:
+            raise ValidationError({'ids': [f'Au plus {settings.TASK_BULK_MAX_ITEMS} tâches par requête.']})
+        # Seuls les champs des statistiques : leur différence est retirée de TaskStats
+        deleted = list(
+            self.get_queryset().filter(id__in=ids)
+            .only('id', 'user_id', 'is_completed', 'priority', 'category_id', 'due_date')
+        )
+        with bulk_writes():
+            Task.objects.filter(id__in=[task.pk for task in deleted]).delete()
+        after_bulk_write(request.user.id, deleted=deleted)
+        if deleted:
+            notify_tasks_bulk_changed('supprimées', len(deleted), request.user.email)
+        return Response({'deleted': len(deleted)})
 
 # Vue pour gérer le dashboard des tâches (list + CRUD via POST)
 def task_dashboard(request):
@@ -84,7 +242,7 @@ def task_dashboard(request):
             category_id = request.POST.get('category', None)
             if not title:
                 return JsonResponse({'success': False, 'errors': {'title': ['Ce champ est requis.']}}, status=400)
-            due_date = datetime.strptime(due_date_str, '%Y-%m-%dT%H:%M') if due_date_str else None
+            due_date = timezone.make_aware(datetime.strptime(due_date_str, '%Y-%m-%dT%H:%M')) if due_date_str else None
             category = get_object_or_404(Category, id=category_id, user=request.user) if category_id else None
             task = Task.objects.create(
                 user=request.user,
@@ -92,25 +250,11 @@ def task_dashboard(request):
                 description=description,
                 due_date=due_date,
                 category=category,
-                priority='medium'  # Default, adapter si besoin
+                priority=Task.Priority.MEDIUM  # Default, adapter si besoin
             )
-            from gestion_taches.tasks.tasks import send_reminder
-            if task.due_date:
-                send_reminder.delay(task.id)
-            
-            # Ajout : Envoyer notification email pour création
-            try:
-                send_mail(
-                    'Tâche créée avec succès',
-                    f'Votre tâche "{task.title}" a été créée. Description : {task.description[:50]}... Date d\'échéance : {task.due_date if task.due_date else "Aucune"}.',
-                    'votre_email_expéditeur@example.com',  # Remplacez par votre email from
-                    [request.user.email],  # Email de l'utilisateur connecté
-                    fail_silently=False,
-                )
-            except Exception as e:
-                # Gérer l'erreur silencieusement ou logger
-                print(f"Erreur envoi email : {e}")
-            
+            # Le rappel est planifié via l'index Redis (voir signals.py)
+            notify_task_created(task, request.user.email)
+
             return JsonResponse({'success': True, 'message': 'Tâche créée avec succès'})
         
         elif action == 'edit':
@@ -121,7 +265,7 @@ def task_dashboard(request):
             category_id = request.POST.get('category', None)
             if not task_id or not title:
                 return JsonResponse({'success': False, 'message': 'Données invalides'}, status=400)
-            due_date = datetime.strptime(due_date_str, '%Y-%m-%dT%H:%M') if due_date_str else None
+            due_date = timezone.make_aware(datetime.strptime(due_date_str, '%Y-%m-%dT%H:%M')) if due_date_str else None
             category = get_object_or_404(Category, id=category_id, user=request.user) if category_id else None
             task = get_object_or_404(Task, id=task_id, user=request.user)
             old_due_date = task.due_date
@@ -134,18 +278,8 @@ def task_dashboard(request):
                 task.is_reminded = False
                 task.save()
             
-            # Ajout : Envoyer notification email pour modification
-            try:
-                send_mail(
-                    'Tâche modifiée avec succès',
-                    f'Votre tâche "{task.title}" a été modifiée. Description : {task.description[:50]}... Date d\'échéance : {task.due_date if task.due_date else "Aucune"}.',
-                    'votre_email_expéditeur@example.com',  # Remplacez par votre email from
-                    [request.user.email],
-                    fail_silently=False,
-                )
-            except Exception as e:
-                print(f"Erreur envoi email : {e}")
-            
+            notify_task_updated(task, request.user.email)
+
             return JsonResponse({'success': True, 'message': 'Tâche modifiée avec succès'})
         
         elif action == 'delete':
@@ -155,32 +289,40 @@ def task_dashboard(request):
             task = get_object_or_404(Task, id=task_id, user=request.user)
             title = task.title  # Nouveau : sauvegarde pour email
             task.delete()
-            # Nouveau : Envoyer notification email pour suppression
-            try:
-                send_mail(
-                    'Tâche supprimée',
-                    f'Votre tâche "{title}" a été supprimée.',
-                    'votre_email_expéditeur@example.com',
-                    [request.user.email],
-                    fail_silently=False,
-                    )
-            except Exception as e:
-                print(f"Erreur envoi email : {e}")
-                
+            notify_task_deleted(title, request.user.email)
+
             return JsonResponse({'success': True, 'message': 'Tâche supprimée avec succès'})
         
         return JsonResponse({'success': False, 'message': 'Action invalide'}, status=400)
     
-    # GET: Liste des tâches
-    tasks = Task.objects.filter(user=request.user).order_by('-created_at')
-    tasks_json = json.dumps(
-        list(tasks.values('id', 'title', 'description', 'due_date', 'category__name', 'created_at')),
-        cls=DjangoJSONEncoder
-    )   
-
+    # GET: coquille de la page avec la première page de tâches seulement ; la suite
+    # est chargée à la demande par le JavaScript depuis TaskDashboardDataView
+    task_page = TaskDashboardDataView.first_page(request)
     categories = Category.objects.filter(user=request.user)
     return render(request, 'dashboard/pages/task/task.html', {
-        'tasks': tasks,
-        'tasks_json': tasks_json,
+        'tasks': task_page['results'],
+        'task_page': task_page,
         'categories': categories,
-    })
\ No newline at end of file
+    })
+
+
+# Vue JSON paginée des lignes du tableau des tâches (défilement du tableau de bord)
+class TaskDashboardDataView(DashboardDataMixin, generics.ListAPIView):
+    url_name = 'tasks:task_data'
+    row_fields = (
+        'id', 'title', 'description', 'due_date', 'category', 'category_name',
+        'priority', 'is_completed', 'created_at',
+    )
+    permission_classes = [IsAuthenticated]
+    pagination_class = KeysetCursorPagination
+    filter_backends = [TaskFilter, FullTextSearchFilter, filters.OrderingFilter]
+    ordering_fields = ['due_date', 'created_at', 'priority']
+
+    def get_queryset(self):
+        queryset = Task.objects.filter(user=self.request.user)
+        return queryset.annotate(category_name=F('category__name')).values(*self.row_fields)
+
+    def format_rows(self, rows):
+        # Priorité exposée par son code, comme dans l'API ; copies, car la pagination
+        # lit encore la valeur entière des lignes pour construire le curseur
+        return [{**row, 'priority': Task.Priority(row['priority']).code} for row in rows]